@@ -1,9 +1,73 @@
-from typing import Generator
+import hashlib
+from typing import Any, AsyncGenerator, Callable, Generator, TypeVar
+from fastapi import Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from db.session import get_db as _get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import DB_MODE, get_db as _get_db, get_async_db as _get_async_db
 
-def get_db() -> Generator[Session, None, None]:
+T = TypeVar("T")
+
+# 엔드포인트에서 받는 DB 세션 타입 (DB_MODE에 따라 Session 또는 AsyncSession)
+DBSession = Session | AsyncSession
+
+if DB_MODE == "async":
+	async def get_db() -> AsyncGenerator[AsyncSession, None]:
+		"""
+		프로젝트의 DB 세션 의존성을 재노출 (비동기 모드)
+		"""
+		async for db in _get_async_db():
+			yield db
+else:
+	def get_db() -> Generator[Session, None, None]:
+		"""
+		프로젝트의 DB 세션 의존성을 재노출
+		"""
+		yield from _get_db()
+
+
+async def run_db(db: DBSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+	"""
+	CRUD 함수(fn(db, ...))를 이벤트 루프를 막지 않고 실행
+
+	- AsyncSession: run_sync로 실행. 동기 CRUD 코드가 greenlet 위에서 asyncpg로 그대로 동작하므로
+	  DB 대기 중에 스레드를 점유하지 않는다. (SET ROLE leader 블록 등 커넥션 단위 코드 포함)
+	- Session: 기존과 같이 스레드풀에서 실행
+	"""
+	if isinstance(db, AsyncSession):
+		return await db.run_sync(lambda sync_db: fn(sync_db, *args, **kwargs))
+	return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+def make_etag(*parts: Any) -> str:
+	"""
+	버전 값과 요청 파라미터로 강한 ETag 생성 (같은 입력이면 같은 값)
+	"""
+	digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+	return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+	"""
+	If-None-Match 헤더에 etag가 있는지 확인 (약한 비교: W/ 접두어 무시, * 는 항상 일치)
+	"""
+	header = request.headers.get("if-none-match")
+	if not header:
+		return False
+	tags = [tag.strip() for tag in header.split(",")]
+	return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def not_modified(etag: str) -> Response:
+	"""
+	본문 없는 304 응답
+	"""
+	return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def set_etag(response: Response, etag: str) -> None:
 	"""
-    프로젝트의 DB 세션 의존성을 재노출
+	200 응답에 ETag 설정. no-cache: 클라이언트는 저장하되 매번 If-None-Match로 재검증한다.
 	"""
-	yield from _get_db()
+	response.headers["ETag"] = etag
+	response.headers["Cache-Control"] = "no-cache"
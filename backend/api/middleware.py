@@ -0,0 +1,43 @@
+"""
+요청 단위 미들웨어 (순수 ASGI)
+
+- MetricsMiddleware: 요청 지연 시간/처리 중 요청 수와, 요청 동안 실행된 SQL 통계(db/metrics.py)를
+  라우트 템플릿 라벨로 기록한다. METRICS_ENABLED=1 일 때만 main.py에서 등록된다.
+"""
+import time
+from db.metrics import end_request, http_requests_in_flight, start_request
+
+
+def route_label(scope) -> str:
+    """
+    매칭된 라우트 템플릿 (예: /projects/{project_id}), 매칭되지 않았으면 "unmatched"
+    경로 파라미터 값을 라벨로 쓰면 라벨 수가 끝없이 늘어나므로 템플릿을 사용한다.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats, token = start_request()
+        http_requests_in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            end_request(token, stats, route_label(scope), scope["method"], status_code, time.perf_counter() - started_at)
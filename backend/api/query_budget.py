@@ -0,0 +1,100 @@
+"""
+엔드포인트별 SQL 문 수 예산 (N+1 회귀 방지)
+
+- QUERY_BUDGETS: (메서드, 라우트 템플릿) -> 요청 한 번에 허용하는 최대 왕복 수
+  record_statements() 기준이므로 BEGIN/COMMIT/ROLLBACK도 한 번씩 센다.
+  예산은 결과 건수와 무관한 상수여야 한다. (행마다 쿼리하는 코드가 다시 들어오면 넘치도록)
+  값은 bench/query_budget.py로 잰 현재 문장 수이며, 쿼리를 줄이거나 늘리는 변경은 예산도 함께 고친다.
+  (text("COMMIT")으로 직접 커밋하는 CRUD는 세션 정리 시 ROLLBACK 한 번이 더 기록된다.)
+- QUERY_BUDGET_MODE (기본 off)
+    off: 기록하지 않음 (미들웨어도 등록되지 않음)
+    warn: 예산을 넘으면 경고 로그
+    strict: 예산을 넘으면 에러 로그 + 응답 헤더 X-Query-Budget-Exceeded
+  warn/strict에서는 모든 응답에 X-Query-Count 헤더를 붙이고, 최근 요청 기록을 query_budget_log에 남긴다.
+- 전체 라우터를 호출해 예산과 결과 크기에 따른 증가 여부를 검사하는 스크립트: bench/query_budget.py
+"""
+import logging
+import os
+from collections import deque
+from dotenv import load_dotenv
+from api.middleware import route_label
+from db.session import record_statements
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", "off").lower()
+
+QUERY_BUDGETS: dict[tuple[str, str], int] = {
+    # auth
+    ("POST", "/auth/signup"): 5,
+    ("POST", "/auth/login"): 3,
+    # profile
+    ("GET", "/profile/info/{uid}"): 5,
+    ("PUT", "/profile/update/{uid}"): 6,
+    # projects
+    ("POST", "/projects/new"): 5,
+    ("GET", "/projects/list"): 4,
+    ("GET", "/projects/me"): 4,
+    # 추천: 평소 4 + 변경 표시된 프로젝트 다시 읽기 1 + 다른 워커 변경 확인 1 (crud/recommender.py)
+    ("GET", "/projects/recommended"): 6,
+    ("GET", "/projects/{project_id}"): 4,
+    ("PUT", "/projects/{project_id}/status"): 5,
+    ("DELETE", "/projects/{project_id}"): 7,
+    ("POST", "/projects/{project_id}/reviews"): 6,
+    ("GET", "/projects/{project_id}/reviews/status"): 6,
+    # applications
+    ("POST", "/projects/{project_id}/apply"): 3,
+    ("GET", "/applications/me"): 4,
+    # order=score는 점수 계산용 조회가 1회 더 (crud_applications.get_applications_by_project)
+    ("GET", "/projects/{project_id}/applications"): 7,
+    ("PUT", "/projects/{project_id}/applications/{applicant_id}/status"): 5,
+    # 프로젝트 행 잠금과 남은 자리 조회를 나눠 1회 더 (crud_applications.accept_applications)
+    ("POST", "/projects/{project_id}/applications/accept"): 6,
+    # 호출자가 리더인 프로젝트 조회 1회 포함 (crud/team_formation.get_team_formation_for_leader)
+    ("GET", "/applications/team-formation"): 6,
+    # system
+    ("GET", "/system/cache"): 0,
+    ("GET", "/system/hashing"): 0,
+    ("GET", "/system/pool"): 0,
+    ("GET", "/metrics"): 0,
+}
+
+# 최근 요청 기록: (메서드, 라우트, 상태 코드, 문장 수, 예산, SQL 문 목록)
+query_budget_log: deque = deque(maxlen=1000)
+
+logger = logging.getLogger("query_budget")
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, app, mode: str = QUERY_BUDGET_MODE):
+        self.app = app
+        self.mode = mode
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        with record_statements() as statements:
+            async def send_wrapper(message):
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    # 응답 시작 시점까지의 문장 수 (세션 정리 ROLLBACK 등은 뒤에 기록될 수 있음)
+                    status_code = message["status"]
+                    budget = QUERY_BUDGETS.get((scope["method"], route_label(scope)))
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-query-count", str(len(statements)).encode()))
+                    if self.mode == "strict" and budget is not None and len(statements) > budget:
+                        headers.append((b"x-query-budget-exceeded", str(budget).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        route = route_label(scope)
+        budget = QUERY_BUDGETS.get((scope["method"], route))
+        query_budget_log.append((scope["method"], route, status_code, len(statements), budget, list(statements)))
+        if budget is not None and len(statements) > budget:
+            log = logger.error if self.mode == "strict" else logger.warning
+            log("query budget exceeded: %s %s issued %d statements (budget %d)", scope["method"], route, len(statements), budget)
@@ -0,0 +1,94 @@
+"""
+목록 응답의 빠른 직렬화 경로
+
+기존 경로는 행마다 ProjectListItem(**p)을 만들고, FastAPI가 같은 데이터를 response_model로 한 번 더
+검증한 뒤 표준 json으로 인코딩한다. DB에서 나온 값은 이미 스키마와 같은 타입이므로
+FAST_SERIALIZATION=1(기본값)이면 행을 응답 모양의 dict로 바로 만들고 Response를 직접 반환해 두 번의 검증을 건너뛴다.
+
+- orjson(requirements.txt)으로 인코딩하고, 설치되지 않은 환경에서는 표준 json으로 대신한다. (출력 JSON은 기존 경로와 같음)
+- response_model은 OpenAPI 문서용으로 그대로 둔다.
+"""
+import json
+import os
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from dotenv import load_dotenv
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # requirements.txt 없이 설치된 환경용 대체 경로
+    orjson = None
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "1") == "1"
+JSON_ENCODER = "orjson" if orjson is not None else "json"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    JSON 인코딩 (orjson이 없으면 표준 json, Starlette JSONResponse와 같은 옵션)
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    검증 없이 바로 인코딩하는 JSON 응답
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def project_list_rows(projects: list[dict]) -> list[dict]:
+    """
+    get_all_projects 결과를 ProjectListItem 모양의 dict 목록으로 변환
+    """
+    return [
+        {
+            "project_id": p["project_id"],
+            "leader_id": p["leader_id"],
+            "topic": p["topic"],
+            "description1": p["description1"],
+            "capacity": p["capacity"],
+            "members_count": p["members_count"],
+            "deadline": p["deadline"],
+            "status": p["status"],
+            "leader_name": p["leader_name"],
+            "skills": p["skills"],
+            "search_rank": float(p["search_rank"]) if p["search_rank"] is not None else None,
+        }
+        for p in projects
+    ]
+
+
+def my_project_list_rows(projects: list[dict]) -> list[dict]:
+    """
+    get_my_projects 결과를 MyProjectListItem 모양의 dict 목록으로 변환
+    """
+    return [
+        {
+            "project_id": p["project_id"],
+            "leader_id": p["leader_id"],
+            "title": p["title"],
+            "status": p["status"],
+            "members_count": p["members_count"],
+            "capacity": p["capacity"],
+            "deadline": p["deadline"],
+        }
+        for p in projects
+    ]
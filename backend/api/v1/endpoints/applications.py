@@ -1,19 +1,20 @@
-from fastapi import APIRouter, status, HTTPException, Depends
-from schemas.schemas import ApplicationRequest, MessageResponse, MyApplicationsResponse, ApplicationsManagementResponse, ApplicationStatusUpdateRequest
-from sqlalchemy.orm import Session
-from api.deps import get_db
-from crud.crud_applications import apply_to_project, get_applications_by_applicant, get_applications_by_project, update_application_status
+from fastapi import APIRouter, status, HTTPException, Depends, Query, Request, Response
+from schemas.schemas import ApplicationRequest, MessageResponse, MyApplicationsResponse, ApplicationsManagementResponse, ApplicationStatusUpdateRequest, ReviewsMode, ApplicantOrder, ApplicationsAcceptRequest, TeamFormationResponse
+from api.deps import get_db, run_db, DBSession, make_etag, etag_matches, not_modified, set_etag
+from crud.crud_applications import apply_to_project, get_applications_by_applicant, get_applications_by_project, update_application_status, accept_applications
+from crud.team_formation import get_team_formation_for_leader
+from crud.crud_versions import get_entity_versions
 
 router = APIRouter(tags=["applications"])
 
 
 @router.post("/projects/{project_id}/apply", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-def apply_project(project_id: int, req: ApplicationRequest, db: Session = Depends(get_db)) -> MessageResponse:
+async def apply_project(project_id: int, req: ApplicationRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
     """
     프로젝트 지원
     """
     try:
-        apply_to_project(db, project_id, req.applicant_id, req.applicant_date, req.motivation)
+        await run_db(db, apply_to_project, project_id, req.applicant_id, req.applicant_date, req.motivation)
         return MessageResponse(msg="지원이 완료되었습니다.")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -23,23 +24,45 @@ def apply_project(project_id: int, req: ApplicationRequest, db: Session = Depend
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 오류: " + str(e))
 
 @router.get("/applications/me", response_model=MyApplicationsResponse, status_code=status.HTTP_200_OK)
-def get_my_applications(current_user_id: str, db: Session = Depends(get_db)) -> MyApplicationsResponse:
+async def get_my_applications(request: Request, response: Response, current_user_id: str,
+                        limit: int | None = Query(None, ge=1, le=100), after: str | None = None,
+                        db: DBSession = Depends(get_db)) -> MyApplicationsResponse:
     """
-    내 지원 현황 조회
+    내 지원 현황 조회 (limit 지정 시 페이지 단위, ETag 지원)
     """
     try:
-        applications = get_applications_by_applicant(db, current_user_id)
-        return MyApplicationsResponse(applications=applications)
+        version = await run_db(db, get_entity_versions, "applications", "projects", "students")
+        etag = make_etag("applications/me", current_user_id, limit, after, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        applications, next_cursor = await run_db(db, get_applications_by_applicant, current_user_id, limit, after)
+        set_etag(response, etag)
+        return MyApplicationsResponse(applications=applications, next_cursor=next_cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 오류: " + str(e))
 
 @router.get("/projects/{project_id}/applications", response_model=ApplicationsManagementResponse, status_code=status.HTTP_200_OK)
-def get_project_applications(project_id: int, current_user_id: str, db: Session = Depends(get_db)) -> ApplicationsManagementResponse:
+async def get_project_applications(request: Request, response: Response, project_id: int, current_user_id: str,
+                                   reviews: ReviewsMode = ReviewsMode.all, review_limit: int = Query(5, ge=1, le=50),
+                                   order: ApplicantOrder = ApplicantOrder.date, limit: int | None = Query(None, ge=1, le=500),
+                                   db: DBSession = Depends(get_db)) -> ApplicationsManagementResponse:
     """
-    프로젝트에 대한 지원자 목록 조회 (리더 전용)
+    프로젝트에 대한 지원자 목록 조회 (리더 전용, ETag 지원)
+    ETag는 200 응답에만 붙으므로 304는 이 사용자가 이미 같은 목록을 받은 경우에만 나간다.
+    - reviews=all: 지원자별 전체 리뷰 (기본값) / stats: 리뷰 수와 평균 점수만 / recent: 최근 리뷰 review_limit개
+    - order=date: 지원일 최신순 (기본값) / score: 요구 스킬 충족률과 평판 점수로 매긴 순위 점수순
+    - limit: 최대 지원자 수 (order=score면 상위 limit명)
     """
     try:
-        applications = get_applications_by_project(db, project_id, current_user_id)
+        version = await run_db(db, get_entity_versions, "applications", "projects", "students", "reviews")
+        etag = make_etag("projects/applications", project_id, current_user_id, reviews.value, review_limit,
+                         order.value, limit, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        applications = await run_db(db, get_applications_by_project, project_id, current_user_id,
+                                    reviews.value, review_limit, order.value, limit)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except Exception as e:
@@ -48,15 +71,16 @@ def get_project_applications(project_id: int, current_user_id: str, db: Session
     if applications is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 프로젝트를 찾을 수 없습니다.")
 
+    set_etag(response, etag)
     return ApplicationsManagementResponse(applications=applications)
     
 @router.put("/projects/{project_id}/applications/{applicant_id}/status", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-def update_application_status_endpoint(project_id: int, applicant_id: str, req: ApplicationStatusUpdateRequest, db: Session = Depends(get_db)) -> MessageResponse:
+async def update_application_status_endpoint(project_id: int, applicant_id: str, req: ApplicationStatusUpdateRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
     """
     지원 상태 업데이트 (리더 전용)
     """
     try:
-        update_application_status(db, project_id, applicant_id, req.new_status, req.leader_id)
+        await run_db(db, update_application_status, project_id, applicant_id, req.new_status, req.leader_id)
         return MessageResponse(msg="지원 상태가 성공적으로 업데이트되었습니다.")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -64,4 +88,40 @@ def update_application_status_endpoint(project_id: int, applicant_id: str, req:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 오류: " + str(e))
-    
\ No newline at end of file
+    
+
+@router.get("/applications/team-formation", response_model=TeamFormationResponse, status_code=status.HTTP_200_OK)
+async def get_team_formation(current_user_id: str, project_id: int | None = None, db: DBSession = Depends(get_db)) -> TeamFormationResponse:
+    """
+    팀 구성 제안 (대기 중인 지원 전체를 남은 자리와 요구 스킬 기준으로 한 번에 배정, crud/team_formation.py)
+
+    학생은 최대 한 프로젝트에 배정되며, 리더는 제안을 확인한 뒤 /projects/{project_id}/applications/accept로 일괄 수락한다.
+    - current_user_id가 리더인 프로젝트의 배정만 반환 (요약은 전체 기준, 전체 배정은 CLI 전용)
+    - project_id: 해당 프로젝트의 배정만 반환 (리더 전용)
+    """
+    try:
+        version = await run_db(db, get_entity_versions, "applications", "projects", "students")
+        proposal = await run_db(db, get_team_formation_for_leader, current_user_id, project_id, version)
+    except PermissionError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 오류: " + str(e))
+
+    if proposal is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 프로젝트를 찾을 수 없습니다.")
+    return TeamFormationResponse(**proposal)
+
+@router.post("/projects/{project_id}/applications/accept", response_model=MessageResponse, status_code=status.HTTP_200_OK)
+async def accept_applications_endpoint(project_id: int, req: ApplicationsAcceptRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
+    """
+    대기 중인 지원 일괄 수락 (리더 전용, 한 트랜잭션: 하나라도 수락할 수 없으면 아무것도 바뀌지 않음)
+    """
+    try:
+        accepted = await run_db(db, accept_applications, project_id, req.leader_id, req.applicant_ids)
+        return MessageResponse(msg=f"{accepted}명의 지원이 수락되었습니다.")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 오류: " + str(e))
@@ -1,37 +1,45 @@
 from fastapi import APIRouter, status, HTTPException, Depends
 from schemas.schemas import SignupRequest, MessageResponse, LoginRequest, LoginResponse
-from sqlalchemy.orm import Session
-from api.deps import get_db
-from crud.crud_auth import student_exists, create_student, login_student
-from db.utils import hash_password, verify_password
+from api.deps import get_db, run_db, DBSession
+from crud.crud_auth import student_exists, create_student, get_student_credentials, update_password_hash
+from db.utils import hash_password_async, verify_password_async, needs_rehash
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/signup", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-def signup(req: SignupRequest, db: Session = Depends(get_db)) -> MessageResponse:
+async def signup(req: SignupRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
     """
     회원가입
     """
-    if student_exists(db, req.uid):
+    if await run_db(db, student_exists, req.uid):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 존재하는 아이디입니다.")
-    hashed = hash_password(req.password)
-    create_student(db, req.uid, req.name, hashed)
+    # bcrypt 해싱은 CPU 작업이므로 전용 해싱 실행기에서 수행
+    hashed = await hash_password_async(req.password)
+    await run_db(db, create_student, req.uid, req.name, hashed)
     return MessageResponse(msg="회원가입 성공")
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
-def login(req: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
+async def login(req: LoginRequest, db: DBSession = Depends(get_db)) -> LoginResponse:
     """
     로그인
     """
-    result = login_student(db, req.uid, req.password, verify_password)
-    if not result:
+    student = await run_db(db, get_student_credentials, req.uid)
+    if not student or not await verify_password_async(req.password, student["hashed_password"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
-    uid, name, email, profile_text, website_link = result
+
+    # bcrypt cost가 바뀌었으면 평문 비밀번호를 알고 있는 지금 새 cost로 재해싱
+    if needs_rehash(student["hashed_password"]):
+        try:
+            new_hash = await hash_password_async(req.password)
+            await run_db(db, update_password_hash, req.uid, new_hash)
+        except Exception as e:
+            print(f"[경고] 비밀번호 재해싱 실패 ({req.uid}): {e}")
+
     return LoginResponse(
-        msg=f"{name} 님 환영합니다",
-        uid=uid,
-        name=name,
-        email=email,
-        profile_text=profile_text,
-        website_link=website_link
+        msg=f"{student['name']} 님 환영합니다",
+        uid=student["uid"],
+        name=student["name"],
+        email=student["email"],
+        profile_text=student["profile_text"],
+        website_link=student["website_link"]
     )
\ No newline at end of file
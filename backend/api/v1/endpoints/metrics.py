@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from db.metrics import registry
+
+router = APIRouter(tags=["system"])
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics() -> PlainTextResponse:
+    """
+    Prometheus 텍스트 형식 메트릭 (METRICS_ENABLED=1 일 때만 등록)
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
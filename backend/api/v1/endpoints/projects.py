@@ -1,4 +1,5 @@
-from fastapi import APIRouter, status, HTTPException, Depends
+from datetime import date
+from fastapi import APIRouter, status, HTTPException, Depends, Query, Request, Response
 from schemas.schemas import (
     ProjectCreateRequest,
     MessageResponse,
@@ -8,13 +9,15 @@ from schemas.schemas import (
     ProjectDetailsResponse,
     MyProjectListItem,
     MyProjectListResponse,
+    RecommendedProjectItem,
+    RecommendedProjectsResponse,
     ProjectStatusUpdateRequest,
     ProjectDeleteRequest,
     ReviewCreateRequest,
     ReviewStatusResponse,
 )
-from sqlalchemy.orm import Session
-from api.deps import get_db
+from api.deps import get_db, run_db, DBSession, make_etag, etag_matches, not_modified, set_etag
+from api.responses import FAST_SERIALIZATION, FastJSONResponse, project_list_rows, my_project_list_rows
 from crud.crud_projects import (
     create_project_with_skills,
     get_all_projects,
@@ -25,70 +28,128 @@ from crud.crud_projects import (
     create_peer_review,
     get_review_completion_status,
 )
+from crud.recommender import get_recommended_projects
+from crud.crud_versions import get_entity_versions, get_project_version
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 @router.post("/new", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-def create_project(req: ProjectCreateRequest, db: Session = Depends(get_db)) -> MessageResponse:
+async def create_project(req: ProjectCreateRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
     """
     프로젝트 생성
     """
     try:
-        create_project_with_skills(
-            db, req.leader_id, req.topic, req.description1, req.description2, req.capacity, req.deadline, req.skills
+        await run_db(
+            db, create_project_with_skills,
+            req.leader_id, req.topic, req.description1, req.description2, req.capacity, req.deadline, req.skills,
         )
         return MessageResponse(msg="프로젝트가 성공적으로 생성되었습니다.")
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/list", response_model=ProjectListResponse, status_code=status.HTTP_200_OK)
-def get_projects(req: ProjectListRequest = Depends(), db: Session = Depends(get_db)) -> ProjectListResponse:
+async def get_projects(request: Request, response: Response, req: ProjectListRequest = Depends(),
+                       db: DBSession = Depends(get_db)) -> ProjectListResponse:
     """
     프로젝트 목록 조회 (View 기반 상태별 필터링)
     
-    - orderBy: 정렬 기준 (deadline/capacity)
+    - orderBy: 정렬 기준 (deadline/capacity/relevance)
     - groupBy: 상태별 필터링 (All/Recruiting/In_Progress/Completed)
     - search: 검색어 (string, optional)
+    - searchMode: 검색 방식 (contains/fulltext/prefix)
+    - limit/after: 페이지 크기와 이전 응답의 next_cursor (optional)
+
+    ETag/If-None-Match 지원: 관련 테이블이 바뀌지 않았으면 목록을 만들지 않고 304 반환
+    (마감일 필터가 CURRENT_DATE 기준이므로 날짜도 ETag에 포함)
+    FAST_SERIALIZATION=1이면 Pydantic 검증 없이 바로 인코딩 (api/responses.py)
     """
     try:
-        projects = get_all_projects(db, req.orderBy.value, req.groupBy.value, req.search)
+        # 지원서는 멤버 수에만 반영되고, 수락된 멤버가 바뀌면 트리거가 'projects' 버전을 올린다
+        version = await run_db(db, get_entity_versions, "projects", "students")
+        etag = make_etag("projects/list", req.orderBy.value, req.groupBy.value, req.search, req.searchMode.value,
+                         req.limit, req.after, date.today(), version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        projects, next_cursor = await run_db(
+            db, get_all_projects,
+            req.orderBy.value, req.groupBy.value, req.search, req.limit, req.after, req.searchMode.value,
+            version=version,
+        )
+        if FAST_SERIALIZATION:
+            fast_response = FastJSONResponse({"projects": project_list_rows(projects), "next_cursor": next_cursor})
+            set_etag(fast_response, etag)
+            return fast_response
         items = [ProjectListItem(**p) for p in projects]
-        return ProjectListResponse(projects=items)
+        set_etag(response, etag)
+        return ProjectListResponse(projects=items, next_cursor=next_cursor)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/me", response_model=MyProjectListResponse, status_code=status.HTTP_200_OK)
-def get_mine(current_user_id: str, db: Session = Depends(get_db)) -> MyProjectListResponse:
+async def get_mine(request: Request, response: Response, current_user_id: str,
+             limit: int | None = Query(None, ge=1, le=100), after: str | None = None,
+             db: DBSession = Depends(get_db)) -> MyProjectListResponse:
     """
     내 프로젝트 목록 조회
 
-    자신이 리더, 멤버인 프로젝트들 모두 반환
+    자신이 리더, 멤버인 프로젝트들 반환 (limit 지정 시 페이지 단위, ETag 지원, FAST_SERIALIZATION 적용)
     """
     try:
-        results = get_my_projects(db, current_user_id)
+        version = await run_db(db, get_entity_versions, "projects")
+        etag = make_etag("projects/me", current_user_id, limit, after, date.today(), version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        results, next_cursor = await run_db(db, get_my_projects, current_user_id, limit, after)
+        if FAST_SERIALIZATION:
+            fast_response = FastJSONResponse({"projects": my_project_list_rows(results), "next_cursor": next_cursor})
+            set_etag(fast_response, etag)
+            return fast_response
         items = [MyProjectListItem(**p) for p in results]
-        return MyProjectListResponse(projects=items)
+        set_etag(response, etag)
+        return MyProjectListResponse(projects=items, next_cursor=next_cursor)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+@router.get("/recommended", response_model=RecommendedProjectsResponse, status_code=status.HTTP_200_OK)
+async def get_recommended(current_user_id: str, limit: int = Query(20, ge=1, le=100),
+                          db: DBSession = Depends(get_db)) -> RecommendedProjectsResponse:
+    """
+    추천 프로젝트 목록
+
+    내 스킬과 요구 스킬이 많이 겹치는 모집 중인 프로젝트를 점수(코사인 유사도) 순으로 limit개 반환
+    (내가 리더이거나 이미 지원한 프로젝트 제외, 점수 계산은 메모리 인덱스: crud/recommender.py)
+    """
+    results = await run_db(db, get_recommended_projects, current_user_id, limit)
+    if results is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 학생을 찾을 수 없습니다.")
+    return RecommendedProjectsResponse(projects=[RecommendedProjectItem(**p) for p in results])
+
 @router.get("/{project_id}", response_model=ProjectDetailsResponse, status_code=status.HTTP_200_OK)
-def get_details(project_id: int, applicant_id: str = None, db: Session = Depends(get_db)) -> ProjectDetailsResponse:
+async def get_details(request: Request, response: Response, project_id: int, applicant_id: str = None,
+                      db: DBSession = Depends(get_db)) -> ProjectDetailsResponse:
     """
-    프로젝트 상세 정보 조회
+    프로젝트 상세 정보 조회 (ETag 지원: 프로젝트와 멤버의 row_version 기준)
     """
-    result = get_project_details(db, project_id, applicant_id)
+    version = await run_db(db, get_project_version, project_id)
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 프로젝트를 찾을 수 없습니다.")
+    etag = make_etag("projects/detail", project_id, applicant_id, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    result = await run_db(db, get_project_details, project_id, applicant_id, version=version)
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 프로젝트를 찾을 수 없습니다.")
+    set_etag(response, etag)
     return ProjectDetailsResponse(**result)
 
 
 @router.put("/{project_id}/status", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-def put_project_status(project_id: int, req: ProjectStatusUpdateRequest, db: Session = Depends(get_db)) -> MessageResponse:
+async def put_project_status(project_id: int, req: ProjectStatusUpdateRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
     """
     프로젝트 상태를 리더가 변경합니다.
     """
     try:
-        updated = update_project_status(db, project_id, req.leader_id, req.new_status)
+        updated = await run_db(db, update_project_status, project_id, req.leader_id, req.new_status)
         if not updated:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 프로젝트를 찾을 수 없습니다.")
         return MessageResponse(msg="프로젝트 상태가 업데이트되었습니다.")
@@ -99,12 +160,12 @@ def put_project_status(project_id: int, req: ProjectStatusUpdateRequest, db: Ses
 
 
 @router.delete("/{project_id}", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-def delete_project_endpoint(project_id: int, req: ProjectDeleteRequest, db: Session = Depends(get_db)) -> MessageResponse:
+async def delete_project_endpoint(project_id: int, req: ProjectDeleteRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
     """
     프로젝트 삭제 (지원자를 아무도 승인하지 않았을 때, 리더만 가능).
     """
     try:
-        deleted = delete_project(db, project_id, req.leader_id)
+        deleted = await run_db(db, delete_project, project_id, req.leader_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 프로젝트를 찾을 수 없습니다.")
         return MessageResponse(msg="프로젝트가 삭제되었습니다.")
@@ -114,23 +175,29 @@ def delete_project_endpoint(project_id: int, req: ProjectDeleteRequest, db: Sess
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/{project_id}/reviews", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-def create_project_review(project_id: int, req: ReviewCreateRequest, db: Session = Depends(get_db)) -> MessageResponse:
+async def create_project_review(project_id: int, req: ReviewCreateRequest, db: DBSession = Depends(get_db)) -> MessageResponse:
     """
     프로젝트 리뷰 작성
     """
     try:
-        create_peer_review(db, project_id, req.reviewer_id, req.reviewee_id, req.score, req.comment)
+        await run_db(db, create_peer_review, project_id, req.reviewer_id, req.reviewee_id, req.score, req.comment)
         return MessageResponse(msg="프로젝트 리뷰가 성공적으로 작성되었습니다.")
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
 @router.get("/{project_id}/reviews/status", response_model=ReviewStatusResponse, status_code=status.HTTP_200_OK)
-def get_review_status(project_id: int, reviewer_id: str, db: Session = Depends(get_db)) -> dict:
+async def get_review_status(request: Request, response: Response, project_id: int, reviewer_id: str,
+                            db: DBSession = Depends(get_db)) -> dict:
     """
-    프로젝트 리뷰 작성 상태 조회
+    프로젝트 리뷰 작성 상태 조회 (ETag 지원)
     """
     try:
-        status = get_review_completion_status(db, project_id, reviewer_id)
-        return status
+        version = await run_db(db, get_entity_versions, "projects", "students", "applications", "reviews")
+        etag = make_etag("projects/reviews/status", project_id, reviewer_id, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        review_status = await run_db(db, get_review_completion_status, project_id, reviewer_id)
+        set_etag(response, etag)
+        return review_status
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, status
+from schemas.schemas import CacheStatsResponse, HashingStatsResponse, PoolStatsResponse
+from crud.cache import project_cache
+from db.utils import hash_executor_stats
+from db.session import get_pool_status
+
+router = APIRouter(prefix="/system", tags=["system"])
+
+@router.get("/cache", response_model=CacheStatsResponse, status_code=status.HTTP_200_OK)
+def get_cache_stats() -> CacheStatsResponse:
+    """
+    프로젝트 목록/상세 캐시 상태 조회 (hit/miss 카운터 등)
+    """
+    return CacheStatsResponse(**project_cache.stats())
+
+@router.get("/hashing", response_model=HashingStatsResponse, status_code=status.HTTP_200_OK)
+def get_hashing_stats() -> HashingStatsResponse:
+    """
+    비밀번호 해싱 실행기 상태 조회 (대기열 깊이, 처리 건수 등)
+    """
+    return HashingStatsResponse(**hash_executor_stats())
+
+@router.get("/pool", response_model=PoolStatsResponse, status_code=status.HTTP_200_OK)
+def get_pool_stats() -> PoolStatsResponse:
+    """
+    DB 커넥션 풀 상태 조회 (사용 중/오버플로 커넥션 수, 커넥션 획득 시간 히스토그램)
+    """
+    return PoolStatsResponse(**get_pool_status())
@@ -0,0 +1,183 @@
+"""
+지원자 관리 목록 (GET /projects/{project_id}/applications) 벤치마크
+
+지원자 --applicants명이 각각 리뷰 --reviews개를 받은 프로젝트를 만들어, 지원자 목록 조회 시간(p50/p99)을 비교한다.
+    - legacy: 지원자 행마다 상관 서브쿼리로 스킬/전체 리뷰를 집계하던 이전 ProjectApplicantsView
+      (같은 후처리(dict 변환, 스킬 이름 변환)까지 포함, 리더 확인/SET ROLE 왕복만 빠짐)
+    - all / stats / recent: LATERAL 사전 집계 뷰 + get_applications_by_project의 reviews 모드
+    - score: order=score (순위 점수 상위 --limit명, reviews=recent)
+검사용 데이터(uid bench_app_...)는 관리자 계정으로 커밋해 만들고 끝나면 지운다. 개발/벤치마크 DB에서 실행한다.
+
+실행 (backend 디렉터리에서):
+    python -m bench.applicants_bench
+    python -m bench.applicants_bench --applicants 500 --reviews 100 --repeat 30
+    python -m bench.applicants_bench --applicants 5000 --reviews 10 --limit 20
+"""
+import argparse
+import statistics
+import time
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from db.init_db import admin_database_url
+from db.session import SessionLocal
+from crud.crud_applications import get_applications_by_project
+from crud.crud_skills import skill_dictionary
+
+_PREFIX = "bench_app_"
+
+_LEGACY_SQL = """
+SELECT
+    p.leader_id, a.project_id, a.application_id, a.applicant_id, a.applicant_date,
+    s.name AS applicant_name, s.email AS applicant_email, s.profile_text AS applicant_profile_text,
+    s.website_link AS applicant_website_link, a.motivation AS applicant_motivation, a.status,
+    COALESCE(
+        (SELECT json_agg(json_build_object('score', pr.score, 'comment', pr.comment))
+         FROM Peer_Reviews pr
+         WHERE pr.reviewee_id = a.applicant_id),
+        '[]'::json
+    ) AS applicant_reviews,
+    COALESCE(
+        (SELECT array_agg(ss.skill_id)
+         FROM Student_Skills ss
+         WHERE ss.uid = a.applicant_id),
+        ARRAY[]::integer[]
+    ) AS applicant_skill_ids
+FROM Applications a
+JOIN Projects p ON a.project_id = p.project_id
+JOIN Students s ON a.applicant_id = s.uid
+WHERE a.project_id = :project_id
+ORDER BY a.applicant_date DESC
+"""
+
+
+def _create_data(conn, applicants: int, reviews: int) -> int:
+    """
+    리더 1명, 리뷰어 1명, 지원자 applicants명, 리뷰용 완료 프로젝트 reviews개, 지원 대상 프로젝트 1개 생성
+    -> 지원 대상 project_id
+    """
+    conn.execute(text(
+        """
+        INSERT INTO Students (uid, name, hashed_password)
+        SELECT :prefix || name, name, 'x'
+        FROM (SELECT 'leader' AS name UNION ALL SELECT 'reviewer'
+              UNION ALL SELECT 'a' || i FROM generate_series(1, :applicants) i) t
+        """
+    ), {"prefix": _PREFIX, "applicants": applicants})
+    conn.execute(text(
+        """
+        INSERT INTO Student_Skills (uid, skill_id)
+        SELECT :prefix || 'a' || i, sk.skill_id
+        FROM generate_series(1, :applicants) i
+        JOIN (SELECT skill_id, row_number() OVER (ORDER BY skill_id) AS n FROM Skills ORDER BY skill_id LIMIT 10) sk
+            ON (i + sk.n) % 2 = 0
+        """
+    ), {"prefix": _PREFIX, "applicants": applicants})
+    conn.execute(text(
+        """
+        INSERT INTO Projects (leader_id, topic, description1, description2, capacity, deadline, status)
+        SELECT :prefix || 'leader', 'bench ' || j, '-', '-', 2, CURRENT_DATE, 'Completed'
+        FROM generate_series(1, :reviews) j
+        """
+    ), {"prefix": _PREFIX, "reviews": reviews})
+    conn.execute(text(
+        """
+        INSERT INTO Peer_Reviews (project_id, reviewer_id, reviewee_id, score, comment)
+        SELECT p.project_id, :prefix || 'reviewer', :prefix || 'a' || i, 1 + (i + p.project_id) % 5,
+            '함께 일하기 좋은 팀원이었습니다. 일정 관리와 커뮤니케이션이 좋았습니다.'
+        FROM generate_series(1, :applicants) i
+        CROSS JOIN (SELECT project_id FROM Projects WHERE leader_id = :prefix || 'leader') p
+        """
+    ), {"prefix": _PREFIX, "applicants": applicants})
+    project_id = conn.execute(text(
+        """
+        INSERT INTO Projects (leader_id, topic, description1, description2, capacity, deadline)
+        VALUES (:prefix || 'leader', 'bench target', '-', '-', 5, CURRENT_DATE + 30)
+        RETURNING project_id
+        """
+    ), {"prefix": _PREFIX}).scalar()
+    conn.execute(text(
+        """
+        INSERT INTO Project_Required_Skills (project_id, skill_id)
+        SELECT :project_id, skill_id FROM Skills ORDER BY skill_id LIMIT 3
+        """
+    ), {"project_id": project_id})
+    conn.execute(text(
+        """
+        INSERT INTO Applications (project_id, applicant_id, applicant_date, motivation)
+        SELECT :project_id, :prefix || 'a' || i, CURRENT_DATE - (i % 30), '지원합니다.'
+        FROM generate_series(1, :applicants) i
+        """
+    ), {"project_id": project_id, "prefix": _PREFIX, "applicants": applicants})
+    conn.execute(text("ANALYZE Peer_Reviews, Applications, Student_Skills"))
+    return project_id
+
+
+def _drop_data(conn) -> None:
+    params = {"pattern": _PREFIX + "%"}
+    conn.execute(text("DELETE FROM Peer_Reviews WHERE reviewer_id LIKE :pattern"), params)
+    conn.execute(text("DELETE FROM Applications WHERE applicant_id LIKE :pattern"), params)
+    conn.execute(text(
+        "DELETE FROM Project_Required_Skills WHERE project_id IN (SELECT project_id FROM Projects WHERE leader_id LIKE :pattern)"
+    ), params)
+    conn.execute(text("DELETE FROM Projects WHERE leader_id LIKE :pattern"), params)
+    conn.execute(text("DELETE FROM Student_Skills WHERE uid LIKE :pattern"), params)
+    conn.execute(text("DELETE FROM Students WHERE uid LIKE :pattern"), params)
+
+
+def _measure(fn, repeat: int) -> tuple[float, float, int]:
+    fn()  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))], size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지원자 관리 목록 벤치마크")
+    parser.add_argument("--applicants", type=int, default=300)
+    parser.add_argument("--reviews", type=int, default=50, help="지원자 1명이 받은 리뷰 수")
+    parser.add_argument("--review-limit", type=int, default=5, help="recent 모드의 리뷰 수")
+    parser.add_argument("--limit", type=int, default=20, help="score 모드의 상위 지원자 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    admin_engine = create_engine(admin_database_url(), poolclass=NullPool)
+    try:
+        with admin_engine.begin() as conn:
+            _drop_data(conn)
+            project_id = _create_data(conn, args.applicants, args.reviews)
+        leader_id = _PREFIX + "leader"
+        print(f"project_id={project_id}, 지원자 {args.applicants}명 x 리뷰 {args.reviews}개")
+
+        def legacy():
+            with SessionLocal() as db:
+                rows = db.execute(text(_LEGACY_SQL), {"project_id": project_id}).mappings().all()
+                applications = []
+                for r in rows:
+                    application = dict(r)
+                    application["applicant_skills"] = sorted(skill_dictionary.names(db, application.pop("applicant_skill_ids")))
+                    applications.append(application)
+            return len(applications)
+
+        def mode(reviews: str, order: str = "date", limit: int | None = None):
+            def run():
+                with SessionLocal() as db:
+                    return len(get_applications_by_project(db, project_id, leader_id, reviews, args.review_limit, order, limit))
+            return run
+
+        print(f"{'mode':<10}{'p50 ms':>10}{'p99 ms':>10}{'rows':>8}")
+        for name, fn in (("legacy", legacy), ("all", mode("all")), ("stats", mode("stats")), ("recent", mode("recent")),
+                         ("score", mode("recent", "score", args.limit))):
+            p50, p99, rows = _measure(fn, args.repeat)
+            print(f"{name:<10}{p50:>10.2f}{p99:>10.2f}{rows:>8}")
+    finally:
+        with admin_engine.begin() as conn:
+            _drop_data(conn)
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
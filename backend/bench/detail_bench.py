@@ -0,0 +1,141 @@
+"""
+프로젝트 상세 조회 벤치마크
+
+단일 JSON 쿼리로 바뀐 _fetch_project_details와 이전의 다중 쿼리 방식(아래 _legacy_project_details,
+프로젝트/스킬/지원 여부/멤버/멤버 수를 차례로 조회)의 지연 시간(p50/p99)을 비교한다.
+캐시를 거치지 않도록 두 함수 모두 캐시 뒤의 실제 조회 함수를 직접 호출한다.
+
+실행 (backend 디렉터리에서):
+    python -m bench.detail_bench --repeat 500
+    python -m bench.detail_bench --verify     # 두 방식의 결과가 같은지 확인
+"""
+import argparse
+import statistics
+import time
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from db.session import SessionLocal
+from crud.crud_projects import _fetch_project_details
+from crud.crud_skills import skill_dictionary
+
+
+def _legacy_project_details(db: Session, project_id: int, applicant_id: str = None) -> dict | None:
+    """
+    비교용: 단일 쿼리로 바꾸기 전의 다중 쿼리 방식
+    """
+    row_mapping = db.execute(text(
+        """
+        SELECT p.project_id, p.leader_id, s.name AS leader_name, p.topic, p.description1, p.description2,
+            p.capacity, p.deadline, p.status
+        FROM Projects p
+        JOIN Students s ON p.leader_id = s.uid
+        WHERE p.project_id = :project_id
+        """
+    ), {"project_id": project_id}).mappings().first()
+    if not row_mapping:
+        return None
+    project = dict(row_mapping)
+
+    skills_res = db.execute(text(
+        "SELECT skill_id FROM Project_Required_Skills WHERE project_id = :project_id"), {"project_id": project_id})
+    project["skills"] = skill_dictionary.names(db, [r[0] for r in skills_res.fetchall()])
+
+    if applicant_id:
+        if applicant_id == project["leader_id"]:
+            project["can_apply"] = False
+        else:
+            app_res = db.execute(text(
+                "SELECT 1 FROM Applications WHERE project_id=:project_id AND applicant_id=:applicant_id"
+            ), {"project_id": project_id, "applicant_id": applicant_id})
+            project["can_apply"] = not bool(app_res.fetchone())
+    else:
+        project["can_apply"] = True
+
+    members_res = db.execute(text(
+        """
+        SELECT s.uid, s.name,
+            COALESCE(array_agg(ss.skill_id) FILTER (WHERE ss.skill_id IS NOT NULL), ARRAY[]::integer[]) AS skill_ids
+        FROM Students s
+        LEFT JOIN Student_Skills ss ON ss.uid = s.uid
+        WHERE s.uid IN (
+            SELECT applicant_id FROM Applications WHERE project_id = :project_id AND status = 'Accepted'
+            UNION
+            SELECT leader_id FROM Projects WHERE project_id = :project_id
+        )
+        GROUP BY s.uid, s.name
+        ORDER BY s.name
+        """
+    ), {"project_id": project_id})
+    project["members"] = [
+        {"uid": r.uid, "name": r.name, "skills": skill_dictionary.names(db, r.skill_ids)}
+        for r in members_res.fetchall()
+    ]
+
+    count_row = db.execute(text(
+        "SELECT COUNT(DISTINCT a.applicant_id) FROM Applications a WHERE a.project_id = :project_id AND a.status = 'Accepted'"
+    ), {"project_id": project_id}).fetchone()
+    project["members_count"] = int(count_row[0] or 0) + 1
+    return project
+
+
+def _normalize(project: dict | None) -> dict | None:
+    # 스킬 배열 순서는 두 방식 모두 보장하지 않으므로 정렬해서 비교
+    if project is None:
+        return None
+    project = dict(project)
+    project["skills"] = sorted(project["skills"])
+    project["members"] = [{**m, "skills": sorted(m["skills"])} for m in project["members"]]
+    return project
+
+
+def _measure(db: Session, fn, cases: list[tuple], repeat: int) -> tuple[float, float]:
+    timings = []
+    for i in range(repeat):
+        project_id, applicant_id = cases[i % len(cases)]
+        start = time.perf_counter()
+        fn(db, project_id, applicant_id)
+        db.rollback()  # 요청마다 세션이 새로 시작되는 것과 같게 트랜잭션 종료
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return statistics.median(timings), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로젝트 상세 조회: 단일 쿼리 vs 다중 쿼리")
+    parser.add_argument("--repeat", type=int, default=300, help="방식별 호출 횟수")
+    parser.add_argument("--verify", action="store_true", help="두 방식의 결과가 같은지만 확인")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        project_ids = db.execute(text("SELECT project_id FROM Projects ORDER BY project_id")).scalars().all()
+        uids = db.execute(text("SELECT uid FROM Students ORDER BY uid")).scalars().all()
+        if not project_ids:
+            print("프로젝트가 없습니다.")
+            return
+        # 비로그인 / 리더 / 지원자 / 미지원자 등 여러 경우가 섞이도록 구성
+        cases = [(pid, None) for pid in project_ids] + [(pid, uid) for pid in project_ids for uid in uids]
+
+        if args.verify:
+            mismatches = [
+                (pid, uid) for pid, uid in cases
+                if _normalize(_fetch_project_details(db, pid, uid)) != _normalize(_legacy_project_details(db, pid, uid))
+            ]
+            print(f"{len(cases)}건 비교, 불일치 {len(mismatches)}건 {mismatches[:5]}")
+            return
+
+        # 워밍업 (스킬 사전 로드, 실행 계획 캐시)
+        _measure(db, _fetch_project_details, cases, min(len(cases), 50))
+        _measure(db, _legacy_project_details, cases, min(len(cases), 50))
+
+        print(f"{'method':<14}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, fn in (("multi-query", _legacy_project_details), ("single-query", _fetch_project_details)):
+            p50, p99 = _measure(db, fn, cases, args.repeat)
+            print(f"{name:<14}{p50:>10.2f}{p99:>10.2f}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
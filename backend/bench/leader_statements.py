@@ -0,0 +1,60 @@
+"""
+리더 권한(SET ROLE leader) 경로의 호출당 SQL 문 수 측정
+
+임시 프로젝트와 지원서를 만든 뒤 아래 함수를 차례로 호출하면서 record_statements()로
+DB에 보낸 문장(BEGIN/COMMIT 포함)을 기록해 출력한다. 마지막 delete_project 호출이 임시 데이터를 지운다.
+    - get_applications_by_project
+    - update_application_status
+    - update_project_status
+    - delete_project
+
+실행 (backend 디렉터리에서):
+    python -m bench.leader_statements [--verbose]
+"""
+import argparse
+from datetime import date, timedelta
+from sqlalchemy import text
+from db.session import SessionLocal, get_pool_status, record_statements
+from crud.crud_projects import create_project_with_skills, update_project_status, delete_project
+from crud.crud_applications import apply_to_project, get_applications_by_project, update_application_status
+
+
+def _measure(name: str, fn, *args, verbose: bool = False) -> None:
+    db = SessionLocal()
+    try:
+        with record_statements() as statements:
+            fn(db, *args)
+    finally:
+        db.close()
+    checked_out = get_pool_status()["checked_out"]
+    print(f"{name:<30} statements={len(statements):>2}  checked_out_after={checked_out}")
+    if verbose:
+        for statement in statements:
+            print(f"    {statement[:100]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리더 권한 경로의 호출당 SQL 문 수 측정")
+    parser.add_argument("--verbose", action="store_true", help="기록된 SQL 문 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        leader_id, applicant_id = db.execute(text("SELECT uid FROM Students ORDER BY uid LIMIT 2")).scalars().all()
+        topic = "leader_statements bench"
+        create_project_with_skills(db, leader_id, topic, "-", "-", 3, date.today() + timedelta(days=30), [])
+        project_id = db.execute(text(
+            "SELECT MAX(project_id) FROM Projects WHERE leader_id = :leader_id AND topic = :topic"
+        ), {"leader_id": leader_id, "topic": topic}).scalar()
+        apply_to_project(db, project_id, applicant_id, date.today().isoformat(), "bench")
+    finally:
+        db.close()
+
+    _measure("get_applications_by_project", get_applications_by_project, project_id, leader_id, verbose=args.verbose)
+    _measure("update_application_status", update_application_status, project_id, applicant_id, "Accepted", leader_id, verbose=args.verbose)
+    _measure("update_project_status", update_project_status, project_id, leader_id, "In_Progress", verbose=args.verbose)
+    _measure("delete_project", delete_project, project_id, leader_id, verbose=args.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+HTTP 부하 테스트 / 지연 시간 벤치마크
+
+로컬 PostgreSQL과 main.py의 FastAPI 앱을 대상으로 실제 사용 패턴을 섞은 요청을 보내고,
+엔드포인트별 처리량과 p50/p95/p99 지연 시간을 출력한다.
+    - 조회: 모집 중 목록, 검색(fulltext), 상세, 프로필
+    - 쓰기: 지원, 지원 수락/거절(리더), 프로필 수정
+    - 로그인 몰림: --burst-interval 초마다 --burst-size 건의 로그인을 동시에 보냄
+
+- 시나리오는 데이터 규모(--students, db.seed로 적재)와 동시 접속 수(--concurrency, 여러 값 가능)로 정한다.
+- 요청 선택은 --seed로 고정되지만, 쓰기 요청이 DB를 바꾸므로 같은 DB로 반복하면 결과가 조금씩 달라진다.
+  비교용 측정은 새로 적재한 DB에서 하는 것을 권장한다.
+- --baseline 파일과 비교해 p95 지연 시간이나 처리량이 허용 범위(--tolerance)를 넘게 나빠지면,
+  또는 5xx/연결 오류가 있으면 종료 코드 1로 끝난다. 기준 파일은 --save-baseline으로 만든다.
+
+실행 (backend 디렉터리에서):
+    python -m bench.load_test --spawn --students 100000 --concurrency 8 32 --duration 30 --save-baseline bench_baseline.json
+    python -m bench.load_test --spawn --concurrency 8 32 --duration 30 --baseline bench_baseline.json
+    python -m bench.load_test --url http://127.0.0.1:8000 --concurrency 16   # 이미 떠 있는 서버 대상
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date
+from urllib.parse import urlencode, urlsplit
+from sqlalchemy import text
+from db.session import SessionLocal
+from db.seed import SEED_PASSWORD, run_seed
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 요청 종류별 가중치 (합이 100일 필요는 없음)
+DEFAULT_MIX = {
+    "list": 30,
+    "search": 15,
+    "detail": 25,
+    "profile": 8,
+    "apply": 8,
+    "review_application": 6,
+    "update_profile": 8,
+}
+
+# 기준 비교에서 표본이 이보다 적은 엔드포인트는 건너뜀
+MIN_SAMPLES = 20
+# p95 비교에서 무시할 절대 차이 (ms)
+MIN_DELTA_MS = 2.0
+
+
+class _Dataset:
+    """
+    요청을 만들 때 쓰는 DB 표본 (시작 시 한 번 읽음)
+    """
+
+    def __init__(self):
+        with SessionLocal() as db:
+            self.uids = db.execute(text("SELECT uid FROM Students ORDER BY uid")).scalars().all()
+            self.project_ids = db.execute(text("SELECT project_id FROM Projects ORDER BY project_id")).scalars().all()
+            self.recruiting_ids = db.execute(text(
+                "SELECT project_id FROM RecruitingProjectsView ORDER BY project_id"
+            )).scalars().all()
+            self.pending = [tuple(r) for r in db.execute(text(
+                """
+                SELECT a.project_id, a.applicant_id, p.leader_id
+                FROM Applications a JOIN Projects p ON p.project_id = a.project_id
+                WHERE a.status = 'Pending' AND p.status = 'Recruiting'
+                ORDER BY a.application_id
+                """
+            )).fetchall()]
+            self.search_terms = db.execute(text(
+                """
+                SELECT s.skill_name FROM Skills s
+                JOIN Project_Required_Skills prs ON prs.skill_id = s.skill_id
+                GROUP BY s.skill_name ORDER BY COUNT(*) DESC, s.skill_name LIMIT 30
+                """
+            )).scalars().all()
+            self.names = dict(db.execute(text("SELECT uid, name FROM Students ORDER BY uid LIMIT 5000")).fetchall())
+            self.applied = set(db.execute(text(
+                "SELECT project_id, applicant_id FROM Applications UNION ALL SELECT project_id, leader_id FROM Projects"
+            )).fetchall())
+        if not self.uids or not self.project_ids:
+            raise RuntimeError("학생/프로젝트 데이터가 없습니다. --students 로 합성 데이터를 적재하세요.")
+        random.Random(0).shuffle(self.pending)
+        self._lock = threading.Lock()
+
+    def claim_application(self, project_id: int, applicant_id: str) -> bool:
+        # 화면에서처럼(can_apply) 이미 지원했거나 리더인 프로젝트에는 지원하지 않음
+        with self._lock:
+            if (project_id, applicant_id) in self.applied:
+                return False
+            self.applied.add((project_id, applicant_id))
+            return True
+
+    def pop_pending(self):
+        # 같은 지원서를 두 번 처리하지 않도록 하나씩 꺼내 씀
+        with self._lock:
+            return self.pending.pop() if self.pending else None
+
+
+def _build_request(kind: str, rng: random.Random, data: _Dataset):
+    """
+    요청 종류별 (method, path, body) 생성 (만들 수 없으면 None)
+    """
+    if kind == "list":
+        params = {"groupBy": "Recruiting", "orderBy": rng.choice(["deadline", "capacity"]), "limit": 20}
+        return "GET", "/projects/list?" + urlencode(params), None
+    if kind == "search":
+        params = {"search": rng.choice(data.search_terms or ["python"]), "searchMode": "fulltext", "orderBy": "relevance", "limit": 20}
+        return "GET", "/projects/list?" + urlencode(params), None
+    if kind == "detail":
+        params = {"applicant_id": rng.choice(data.uids)}
+        return "GET", f"/projects/{rng.choice(data.project_ids)}?" + urlencode(params), None
+    if kind == "profile":
+        return "GET", f"/profile/info/{rng.choice(data.uids)}", None
+    if kind == "apply":
+        if not data.recruiting_ids:
+            return None
+        project_id, applicant_id = rng.choice(data.recruiting_ids), rng.choice(data.uids)
+        if not data.claim_application(project_id, applicant_id):
+            return None
+        body = {"applicant_id": applicant_id, "applicant_date": date.today().isoformat(), "motivation": "load test"}
+        return "POST", f"/projects/{project_id}/apply", body
+    if kind == "review_application":
+        pair = data.pop_pending()
+        if pair is None:
+            return None
+        project_id, applicant_id, leader_id = pair
+        body = {"new_status": rng.choice(["Accepted", "Rejected"]), "leader_id": leader_id}
+        return "PUT", f"/projects/{project_id}/applications/{applicant_id}/status", body
+    if kind == "update_profile":
+        uid = rng.choice(list(data.names))
+        skills = rng.sample(data.search_terms, min(len(data.search_terms), rng.randint(1, 5)))
+        body = {"uid": uid, "name": data.names[uid], "email": f"{uid}@univ.ac.kr", "skills": skills}
+        return "PUT", f"/profile/update/{uid}", body
+    if kind == "login":
+        return "POST", "/auth/login", {"uid": rng.choice(data.uids), "password": SEED_PASSWORD}
+    raise ValueError(kind)
+
+
+class _Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.client_errors: dict[str, int] = defaultdict(int)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def add(self, kind: str, elapsed_ms: float, status: int) -> None:
+        with self._lock:
+            if status == 0 or status >= 500:
+                self.errors[kind] += 1
+                return
+            self.latencies[kind].append(elapsed_ms)
+            if status >= 400:
+                self.client_errors[kind] += 1  # 중복 지원, 정원 초과 등 예상된 거절
+
+
+def _send(conn: http.client.HTTPConnection, method: str, path: str, body) -> int:
+    payload = json.dumps(body).encode() if body is not None else None
+    headers = {"Content-Type": "application/json"} if payload is not None else {}
+    conn.request(method, path, body=payload, headers=headers)
+    res = conn.getresponse()
+    res.read()
+    return res.status
+
+
+def _timed(conn_factory, conn, kind, request, recorder):
+    method, path, body = request
+    started_at = time.perf_counter()
+    try:
+        status = _send(conn, method, path, body)
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        conn = conn_factory()
+        status = 0
+    recorder.add(kind, (time.perf_counter() - started_at) * 1000, status)
+    return conn
+
+
+def _worker(conn_factory, mix: dict[str, int], data: _Dataset, recorder: _Recorder, deadline: float, rng: random.Random):
+    kinds = list(mix)
+    cum_weights = list(itertools.accumulate(mix.values()))
+    conn = conn_factory()
+    try:
+        while time.perf_counter() < deadline:
+            kind = rng.choices(kinds, cum_weights=cum_weights)[0]
+            request = _build_request(kind, rng, data)
+            if request is not None:
+                conn = _timed(conn_factory, conn, kind, request, recorder)
+    finally:
+        conn.close()
+
+
+def _login_bursts(conn_factory, data: _Dataset, recorder: _Recorder, deadline: float, rng: random.Random,
+                  interval: float, size: int, stop: threading.Event):
+    # interval초마다 size건의 로그인을 동시에 보냄 (각자 새 연결)
+    def login(seed):
+        conn = conn_factory()
+        try:
+            _timed(conn_factory, conn, "login", _build_request("login", random.Random(seed), data), recorder)
+        finally:
+            conn.close()
+
+    while not stop.wait(interval) and time.perf_counter() < deadline:
+        threads = [threading.Thread(target=login, args=(rng.random(),)) for _ in range(size)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def run_scenario(base_url: str, data: _Dataset, concurrency: int, duration: float, seed: int,
+                 mix: dict[str, int], burst_interval: float, burst_size: int) -> dict:
+    """
+    한 시나리오(동시 접속 수 고정)를 duration초 동안 실행하고 결과 집계를 반환
+    """
+    url = urlsplit(base_url)
+    conn_factory = lambda: http.client.HTTPConnection(url.hostname, url.port or 80, timeout=60)
+    recorder = _Recorder()
+    started_at = time.perf_counter()
+    deadline = started_at + duration
+    stop = threading.Event()
+
+    threads = [
+        threading.Thread(target=_worker, args=(conn_factory, mix, data, recorder, deadline, random.Random(seed * 1000 + i)))
+        for i in range(concurrency)
+    ]
+    if burst_size > 0:
+        threads.append(threading.Thread(target=_login_bursts, args=(
+            conn_factory, data, recorder, deadline, random.Random(seed), burst_interval, burst_size, stop)))
+    for t in threads:
+        t.start()
+    for t in threads[:concurrency]:
+        t.join()
+    elapsed = time.perf_counter() - started_at  # 진행 중인 로그인 몰림은 기다리되 처리량 계산에서는 제외
+    stop.set()
+    for t in threads[concurrency:]:
+        t.join()
+
+    endpoints = {}
+    for kind in sorted(set(recorder.latencies) | set(recorder.errors)):
+        values = sorted(recorder.latencies.get(kind, []))
+        endpoints[kind] = {
+            "count": len(values),
+            "errors": recorder.errors.get(kind, 0),
+            "client_errors": recorder.client_errors.get(kind, 0),
+            "rps": len(values) / elapsed,
+            "p50_ms": _percentile(values, 0.50),
+            "p95_ms": _percentile(values, 0.95),
+            "p99_ms": _percentile(values, 0.99),
+        }
+    total = sum(e["count"] for e in endpoints.values())
+    return {
+        "students": len(data.uids),
+        "projects": len(data.project_ids),
+        "concurrency": concurrency,
+        "duration_s": elapsed,
+        "requests": total,
+        "throughput_rps": total / elapsed,
+        "errors": sum(e["errors"] for e in endpoints.values()),
+        "endpoints": endpoints,
+    }
+
+
+def scenario_name(result: dict) -> str:
+    return f"students={result['students']} concurrency={result['concurrency']}"
+
+
+def print_result(result: dict) -> None:
+    print(f"\n[{scenario_name(result)}] {result['requests']} requests in {result['duration_s']:.1f}s, "
+          f"{result['throughput_rps']:.1f} req/s, errors={result['errors']}")
+    print(f"{'endpoint':<20}{'count':>8}{'4xx':>6}{'err':>5}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for kind, e in result["endpoints"].items():
+        print(f"{kind:<20}{e['count']:>8}{e['client_errors']:>6}{e['errors']:>5}{e['rps']:>9.1f}"
+              f"{e['p50_ms']:>9.1f}{e['p95_ms']:>9.1f}{e['p99_ms']:>9.1f}")
+
+
+def compare_with_baseline(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """
+    기준보다 나빠진 항목 목록 (p95 지연 시간, 처리량)
+    """
+    regressions = []
+    for result in results:
+        name = scenario_name(result)
+        base = baseline.get(name)
+        if base is None:
+            print(f"[참고] 기준 파일에 '{name}' 시나리오가 없어 비교하지 않습니다.")
+            continue
+        if result["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base['throughput_rps']:.1f} -> {result['throughput_rps']:.1f} req/s")
+        for kind, e in result["endpoints"].items():
+            b = base["endpoints"].get(kind)
+            if not b or e["count"] < MIN_SAMPLES or b["count"] < MIN_SAMPLES:
+                continue
+            if e["p95_ms"] > b["p95_ms"] * (1 + tolerance) and e["p95_ms"] - b["p95_ms"] > MIN_DELTA_MS:
+                regressions.append(f"{name} {kind}: p95 {b['p95_ms']:.1f} -> {e['p95_ms']:.1f} ms")
+    return regressions
+
+
+def _wait_until_ready(base_url: str, timeout: float) -> None:
+    url = urlsplit(base_url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(url.hostname, url.port, timeout=2)
+            if _send(conn, "GET", "/system/pool", None) == 200:
+                return
+        except (OSError, http.client.HTTPException):
+            pass
+        time.sleep(0.3)
+    raise RuntimeError(f"서버가 {timeout:.0f}초 안에 응답하지 않습니다: {base_url}")
+
+
+@contextmanager
+def _spawn_server(port: int, workers: int, timeout: float):
+    """
+    uvicorn으로 main:app을 띄우고 끝나면 종료
+    """
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_until_ready(base_url, timeout)
+        yield base_url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트 / 지연 시간 벤치마크")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://127.0.0.1:8000", help="이미 떠 있는 서버 주소")
+    target.add_argument("--spawn", action="store_true", help="uvicorn으로 서버를 직접 띄워서 측정")
+    parser.add_argument("--port", type=int, default=8765, help="--spawn 시 포트")
+    parser.add_argument("--workers", type=int, default=1, help="--spawn 시 uvicorn 워커 수")
+    parser.add_argument("--students", type=int, default=0, help="측정 전에 적재할 합성 학생 수 (0: 현재 DB 그대로)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8], help="동시 접속 수 (여러 값이면 시나리오별로 실행)")
+    parser.add_argument("--duration", type=float, default=20, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=3, help="시나리오별 워밍업 시간 (초, 집계 제외)")
+    parser.add_argument("--seed", type=int, default=1, help="요청 선택 난수 시드")
+    parser.add_argument("--mix", type=json.loads, default=DEFAULT_MIX, help='요청 비율 JSON (예: \'{"list": 50, "detail": 50}\')')
+    parser.add_argument("--burst-interval", type=float, default=5, help="로그인 몰림 간격 (초)")
+    parser.add_argument("--burst-size", type=int, default=10, help="한 번에 보내는 로그인 수 (0: 사용 안 함)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 JSON")
+    parser.add_argument("--save-baseline", help="이번 결과를 기준 JSON으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 악화 비율 (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    unknown = set(args.mix) - set(DEFAULT_MIX) - {"login"}
+    if unknown:
+        parser.error(f"알 수 없는 요청 종류: {', '.join(sorted(unknown))}")
+    if args.students:
+        counts = run_seed(args.students)
+        print(f"합성 데이터 적재: {sum(counts.values())}행" if counts else "합성 데이터가 이미 적재되어 있습니다.")
+    data = _Dataset()
+
+    def run_all(base_url: str) -> list[dict]:
+        results = []
+        for concurrency in args.concurrency:
+            if args.warmup > 0:
+                run_scenario(base_url, data, concurrency, args.warmup, args.seed + 1, args.mix, args.burst_interval, 0)
+            result = run_scenario(base_url, data, concurrency, args.duration, args.seed, args.mix,
+                                  args.burst_interval, args.burst_size)
+            print_result(result)
+            results.append(result)
+        return results
+
+    if args.spawn:
+        with _spawn_server(args.port, args.workers, timeout=120) as base_url:
+            results = run_all(base_url)
+    else:
+        _wait_until_ready(args.url, timeout=5)
+        results = run_all(args.url)
+
+    by_name = {scenario_name(r): r for r in results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(by_name, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(by_name, f, indent=2)
+        print(f"\n기준 저장: {args.save_baseline}")
+
+    failed = False
+    errors = sum(r["errors"] for r in results)
+    if errors:
+        print(f"\n!!! 5xx/연결 오류 {errors}건")
+        failed = True
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n!!! 성능 저하 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+            for line in regressions:
+                print(f"    {line}")
+            failed = True
+        else:
+            print(f"\n기준 대비 성능 저하 없음 (허용 {args.tolerance:.0%})")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+엔드포인트별 SQL 문 수 예산 검사 (N+1 회귀 검사)
+
+api/v1/endpoints의 모든 라우트를 앱(main.app)에 직접 요청해 호출하고, QueryBudgetMiddleware가 기록한
+요청당 SQL 왕복 수가 api/query_budget.py의 QUERY_BUDGETS 이하인지 확인한다.
+결과 크기가 다른 두 입력(예: limit=1 / limit=100, 멤버가 가장 적은 / 많은 프로젝트, 스킬 1개 / 20개)으로
+같은 라우트를 호출해 문장 수가 같은지도 확인하므로, 행마다 쿼리하는 코드가 다시 들어오면 실패한다.
+
+- 캐시를 끄고(PROJECT_CACHE_ENABLED=0) 항상 DB까지 가는 경로를 잰다.
+- 예산이 없거나 호출되지 않은 라우트가 있어도 실패한다. (새 엔드포인트는 예산을 함께 선언)
+- 쓰기 엔드포인트도 호출하므로 개발/벤치마크 DB에서 실행한다. 프로필은 원래대로 되돌리지만
+  검사용 프로젝트(리뷰 포함)와 가입한 학생(qb_...)은 남는다.
+- 실패하면 종료 코드 1, --verbose로 라우트별 SQL 문을 출력
+
+실행 (backend 디렉터리에서):
+    python -m bench.query_budget [--verbose]
+"""
+import os
+
+# main을 import 하기 전에 설정해야 미들웨어가 등록되고 캐시/스킬 사전/추천 인덱스 갱신/보관 스위퍼가 결과에 끼어들지 않는다.
+os.environ["QUERY_BUDGET_MODE"] = "warn"
+os.environ["PROJECT_CACHE_ENABLED"] = "0"
+os.environ["SKILL_DICT_REFRESH_INTERVAL"] = "3600"
+os.environ["RECOMMENDER_REFRESH_INTERVAL"] = "3600"
+os.environ["PROJECT_ARCHIVE_INTERVAL"] = "0"
+
+import argparse
+import sys
+import uuid
+from datetime import date, timedelta
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from main import app
+from api.query_budget import QUERY_BUDGETS, query_budget_log
+from db.session import SessionLocal
+
+
+def _scalar_row(sql: str, **params):
+    with SessionLocal() as db:
+        row = db.execute(text(sql), params).first()
+    if row is None:
+        raise RuntimeError(f"검사용 데이터를 찾을 수 없습니다: {sql.split()[:6]}")
+    return row
+
+
+def _fewest_and_most(sql: str) -> tuple:
+    # sql은 (값, 건수)를 반환해야 함 -> (건수가 가장 적은 값, 가장 많은 값)
+    with SessionLocal() as db:
+        rows = db.execute(text(sql)).fetchall()
+    if not rows:
+        raise RuntimeError(f"검사용 데이터를 찾을 수 없습니다: {sql.split()[:6]}")
+    rows = sorted(rows, key=lambda r: (r[1], str(r[0])))
+    return rows[0][0], rows[-1][0]
+
+
+class _Checker:
+    def __init__(self, client: TestClient, verbose: bool):
+        self.client = client
+        self.verbose = verbose
+        self.failures: list[str] = []
+        self.covered: set[tuple[str, str]] = set()
+
+    def call(self, method: str, path: str, expect: int | tuple = (200, 201), **kwargs):
+        query_budget_log.clear()
+        res = self.client.request(method, path, **kwargs)
+        if not query_budget_log:
+            raise RuntimeError("QueryBudgetMiddleware가 등록되지 않았습니다.")
+        method, route, status, count, budget, statements = query_budget_log[-1]
+        expect = (expect,) if isinstance(expect, int) else expect
+        if res.status_code not in expect:
+            self.failures.append(f"{method} {path}: 예상하지 않은 상태 코드 {res.status_code} {res.text[:200]}")
+        self.covered.add((method, route))
+        return res, route, count, budget, statements
+
+    def check(self, name: str, method: str, small: tuple, large: tuple | None = None, **kwargs):
+        """
+        small/large: (path, 요청 인자 dict). large가 있으면 두 호출의 문장 수가 같아야 한다.
+        """
+        results = [self.call(method, path, **{**kwargs, **extra}) for path, extra in ([small] + ([large] if large else []))]
+        counts = [r[2] for r in results]
+        route, budget = results[0][1], results[0][3]
+        status = "ok"
+        if budget is None:
+            status = "NO BUDGET"
+            self.failures.append(f"{method} {route}: QUERY_BUDGETS에 예산이 없습니다.")
+        elif max(counts) > budget:
+            status = "OVER BUDGET"
+            self.failures.append(f"{method} {route} ({name}): {max(counts)} statements > budget {budget}")
+        if len(set(counts)) > 1:
+            status = "GROWS"
+            self.failures.append(f"{method} {route} ({name}): 결과 크기에 따라 문장 수가 달라짐 {counts}")
+        shown = " / ".join(str(c) for c in counts)
+        print(f"{status:<12}{method:<7}{route:<58}{shown:>9}{'' if budget is None else budget:>8}  {name}")
+        if self.verbose:
+            for statement in results[-1][4]:
+                print(f"            {statement[:110]}")
+        return results[-1][0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드포인트별 SQL 문 수 예산 검사")
+    parser.add_argument("--verbose", action="store_true", help="라우트별 SQL 문 출력")
+    args = parser.parse_args()
+
+    with TestClient(app) as client:
+        c = _Checker(client, args.verbose)
+        print(f"{'status':<12}{'method':<7}{'route':<58}{'count':>9}{'budget':>8}  case")
+        suffix = uuid.uuid4().hex[:8]
+        today = date.today()
+
+        # auth
+        uid = f"qb_{suffix}"
+        c.check("signup", "POST", ("/auth/signup", {"json": {"uid": uid, "password": "pw1234", "name": "예산검사"}}))
+        c.check("login", "POST", ("/auth/login", {"json": {"uid": uid, "password": "pw1234"}}))
+
+        # profile: 스킬이 가장 적은 / 많은 학생 (검사용 학생 qb_...는 아래 지원/일괄 수락에 따로 쓰므로 제외)
+        few_uid, many_uid = _fewest_and_most(
+            "SELECT s.uid, COUNT(ss.skill_id) FROM Students s LEFT JOIN Student_Skills ss ON ss.uid = s.uid "
+            "WHERE s.uid NOT LIKE 'qb\\_%' GROUP BY s.uid")
+        c.check("skills fewest/most", "GET", (f"/profile/info/{few_uid}", {}), (f"/profile/info/{many_uid}", {}))
+        profile = client.get(f"/profile/info/{many_uid}").json()
+        base = {"uid": many_uid, "name": profile["name"], "email": profile["email"],
+                "profile_text": profile["profile_text"], "website_link": profile["website_link"]}
+        # 스킬 사전에 없는 스킬 1개 / 20개 (없는 스킬 등록까지 같은 문장 수여야 함)
+        c.check("1 / 20 new skills", "PUT",
+                (f"/profile/update/{many_uid}", {"json": {**base, "skills": [f"qb-skill-{suffix}-one"]}}),
+                (f"/profile/update/{many_uid}", {"json": {**base, "skills": [f"qb-skill-{suffix}-{i}" for i in range(20)]}}))
+        client.put(f"/profile/update/{many_uid}", json={**base, "skills": profile["skills"]})
+
+        # projects: 목록 (groupBy별로 1건 / 전체 건수, 프로젝트 수와 관계없이 문장 수가 같아야 함)
+        for group_by in ("All", "Recruiting", "In_Progress", "Completed"):
+            c.check(f"groupBy={group_by} 1 / all projects", "GET",
+                    ("/projects/list", {"params": {"groupBy": group_by, "limit": 1}}),
+                    ("/projects/list", {"params": {"groupBy": group_by}}))
+        c.check("limit 1/100", "GET", ("/projects/list", {"params": {"limit": 1}}), ("/projects/list", {"params": {"limit": 100}}))
+        c.check("fulltext limit 1/100", "GET",
+                ("/projects/list", {"params": {"search": "프로젝트", "searchMode": "fulltext", "orderBy": "relevance", "limit": 1}}),
+                ("/projects/list", {"params": {"search": "프로젝트", "searchMode": "fulltext", "orderBy": "relevance", "limit": 100}}))
+        c.check("limit 1/100", "GET", ("/projects/recommended", {"params": {"current_user_id": many_uid, "limit": 1}}),
+                ("/projects/recommended", {"params": {"current_user_id": many_uid, "limit": 100}}))
+        few_mine, many_mine = _fewest_and_most(
+            """
+            SELECT s.uid, COUNT(p.project_id) FROM Students s
+            LEFT JOIN Projects p ON p.leader_id = s.uid OR p.project_id IN (
+                SELECT project_id FROM Applications WHERE applicant_id = s.uid AND status = 'Accepted')
+            GROUP BY s.uid
+            """)
+        c.check("projects fewest/most", "GET",
+                ("/projects/me", {"params": {"current_user_id": few_mine}}), ("/projects/me", {"params": {"current_user_id": many_mine}}))
+
+        # projects: 상세 (멤버가 가장 적은 / 많은 프로젝트)
+        few_members, many_members = _fewest_and_most(
+            "SELECT project_id, accepted_members FROM Project_Stats")
+        c.check("members fewest/most", "GET", (f"/projects/{few_members}", {"params": {"applicant_id": uid}}),
+                (f"/projects/{many_members}", {"params": {"applicant_id": uid}}))
+
+        # projects: 생성 (새 스킬 1개 / 20개) -> 한쪽은 상태 변경/삭제, 다른 쪽은 지원/리뷰 흐름에 사용
+        leader_id, applicant_id = many_uid, few_uid
+        new_project = {"leader_id": leader_id, "description1": "-", "description2": "-", "capacity": 3,
+                       "deadline": (today + timedelta(days=30)).isoformat()}
+        c.check("1 / 20 new skills", "POST",
+                ("/projects/new", {"json": {**new_project, "topic": f"query budget check {suffix} a",
+                                            "skills": [f"qb-project-{suffix}-one"]}}),
+                ("/projects/new", {"json": {**new_project, "topic": f"query budget check {suffix} b",
+                                            "skills": [f"qb-project-{suffix}-{i}" for i in range(20)]}}))
+        project_a, project_b = _scalar_row(
+            """
+            SELECT MIN(project_id), MAX(project_id) FROM Projects WHERE leader_id = :leader_id AND topic LIKE :topic
+            """, leader_id=leader_id, topic=f"query budget check {suffix} %")
+
+        c.check("status", "PUT", (f"/projects/{project_a}/status", {"json": {"new_status": "In_Progress", "leader_id": leader_id}}))
+        c.check("delete", "DELETE", (f"/projects/{project_a}", {"json": {"leader_id": leader_id}}))
+
+        # applications
+        c.check("apply", "POST", (f"/projects/{project_b}/apply", {"json": {
+            "applicant_id": applicant_id, "applicant_date": today.isoformat(), "motivation": "query budget check"}}))
+        few_apps, many_apps = _fewest_and_most(
+            "SELECT s.uid, COUNT(a.application_id) FROM Students s LEFT JOIN Applications a ON a.applicant_id = s.uid GROUP BY s.uid")
+        c.check("applications fewest/most", "GET", ("/applications/me", {"params": {"current_user_id": few_apps}}),
+                ("/applications/me", {"params": {"current_user_id": many_apps}}))
+        few_proj, many_proj = _fewest_and_most(
+            "SELECT p.project_id || ':' || p.leader_id, COUNT(a.application_id) FROM Projects p "
+            "LEFT JOIN Applications a ON a.project_id = p.project_id GROUP BY p.project_id")
+        for reviews in ("all", "stats", "recent"):
+            c.check(f"applicants fewest/most reviews={reviews}", "GET",
+                    ("/projects/{}/applications".format(few_proj.split(":", 1)[0]),
+                     {"params": {"current_user_id": few_proj.split(":", 1)[1], "reviews": reviews}}),
+                    ("/projects/{}/applications".format(many_proj.split(":", 1)[0]),
+                     {"params": {"current_user_id": many_proj.split(":", 1)[1], "reviews": reviews}}))
+        # order=score: 지원자가 없으면 점수 계산 후 바로 끝나므로 지원자가 1명 이상인 프로젝트끼리 비교
+        few_ranked, many_ranked = _fewest_and_most(
+            "SELECT p.project_id || ':' || p.leader_id, COUNT(a.application_id) FROM Projects p "
+            "JOIN Applications a ON a.project_id = p.project_id GROUP BY p.project_id")
+        c.check("applicants fewest/most order=score", "GET",
+                ("/projects/{}/applications".format(few_ranked.split(":", 1)[0]),
+                 {"params": {"current_user_id": few_ranked.split(":", 1)[1], "order": "score", "limit": 20}}),
+                ("/projects/{}/applications".format(many_ranked.split(":", 1)[0]),
+                 {"params": {"current_user_id": many_ranked.split(":", 1)[1], "order": "score", "limit": 20}}))
+        c.check("accept", "PUT", (f"/projects/{project_b}/applications/{applicant_id}/status",
+                                  {"json": {"new_status": "Accepted", "leader_id": leader_id}}))
+        # 팀 구성 제안 (리더의 전체 프로젝트 / 프로젝트 하나) 후 가입한 학생의 지원을 일괄 수락
+        c.check("led / one project", "GET", ("/applications/team-formation", {"params": {"current_user_id": leader_id}}),
+                ("/applications/team-formation", {"params": {"current_user_id": leader_id, "project_id": project_b}}))
+        client.post(f"/projects/{project_b}/apply", json={
+            "applicant_id": uid, "applicant_date": today.isoformat(), "motivation": "query budget check"})
+        c.check("bulk accept", "POST", (f"/projects/{project_b}/applications/accept",
+                                        {"json": {"leader_id": leader_id, "applicant_ids": [uid]}}))
+
+        # reviews: 완료 처리 후 리뷰 작성 / 작성 상태 (멤버가 가장 적은 / 많은 완료 프로젝트)
+        client.put(f"/projects/{project_b}/status", json={"new_status": "Completed", "leader_id": leader_id})
+        c.check("review", "POST", (f"/projects/{project_b}/reviews", {"json": {
+            "reviewer_id": leader_id, "reviewee_id": applicant_id, "score": 5, "comment": "query budget check"}}))
+        few_done, many_done = _fewest_and_most(
+            "SELECT p.project_id || ':' || p.leader_id, ps.accepted_members FROM Projects p "
+            "JOIN Project_Stats ps ON ps.project_id = p.project_id WHERE p.status = 'Completed'")
+        c.check("members fewest/most", "GET",
+                ("/projects/{}/reviews/status".format(few_done.split(":", 1)[0]), {"params": {"reviewer_id": few_done.split(":", 1)[1]}}),
+                ("/projects/{}/reviews/status".format(many_done.split(":", 1)[0]), {"params": {"reviewer_id": many_done.split(":", 1)[1]}}))
+
+        # system
+        for path in ("/system/cache", "/system/hashing", "/system/pool"):
+            c.check("stats", "GET", (path, {}))
+
+        # 모든 API 라우트가 예산을 선언하고 검사되었는지
+        for route in app.routes:
+            if not isinstance(route, APIRoute) or not route.include_in_schema:
+                continue
+            for method in route.methods:
+                if (method, route.path) not in QUERY_BUDGETS:
+                    c.failures.append(f"{method} {route.path}: QUERY_BUDGETS에 예산이 없습니다.")
+                elif (method, route.path) not in c.covered:
+                    c.failures.append(f"{method} {route.path}: 검사되지 않았습니다.")
+
+    if c.failures:
+        print(f"\n!!! 실패 {len(c.failures)}건")
+        for failure in c.failures:
+            print(f"    {failure}")
+        sys.exit(1)
+    print("\n모든 엔드포인트가 SQL 문 수 예산 이내입니다.")
+
+
+if __name__ == "__main__":
+    main()
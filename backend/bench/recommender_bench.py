@@ -0,0 +1,148 @@
+"""
+추천 프로젝트 (GET /projects/recommended) 벤치마크
+
+모집 중인 프로젝트 --projects개(각각 요구 스킬 1~--max-skills개)를 만들어, 학생 한 명의 상위 --limit개 추천 시간(p50/p99)을 비교한다.
+    - sql: 요청마다 Student_Skills x Project_Required_Skills 조인/집계/정렬 (LIMIT k)
+    - index: 메모리 인덱스(crud/recommender.py)의 점수 계산만 (ProjectSkillIndex.top_k)
+    - endpoint: get_recommended_projects 전체 (학생 조회 + top_k + 상위 k개 행 조회)
+인덱스 전체 로드 시간(서버 시작/재구성 비용)도 함께 출력한다.
+검사용 데이터(uid/topic bench_rec_...)는 관리자 계정으로 커밋해 만들고 끝나면 지운다. 개발/벤치마크 DB에서 실행한다.
+(행 단위 트리거(부모 row_version, Project_Stats)를 건너뛰도록 session_replication_role = replica로 넣고 지우며,
+ Entity_Versions만 직접 올린다. 관리자 계정이 superuser여야 한다.)
+
+실행 (backend 디렉터리에서):
+    python -m bench.recommender_bench
+    python -m bench.recommender_bench --projects 200000 --student-skills 10 --repeat 50
+"""
+import argparse
+import time
+from datetime import date
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from bench.applicants_bench import _measure
+from db.init_db import admin_database_url
+from db.session import SessionLocal
+from crud.recommender import project_recommender, get_recommended_projects
+
+_PREFIX = "bench_rec_"
+
+_SQL = """
+SELECT prs.project_id,
+    count(*) / sqrt(p.skill_count * CAST(:student_skill_count AS float8)) AS score
+FROM Project_Required_Skills prs
+JOIN (
+    SELECT p.project_id, p.deadline, count(*) AS skill_count
+    FROM Projects p
+    JOIN Project_Required_Skills ps ON ps.project_id = p.project_id
+    WHERE p.status = 'Recruiting' AND p.deadline >= CURRENT_DATE
+    GROUP BY p.project_id
+) p ON p.project_id = prs.project_id
+WHERE prs.skill_id IN (SELECT skill_id FROM Student_Skills WHERE uid = :uid)
+GROUP BY prs.project_id, p.skill_count, p.deadline
+ORDER BY score DESC, p.deadline ASC, prs.project_id ASC
+LIMIT :limit
+"""
+
+
+def _bulk_mode(conn) -> None:
+    """
+    이 트랜잭션에서 트리거를 끄고, 커밋 전에 Entity_Versions를 올림 (캐시가 변경을 알 수 있도록)
+    추천 인덱스는 새 프로젝트를 changed_xid 기본값으로 찾고, 지운 프로젝트는 추천 결과를 만들 때 뺀다.
+    """
+    conn.execute(text("SET LOCAL session_replication_role = replica"))
+    conn.execute(text("UPDATE Entity_Versions SET version = version + 1 WHERE entity IN ('projects', 'students')"))
+
+
+def _create_data(conn, projects: int, max_skills: int, student_skills: int) -> None:
+    """
+    리더 1명, 학생 1명(스킬 student_skills개), 모집 중인 프로젝트 projects개 생성
+    """
+    _bulk_mode(conn)
+    conn.execute(text(
+        "INSERT INTO Students (uid, name, hashed_password) VALUES (:prefix || 'leader', 'leader', 'x'), (:prefix || 'student', 'student', 'x')"
+    ), {"prefix": _PREFIX})
+    conn.execute(text(
+        """
+        INSERT INTO Student_Skills (uid, skill_id)
+        SELECT :prefix || 'student', skill_id FROM Skills ORDER BY random() LIMIT :student_skills
+        """
+    ), {"prefix": _PREFIX, "student_skills": student_skills})
+    conn.execute(text(
+        """
+        INSERT INTO Projects (leader_id, topic, description1, description2, capacity, deadline)
+        SELECT :prefix || 'leader', :prefix || j, '-', '-', 2 + j % 5, CURRENT_DATE + 1 + j % 90
+        FROM generate_series(1, :projects) j
+        """
+    ), {"prefix": _PREFIX, "projects": projects})
+    conn.execute(text(
+        """
+        INSERT INTO Project_Required_Skills (project_id, skill_id)
+        SELECT DISTINCT p.project_id, sk.skill_ids[1 + floor(random() * array_length(sk.skill_ids, 1))::int]
+        FROM Projects p
+        CROSS JOIN (SELECT array_agg(skill_id) AS skill_ids FROM Skills) sk
+        CROSS JOIN LATERAL generate_series(1, 1 + (p.project_id % :max_skills)) n
+        WHERE p.leader_id = :prefix || 'leader'
+        """
+    ), {"prefix": _PREFIX, "max_skills": max_skills})
+    conn.execute(text("ANALYZE Projects, Project_Required_Skills, Student_Skills"))
+
+
+def _drop_data(conn) -> None:
+    _bulk_mode(conn)
+    params = {"pattern": _PREFIX + "%"}
+    conn.execute(text(
+        "DELETE FROM Project_Required_Skills WHERE project_id IN (SELECT project_id FROM Projects WHERE leader_id LIKE :pattern)"
+    ), params)
+    conn.execute(text("DELETE FROM Projects WHERE leader_id LIKE :pattern"), params)
+    conn.execute(text("DELETE FROM Student_Skills WHERE uid LIKE :pattern"), params)
+    conn.execute(text("DELETE FROM Students WHERE uid LIKE :pattern"), params)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추천 프로젝트 벤치마크")
+    parser.add_argument("--projects", type=int, default=100000)
+    parser.add_argument("--max-skills", type=int, default=6, help="프로젝트 1개의 최대 요구 스킬 수")
+    parser.add_argument("--student-skills", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    admin_engine = create_engine(admin_database_url(), poolclass=NullPool)
+    try:
+        with admin_engine.begin() as conn:
+            _drop_data(conn)
+            _create_data(conn, args.projects, args.max_skills, args.student_skills)
+        uid = _PREFIX + "student"
+
+        with SessionLocal() as db:
+            started = time.perf_counter()
+            project_recommender.load(db)
+            load_ms = (time.perf_counter() - started) * 1000
+            skill_ids = db.execute(text("SELECT skill_id FROM Student_Skills WHERE uid = :uid"), {"uid": uid}).scalars().all()
+        stats = project_recommender.stats()
+        print(f"모집 중인 프로젝트 {stats['projects']}개, 스킬 {stats['skills']}개, 학생 스킬 {len(skill_ids)}개, "
+              f"인덱스 로드 {load_ms:.0f} ms")
+
+        def sql():
+            with SessionLocal() as db:
+                return len(db.execute(text(_SQL), {"uid": uid, "student_skill_count": len(skill_ids), "limit": args.limit}).fetchall())
+
+        def index():
+            return len(project_recommender._index.top_k(skill_ids, args.limit, date.today()))
+
+        def endpoint():
+            with SessionLocal() as db:
+                return len(get_recommended_projects(db, uid, args.limit))
+
+        print(f"{'mode':<10}{'p50 ms':>10}{'p99 ms':>10}{'rows':>8}")
+        for name, fn in (("sql", sql), ("index", index), ("endpoint", endpoint)):
+            p50, p99, rows = _measure(fn, args.repeat)
+            print(f"{name:<10}{p50:>10.2f}{p99:>10.2f}{rows:>8}")
+    finally:
+        with admin_engine.begin() as conn:
+            _drop_data(conn)
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
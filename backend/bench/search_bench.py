@@ -0,0 +1,86 @@
+"""
+프로젝트 검색 벤치마크
+
+기존 ILIKE 부분 일치(contains)와 search_vector GIN 인덱스 기반 전문 검색(fulltext)/접두어 검색(prefix)의
+목록 조회 지연 시간을 테이블 크기별로 비교한다.
+목록 캐시(project_cache)를 거치지 않도록 실제 조회(_fetch_all_projects)를 직접 호출한다.
+합성 프로젝트는 하나의 트랜잭션 안에서 단계적으로 추가되며, 측정이 끝나면 ROLLBACK 하므로 DB에 남지 않는다.
+
+실행 (backend 디렉터리에서):
+    python -m bench.search_bench --sizes 10000,100000,300000 --repeat 20
+"""
+import argparse
+import statistics
+import time
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from db.session import engine
+from crud.crud_projects import _fetch_all_projects
+
+# 합성 데이터용 단어 목록 (뒤쪽 단어일수록 드물게 등장)
+WORDS = [
+    "프로젝트", "팀원", "모집", "개발", "스터디", "웹", "앱", "서비스", "플랫폼", "데이터",
+    "react", "spring", "python", "backend", "frontend", "design", "ai", "mobile", "cloud", "api",
+    "캡스톤", "해커톤", "공모전", "알고리즘", "추천", "시각화", "블록체인", "게임", "보안", "로봇",
+]
+
+INSERT_SQL = """
+INSERT INTO Projects (leader_id, topic, description1, description2, capacity, deadline, status)
+SELECT
+    :leader_id,
+    (SELECT string_agg(w[1 + n * 0 + floor(power(random(), 2) * array_length(w, 1))::int], ' ') FROM generate_series(1, 4 + g % 2) AS n),
+    (SELECT string_agg(w[1 + n * 0 + floor(power(random(), 2) * array_length(w, 1))::int], ' ') FROM generate_series(1, 10 + g % 2) AS n),
+    (SELECT string_agg(w[1 + n * 0 + floor(power(random(), 2) * array_length(w, 1))::int], ' ') FROM generate_series(1, 40 + g % 2) AS n),
+    2 + (g % 5),
+    CURRENT_DATE + ((g % 120) - 30),
+    (ARRAY['Recruiting', 'In_Progress', 'Completed'])[1 + g % 3]
+FROM generate_series(1, :count) AS g, (SELECT CAST(:words AS text[]) AS w) AS vocab
+"""
+
+
+def _measure(db: Session, search: str, mode: str, repeat: int, limit: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _fetch_all_projects(db, "deadline", "All", search, limit, None, mode)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return statistics.median(timings), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ILIKE vs tsvector 검색 벤치마크")
+    parser.add_argument("--sizes", default="10000,100000", help="측정할 합성 프로젝트 수 (쉼표 구분, 누적)")
+    parser.add_argument("--terms", default="스터디,블록체인,로봇", help="검색어 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=10, help="검색어/모드별 반복 횟수")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기 (타입어헤드 한 화면)")
+    args = parser.parse_args()
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    terms = [t.strip() for t in args.terms.split(",") if t.strip()]
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        db = Session(bind=conn, join_transaction_mode="create_savepoint")
+        try:
+            conn.execute(text(
+                "INSERT INTO Students (uid, name, hashed_password) VALUES ('bench_leader', 'bench', '-') ON CONFLICT (uid) DO NOTHING"
+            ))
+            inserted = 0
+            print(f"{'rows':>8} {'term':<10} {'mode':<9} {'p50(ms)':>9} {'p95(ms)':>9}")
+            for size in sizes:
+                conn.execute(text(INSERT_SQL), {"leader_id": "bench_leader", "count": size - inserted, "words": WORDS})
+                conn.execute(text("ANALYZE Projects"))
+                inserted = size
+                for term in terms:
+                    for mode in ("contains", "fulltext", "prefix"):
+                        p50, p95 = _measure(db, term, mode, args.repeat, args.limit)
+                        print(f"{size:>8} {term:<10} {mode:<9} {p50:>9.2f} {p95:>9.2f}")
+        finally:
+            db.close()
+            trans.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+목록 응답 직렬화 벤치마크
+
+DB 없이 get_all_projects 결과와 같은 모양의 행을 만들어, 같은 목록을 두 경로로 응답할 때의
+시간(p50)과 응답 크기를 1k/10k/100k건에서 비교한다.
+    - pydantic: 행마다 ProjectListItem(**p) 생성 -> FastAPI의 response_model 검증 -> 표준 json 인코딩 (기존 경로)
+    - fast: project_list_rows로 응답 모양 dict 생성 -> FastJSONResponse(orjson, 없으면 표준 json)
+두 경로 모두 실제 FastAPI 라우트로 호출하므로 라우팅/응답 처리 비용이 똑같이 포함된다.
+
+실행 (backend 디렉터리에서):
+    python -m bench.serialization_bench
+    python -m bench.serialization_bench --sizes 1000 10000 --repeat 10
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from schemas.schemas import ProjectListItem, ProjectListResponse
+from api.responses import JSON_ENCODER, FastJSONResponse, project_list_rows
+
+_SKILLS = ["python", "react", "rust", "go", "typescript", "spring", "django", "figma", "kotlin", "sql"]
+
+
+def _make_rows(n: int) -> list[dict]:
+    rng = random.Random(n)
+    today = date.today()
+    return [
+        {
+            "project_id": i,
+            "leader_id": f"student_{i % 500}",
+            "topic": f"프로젝트 {i} 팀원 모집",
+            "description1": "웹 서비스를 함께 만들 팀원을 찾습니다. " * 2,
+            "capacity": rng.randint(2, 8),
+            "deadline": today + timedelta(days=rng.randint(0, 60)),
+            "status": "Recruiting",
+            "leader_name": f"학생{i % 500}",
+            "skills": rng.sample(_SKILLS, rng.randint(0, 4)),
+            "members_count": rng.randint(1, 4),
+            "search_rank": Decimal(f"0.{rng.randint(0, 999999):06d}") if i % 2 else None,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def _build_app(rows: list[dict]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/pydantic", response_model=ProjectListResponse)
+    def pydantic_path() -> ProjectListResponse:
+        items = [ProjectListItem(**p) for p in rows]
+        return ProjectListResponse(projects=items, next_cursor=None)
+
+    @app.get("/fast", response_model=ProjectListResponse)
+    def fast_path():
+        return FastJSONResponse({"projects": project_list_rows(rows), "next_cursor": None})
+
+    return app
+
+
+def _measure(client: TestClient, path: str, repeat: int) -> tuple[float, int]:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = client.get(path)
+        timings.append((time.perf_counter() - start) * 1000)
+        size = len(res.content)
+    return statistics.median(timings), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화: pydantic 경로 vs fast 경로")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="목록 건수")
+    parser.add_argument("--repeat", type=int, default=0, help="경로별 반복 횟수 (기본: 건수에 따라 자동)")
+    args = parser.parse_args()
+
+    print(f"encoder={JSON_ENCODER}")
+    print(f"{'items':>8}{'pydantic ms':>14}{'fast ms':>10}{'speedup':>9}{'bytes':>12}  same")
+    for n in args.sizes:
+        rows = _make_rows(n)
+        repeat = args.repeat or max(3, 200_000 // n // 10)
+        with TestClient(_build_app(rows)) as client:
+            same = json.loads(client.get("/pydantic").content) == json.loads(client.get("/fast").content)
+            slow_ms, size = _measure(client, "/pydantic", repeat)
+            fast_ms, _ = _measure(client, "/fast", repeat)
+        print(f"{n:>8}{slow_ms:>14.1f}{fast_ms:>10.1f}{slow_ms / fast_ms:>8.1f}x{size:>12}  {same}")
+
+
+if __name__ == "__main__":
+    main()
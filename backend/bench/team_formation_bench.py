@@ -0,0 +1,152 @@
+"""
+팀 구성 제안 (crud/team_formation.py) 벤치마크
+
+학생 --students명이 인기도가 치우친(Zipf) 모집 중인 프로젝트 --projects개에 모두 --applications건 지원한 상황을 만들어,
+    - greedy: 리더가 먼저 지원한 순서대로 남은 자리까지 수락하는 경우 (한 학생이 여러 프로젝트에 수락될 수 있음)
+    - optimizer: 옥션 알고리즘 배정 (학생당 최대 한 프로젝트)
+의 배정 수 / 중복 수락 학생 수 / 평균 스킬 충족률과, DB 조회와 배정 계산 시간을 비교한다.
+검사용 데이터(uid bench_tf_...)는 관리자 계정으로 커밋해 만들고 끝나면 지운다. 개발/벤치마크 DB에서 실행한다.
+(행 단위 트리거를 건너뛰도록 session_replication_role = replica로 넣고 지우며, Entity_Versions만 직접 올린다.
+ 관리자 계정이 superuser여야 한다.)
+
+실행 (backend 디렉터리에서):
+    python -m bench.team_formation_bench
+    python -m bench.team_formation_bench --students 10000 --projects 2000 --applications 30000
+"""
+import argparse
+import time
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from db.init_db import admin_database_url
+from db.session import SessionLocal
+from crud.team_formation import load_team_formation_input, solve_team_formation
+
+_PREFIX = "bench_tf_"
+
+
+def _bulk_mode(conn) -> None:
+    conn.execute(text("SET LOCAL session_replication_role = replica"))
+    conn.execute(text("UPDATE Entity_Versions SET version = version + 1 WHERE entity IN ('projects', 'students', 'applications')"))
+
+
+def _create_data(conn, students: int, projects: int, applications: int) -> None:
+    """
+    학생 students명(스킬 2~4개), 리더 1명, 프로젝트 projects개(요구 스킬 1~4개, 리더 포함 정원 2~6명),
+    지원 applications건 (프로젝트 번호가 작을수록 인기가 많음)
+    """
+    _bulk_mode(conn)
+    conn.execute(text(
+        """
+        INSERT INTO Students (uid, name, hashed_password)
+        SELECT :prefix || 's' || i, 's' || i, 'x' FROM generate_series(1, :students) i
+        UNION ALL SELECT :prefix || 'leader', 'leader', 'x'
+        """
+    ), {"prefix": _PREFIX, "students": students})
+    conn.execute(text(
+        """
+        INSERT INTO Student_Skills (uid, skill_id)
+        SELECT DISTINCT :prefix || 's' || i, sk.skill_ids[1 + (i * 7 + n * 13) % 30]
+        FROM generate_series(1, :students) i
+        CROSS JOIN (SELECT array_agg(skill_id ORDER BY skill_id) AS skill_ids FROM Skills) sk
+        CROSS JOIN LATERAL generate_series(1, 2 + i % 3) n
+        """
+    ), {"prefix": _PREFIX, "students": students})
+    conn.execute(text(
+        """
+        INSERT INTO Projects (leader_id, topic, description1, description2, capacity, deadline)
+        SELECT :prefix || 'leader', :prefix || j, '-', '-', 2 + j % 5, CURRENT_DATE + 30
+        FROM generate_series(1, :projects) j
+        """
+    ), {"prefix": _PREFIX, "projects": projects})
+    conn.execute(text(
+        """
+        INSERT INTO Project_Required_Skills (project_id, skill_id)
+        SELECT DISTINCT p.project_id, sk.skill_ids[1 + (p.project_id * 11 + n * 17) % 30]
+        FROM Projects p
+        CROSS JOIN (SELECT array_agg(skill_id ORDER BY skill_id) AS skill_ids FROM Skills) sk
+        CROSS JOIN LATERAL generate_series(1, 1 + p.project_id % 4) n
+        WHERE p.leader_id = :prefix || 'leader'
+        """
+    ), {"prefix": _PREFIX})
+    # 프로젝트 순위 r을 1/r^0.8에 비례하는 확률로 고름 (역변환 근사)
+    conn.execute(text(
+        """
+        INSERT INTO Applications (project_id, applicant_id, applicant_date, motivation)
+        SELECT DISTINCT ON (p.project_id, t.uid) p.project_id, t.uid, CURRENT_DATE - (t.k % 14), '-'
+        FROM (
+            SELECT k, :prefix || 's' || (1 + floor(random() * :students)::int) AS uid,
+                LEAST(:projects, floor(power(random() * (power(:projects, 0.2) - 1) + 1, 5))::int) AS r
+            FROM generate_series(1, :applications) k
+        ) t
+        JOIN (SELECT project_id, row_number() OVER (ORDER BY project_id) AS r
+              FROM Projects WHERE leader_id = :prefix || 'leader') p ON p.r = t.r
+        """
+    ), {"prefix": _PREFIX, "students": students, "projects": projects, "applications": applications})
+    conn.execute(text("ANALYZE Students, Student_Skills, Projects, Project_Required_Skills, Applications"))
+
+
+def _drop_data(conn) -> None:
+    _bulk_mode(conn)
+    params = {"pattern": _PREFIX + "%"}
+    conn.execute(text(
+        "DELETE FROM Applications WHERE project_id IN (SELECT project_id FROM Projects WHERE leader_id LIKE :pattern)"
+    ), params)
+    conn.execute(text(
+        "DELETE FROM Project_Required_Skills WHERE project_id IN (SELECT project_id FROM Projects WHERE leader_id LIKE :pattern)"
+    ), params)
+    conn.execute(text("DELETE FROM Projects WHERE leader_id LIKE :pattern"), params)
+    conn.execute(text("DELETE FROM Student_Skills WHERE uid LIKE :pattern"), params)
+    conn.execute(text("DELETE FROM Students WHERE uid LIKE :pattern"), params)
+
+
+def _greedy(applications, projects) -> list[tuple[int, int, str, float]]:
+    """
+    프로젝트마다 먼저 지원한 순서(application_id)대로 남은 자리까지 수락
+    """
+    seats = {project_id: seat_count for project_id, seat_count, _ in projects}
+    required = {project_id: required_count for project_id, _, required_count in projects}
+    accepted = []
+    for application_id, project_id, applicant_id, matched_count in applications:
+        if seats.get(project_id, 0) > 0:
+            seats[project_id] -= 1
+            accepted.append((application_id, project_id, applicant_id,
+                             matched_count / required[project_id] if required[project_id] else 0.0))
+    return accepted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="팀 구성 제안 벤치마크")
+    parser.add_argument("--students", type=int, default=3000)
+    parser.add_argument("--projects", type=int, default=800)
+    parser.add_argument("--applications", type=int, default=10000)
+    args = parser.parse_args()
+
+    admin_engine = create_engine(admin_database_url(), poolclass=NullPool)
+    try:
+        with admin_engine.begin() as conn:
+            _drop_data(conn)
+            _create_data(conn, args.students, args.projects, args.applications)
+
+        with SessionLocal() as db:
+            started = time.perf_counter()
+            applications, projects = load_team_formation_input(db)
+            load_ms = (time.perf_counter() - started) * 1000
+        seats = sum(seat_count for _, seat_count, _ in projects)
+        print(f"대기 중인 지원 {len(applications)}건, 모집 중인 프로젝트 {len(projects)}개 / 남은 자리 {seats}개, DB 조회 {load_ms:.0f} ms")
+
+        print(f"{'mode':<11}{'ms':>9}{'assigned':>10}{'dup':>7}{'students':>10}{'coverage':>10}")
+        for name, solve in (("greedy", _greedy), ("optimizer", solve_team_formation)):
+            started = time.perf_counter()
+            result = solve(applications, projects)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            students = {applicant_id for _, _, applicant_id, _ in result}
+            coverage = sum(c for *_, c in result) / len(result) if result else 0.0
+            print(f"{name:<11}{elapsed_ms:>9.0f}{len(result):>10}{len(result) - len(students):>7}{len(students):>10}{coverage:>10.3f}")
+    finally:
+        with admin_engine.begin() as conn:
+            _drop_data(conn)
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+프로젝트 목록/상세 조회 결과를 위한 프로세스 내 캐시 (TTL + LRU)
+
+- 키: 정규화된 조회 파라미터 튜플 (버전은 키에 넣지 않음)
+- 태그: 각 항목이 어떤 데이터에 의존하는지 표시 (예: "list", "project:3", "student:kim")
+  쓰기 경로(crud)는 커밋 후 영향을 받는 태그만 invalidate() 한다.
+- 모집 마감(CURRENT_DATE) 기준이 바뀌는 자정이 지나면 전날 저장된 항목은 모두 만료된다.
+- 워커(프로세스)별 캐시이므로 다른 워커의 쓰기는 TTL 이내에 반영된다.
+  ETag용으로 먼저 읽은 버전을 get/set에 넘기면 저장된 버전과 다를 때 미스로 처리하고 같은 키에 덮어쓴다.
+  (쓰기마다 새 키가 생겨 이전 항목이 LRU 밖으로 밀릴 때까지 남는 일이 없음)
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from dotenv import load_dotenv
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+PROJECT_CACHE_ENABLED = os.getenv("PROJECT_CACHE_ENABLED", "1") == "1"
+PROJECT_CACHE_TTL = float(os.getenv("PROJECT_CACHE_TTL", "30"))
+PROJECT_CACHE_MAXSIZE = int(os.getenv("PROJECT_CACHE_MAXSIZE", "512"))
+
+# 태그 이름
+LIST_TAG = "list"
+
+
+def project_tag(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def detail_tag(project_id: int) -> str:
+    return f"detail:{project_id}"
+
+
+def student_tag(uid: str) -> str:
+    return f"student:{uid}"
+
+
+class QueryCache:
+    """
+    태그 기반 무효화를 지원하는 TTL + LRU 캐시
+    """
+
+    def __init__(self, maxsize: int, ttl: float, enabled: bool = True):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, day, value, tags, version)
+        self._tags: dict[str, set] = {}
+        self._lock = threading.Lock()
+        # 무효화가 일어날 때마다 증가. 조회 도중 무효화가 있었으면 그 결과는 저장하지 않는다.
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key, version=None):
+        """
+        - version: 지금 읽은 데이터 버전. 주어지면 저장할 때의 버전과 같은 항목만 반환한다.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, day, value, _, stored_version = entry
+            if (expires_at < time.monotonic() or day != date.today()
+                    or (version is not None and stored_version != version)):
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, tags=(), generation: int | None = None, version=None) -> None:
+        """
+        - generation: 조회 시작 전에 읽어 둔 self.generation 값
+          그 사이에 무효화가 있었다면 오래된 결과일 수 있으므로 저장하지 않는다.
+        - version: 조회 전에 읽어 둔 데이터 버전 (get 참고)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            tags = frozenset(tags)
+            self._entries[key] = (time.monotonic() + self.ttl, date.today(), value, tags, version)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        주어진 태그 중 하나라도 가진 항목을 모두 제거
+        """
+        with self._lock:
+            self.generation += 1
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[3]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+project_cache = QueryCache(PROJECT_CACHE_MAXSIZE, PROJECT_CACHE_TTL, PROJECT_CACHE_ENABLED)
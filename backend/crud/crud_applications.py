@@ -1,10 +1,20 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from datetime import date
+import numpy as np
+from crud.pagination import decode_cursor, paginate
+from crud.cache import project_cache, project_tag, detail_tag
+from db.session import role_transaction
+from crud.crud_skills import skill_dictionary
 
 def apply_to_project(db: Session, project_id: int, applicant_id: str, applicant_date: str, motivation: str) -> None:
     """
     프로젝트 지원
     """
+    # asyncpg 드라이버는 DATE 파라미터에 date 객체를 요구하므로 미리 변환 (형식 오류는 ValueError)
+    if isinstance(applicant_date, str):
+        applicant_date = date.fromisoformat(applicant_date)
+
     db.execute(text(
         """
         INSERT INTO Applications (project_id, applicant_id, applicant_date, motivation)
@@ -20,13 +30,25 @@ def apply_to_project(db: Session, project_id: int, applicant_id: str, applicant_
     )
     db.commit()
 
+    # 지원 여부(can_apply)가 바뀌므로 상세 조회만 무효화
+    project_cache.invalidate(detail_tag(project_id))
+
 
-def get_applications_by_applicant(db: Session, current_user_id: str) -> list[dict] | None:
+def get_applications_by_applicant(db: Session, current_user_id: str, limit: int | None = None, after: str | None = None) -> tuple[list[dict], str | None]:
     """
     내 지원 현황 조회
+
+    - limit/after: 키셋 페이지네이션 (applicant_date DESC, application_id DESC 기준)
+    - 반환: (지원 내역 목록, 다음 페이지 커서)
     """
+    params = {"current_user_id": current_user_id, "limit": limit + 1 if limit is not None else None}
+    after_sql = ""
+    if after:
+        params["after_date"], params["after_id"] = decode_cursor(after, "applicant_date", [date.fromisoformat, int])
+        after_sql = "AND (a.applicant_date, a.application_id) < (:after_date, :after_id)"
+
     result = db.execute(text(
-        """
+        f"""
         SELECT 
             a.application_id    AS application_id,
             a.project_id        AS project_id,
@@ -40,70 +62,181 @@ def get_applications_by_applicant(db: Session, current_user_id: str) -> list[dic
             JOIN Projects p ON a.project_id = p.project_id
             JOIN Students s ON p.leader_id = s.uid
         WHERE a.applicant_id = :current_user_id
-        ORDER BY a.applicant_date DESC
+            {after_sql}
+        ORDER BY a.applicant_date DESC, a.application_id DESC
+        LIMIT :limit
         """
     ), 
-    {"current_user_id": current_user_id}
+    params
     )
 
     rows = result.mappings().all()
     applications = [dict(r) for r in rows]
-    return applications
+    return paginate(applications, limit, "applicant_date", lambda a: [a["applicant_date"], a["application_id"]])
+
+
+# 지원자 목록의 리뷰 열 (reviews 모드별)
+#   모든 모드에 리뷰 통계(리뷰 수/평균/점수 히스토그램/평판 점수)가 포함된다. (Student_Reputation 한 행)
+#   all: 전체 리뷰 / stats: 리뷰 통계만 / recent: 최근 리뷰 review_limit개 (인덱스로 지원자당 N행만 읽음)
+_APPLICANT_REVIEW_STATS = "applicant_review_count, applicant_avg_score, applicant_score_histogram, applicant_reputation_score"
+_APPLICANT_REVIEW_COLUMNS = {
+    "all": f"{_APPLICANT_REVIEW_STATS}, applicant_reviews",
+    "stats": _APPLICANT_REVIEW_STATS,
+    "recent": f"{_APPLICANT_REVIEW_STATS}, COALESCE(recent.reviews, '[]'::json) AS applicant_reviews",
+}
+
+_RECENT_REVIEWS_JOIN = """
+LEFT JOIN LATERAL (
+    SELECT json_agg(json_build_object('score', r.score, 'comment', r.comment) ORDER BY r.review_id DESC) AS reviews
+    FROM (
+        SELECT pr.review_id, pr.score, pr.comment
+        FROM Peer_Reviews pr
+        WHERE pr.reviewee_id = v.applicant_id
+        ORDER BY pr.review_id DESC
+        LIMIT :review_limit
+    ) r
+) recent ON true
+"""
+
+# order=score: 순위 점수 = 요구 스킬 충족률 x 0.7 + 평판 점수 x 0.3 (둘 다 0~1)
+APPLICANT_RANK_SKILL_WEIGHT = 0.7
+APPLICANT_RANK_REPUTATION_WEIGHT = 0.3
+# 점수 계산 시 한 번에 읽는 지원자 수 (서버 측 커서, 메모리에는 이 크기 + 상위 limit개만 유지)
+APPLICANT_RANK_BATCH_SIZE = 2000
+
+
+def _top_applicants(rows, required_skill_ids: list[int], limit: int | None) -> list[tuple[int, float, float]]:
+    """
+    (application_id, applicant_skill_ids, applicant_reputation_score) 행을 배치 단위로 받아 순위 점수 상위 limit개 반환
+    -> [(application_id, 순위 점수, 스킬 충족률)] 점수 내림차순, 동점이면 먼저 지원한 순(application_id)
+
+    배치마다 NumPy로 한 번에 계산한다: 스킬 id를 1차원으로 펼쳐 np.isin으로 요구 스킬 여부를 구하고,
+    np.bincount로 지원자별 충족 개수를 센 뒤, 이전 상위 limit개와 합쳐 다시 상위 limit개만 남긴다.
+    """
+    required = np.asarray(sorted(set(required_skill_ids)), dtype=np.int64)
+    top_ids = np.empty(0, dtype=np.int64)
+    top_scores = np.empty(0, dtype=np.float64)
+    top_coverage = np.empty(0, dtype=np.float64)
+
+    for batch in rows:
+        size = len(batch)
+        ids = np.fromiter((r[0] for r in batch), dtype=np.int64, count=size)
+        reputation = np.fromiter((r[2] for r in batch), dtype=np.float64, count=size)
+        if required.size:
+            lengths = np.fromiter((len(r[1]) for r in batch), dtype=np.int64, count=size)
+            skills = np.fromiter((s for r in batch for s in r[1]), dtype=np.int64, count=int(lengths.sum()))
+            owners = np.repeat(np.arange(size), lengths)
+            matched = np.bincount(owners, weights=np.isin(skills, required), minlength=size)
+            coverage = matched / required.size
+        else:
+            coverage = np.zeros(size)
+        scores = APPLICANT_RANK_SKILL_WEIGHT * coverage + APPLICANT_RANK_REPUTATION_WEIGHT * reputation
+
+        top_ids = np.concatenate((top_ids, ids))
+        top_scores = np.concatenate((top_scores, scores))
+        top_coverage = np.concatenate((top_coverage, coverage))
+        if limit is not None and top_ids.size > limit:
+            order = np.lexsort((top_ids, -top_scores))[:limit]
+            top_ids, top_scores, top_coverage = top_ids[order], top_scores[order], top_coverage[order]
+
+    order = np.lexsort((top_ids, -top_scores))
+    return list(zip(top_ids[order].tolist(), top_scores[order].round(4).tolist(), top_coverage[order].round(4).tolist()))
 
 
-def get_applications_by_project(db: Session, project_id: int, current_user_id: str) -> list[dict]:
+def get_applications_by_project(db: Session, project_id: int, current_user_id: str, reviews: str = "all",
+                                review_limit: int = 5, order: str = "date", limit: int | None = None) -> list[dict]:
     """
     프로젝트에 대한 지원자 목록 조회 (리더 전용)
     - 호출자의 uid가 프로젝트의 leader_id와 다르면 PermissionError 발생
+    - reviews: all(전체 리뷰, 기본값) / stats(리뷰 통계만) / recent(최근 리뷰 review_limit개, 최신순)
+      리뷰 통계(applicant_review_count, applicant_avg_score, applicant_score_histogram, applicant_reputation_score)는 모든 모드에 포함
+    - order: date(지원일 최신순, 기본값) / score(순위 점수순: 요구 스킬 충족률 + 평판 점수)
+      score면 점수 계산에 필요한 열만 배치로 읽어 상위 limit개를 고른 뒤, 그 지원자들의 전체 행만 조회한다.
+    - limit: 반환할 최대 지원자 수 (없으면 전체)
     """
-    # 1) 프로젝트 존재 및 리더 확인
-    leader_res = db.execute(text("SELECT leader_id FROM Projects WHERE project_id = :project_id"), {"project_id": project_id})
+    # 1) 프로젝트 존재 및 리더 확인 (순위 계산용 요구 스킬도 함께)
+    leader_res = db.execute(text(
+        """
+        SELECT leader_id, ARRAY(SELECT skill_id FROM Project_Required_Skills WHERE project_id = p.project_id) AS skill_ids
+        FROM Projects p WHERE project_id = :project_id
+        """
+    ), {"project_id": project_id})
     leader_row = leader_res.fetchone()
     if not leader_row:
         return None
-    leader_id = leader_row[0]
+    leader_id, required_skill_ids = leader_row
 
     # 2) 권한 검증: 호출자가 리더가 아니면 권한 오류 발생
     if current_user_id != leader_id:
         raise PermissionError("권한이 없습니다. 프로젝트 리더만 접근할 수 있습니다.")
 
-    # 3) 리더이면 뷰에서 지원자 목록 조회
-    # 리더 권한으로 실제 쿼리를 실행: 동일한 물리적 연결에서 SET ROLE leader 후 조회
-    engine = db.get_bind()
-    conn = engine.connect()
-    try:
-        try:
-            conn.execute(text("BEGIN"))
-            conn.execute(text("SET ROLE leader"))
-            result = conn.execute(text(
-                "SELECT * FROM ProjectApplicantsView WHERE project_id = :project_id ORDER BY applicant_date DESC"
-            ), {"project_id": project_id})
-            conn.execute(text("RESET ROLE"))
-            conn.execute(text("COMMIT"))
-        except Exception as e:
-            # SET ROLE 실패나 SELECT 권한 문제 등은 권한 문제로 간주
-            conn.execute(text("ROLLBACK"))
-            raise PermissionError("리더 권한 획득 또는 조회 실패: " + str(e))
+    # 3) 리더이면 같은 트랜잭션에서 리더 권한으로 뷰에서 지원자 목록 조회
+    ranked = None
+    with role_transaction(db, "leader", "리더 권한 획득 또는 조회 실패"):
+        params = {"project_id": project_id, "review_limit": review_limit, "limit": limit}
+        if order == "score":
+            # 점수 계산용 열만 (리뷰/스킬 이름 LATERAL은 참조하지 않으므로 플래너가 건너뜀)
+            result = db.execute(text(
+                """
+                SELECT application_id, applicant_skill_ids, applicant_reputation_score
+                FROM ProjectApplicantsView
+                WHERE project_id = :project_id
+                """
+            ), {"project_id": project_id}, execution_options={"yield_per": APPLICANT_RANK_BATCH_SIZE})
+            ranked = _top_applicants(result.partitions(), required_skill_ids, limit)
+            if not ranked:
+                return []
+            filter_sql, order_sql = "AND application_id = ANY(CAST(:application_ids AS integer[]))", ""
+            params["application_ids"] = [application_id for application_id, _, _ in ranked]
+        else:
+            filter_sql, order_sql = "", "ORDER BY applicant_date DESC, application_id DESC" + (" LIMIT :limit" if limit else "")
 
+        # 스킬은 id 배열(applicant_skill_ids)로 받아 스킬 사전에서 이름으로 변환 (Skills 조인 생략)
+        result = db.execute(text(
+            f"""
+            SELECT leader_id, project_id, application_id, applicant_id, applicant_date,
+                applicant_name, applicant_email, applicant_profile_text, applicant_website_link,
+                applicant_motivation, status, applicant_skill_ids, {_APPLICANT_REVIEW_COLUMNS[reviews]}
+            FROM ProjectApplicantsView v
+            {_RECENT_REVIEWS_JOIN if reviews == "recent" else ""}
+            WHERE project_id = :project_id {filter_sql}
+            {order_sql}
+            """
+        ), params)
         rows = result.mappings().all()
-    finally:
-        conn.close()
     if not rows:
         return []
 
-    applications = [dict(r) for r in rows]
-    return applications
+    applications = []
+    for r in rows:
+        application = dict(r)
+        application["applicant_skills"] = sorted(skill_dictionary.names(db, application.pop("applicant_skill_ids")))
+        applications.append(application)
+    if ranked is None:
+        return applications
+
+    by_id = {a["application_id"]: a for a in applications}
+    ranked_applications = []
+    for application_id, score, coverage in ranked:
+        application = by_id.get(application_id)
+        if application is not None:
+            application["applicant_rank_score"] = score
+            application["applicant_skill_coverage"] = coverage
+            ranked_applications.append(application)
+    return ranked_applications
 
 def update_application_status(db: Session, project_id: int, applicant_id: str, new_status: str, leader_id: str) -> None:
     """
     지원 상태 업데이트 (리더 전용)
     """
     # 1) 지원 정보 조회 (프로젝트 리더인지도 함께 확인)
+    #    프로젝트 행을 잠가 같은 프로젝트의 일괄 수락(accept_applications)과 순서대로 실행되게 함
     result = db.execute(text(
         """
         SELECT p.leader_id
         FROM Applications a JOIN Projects p ON a.project_id = p.project_id
         WHERE a.applicant_id = :applicant_id AND a.project_id = :project_id
+        FOR UPDATE OF p
         """
     ), {"applicant_id": applicant_id, "project_id": project_id})
     # bind project_id as well
@@ -116,33 +249,80 @@ def update_application_status(db: Session, project_id: int, applicant_id: str, n
     if leader_id != project_leader_id:
         raise PermissionError("권한이 없습니다. 프로젝트 리더만 지원 상태를 변경할 수 있습니다.")
 
-    # 3) 지원 상태 업데이트
-    # 리더 권한으로 실제 쿼리를 실행: 동일한 물리적 연결에서 SET ROLE leader 후 UPDATE
-    engine = db.get_bind()
-    conn = engine.connect()
-    try:
-        try:
-            conn.execute(text("BEGIN"))
-            conn.execute(text("SET ROLE leader"))
-            update_result = conn.execute(text(
-                """
-                UPDATE Applications
-                SET status = :new_status
-                WHERE applicant_id = :applicant_id AND project_id = :project_id
-                """
-            ), {
-                "new_status": new_status,
-                "applicant_id": applicant_id,
-                "project_id": project_id,
-            })
-            conn.execute(text("RESET ROLE"))
-            conn.execute(text("COMMIT"))
-        except Exception as e:
-            # SET ROLE 실패나 UPDATE 권한 문제 등은 권한 문제로 간주
-            conn.execute(text("ROLLBACK"))
-            raise PermissionError("리더 권한 획득 또는 업데이트 실패: " + str(e))
-
+    # 3) 같은 트랜잭션에서 리더 권한으로 지원 상태 업데이트
+    with role_transaction(db, "leader", "리더 권한 획득 또는 업데이트 실패"):
+        update_result = db.execute(text(
+            """
+            UPDATE Applications
+            SET status = :new_status
+            WHERE applicant_id = :applicant_id AND project_id = :project_id
+            """
+        ), {
+            "new_status": new_status,
+            "applicant_id": applicant_id,
+            "project_id": project_id,
+        })
         if update_result.rowcount == 0:
             raise ValueError("지원 상태 업데이트에 실패했습니다.")
-    finally:
-        conn.close()
\ No newline at end of file
+
+    # 멤버 수/멤버 목록이 바뀌므로 이 프로젝트가 포함된 목록과 상세를 무효화
+    project_cache.invalidate(project_tag(project_id))
+
+
+def accept_applications(db: Session, project_id: int, leader_id: str, applicant_ids: list[str]) -> int:
+    """
+    대기 중인 지원 여러 건을 한 트랜잭션에서 수락 (리더 전용, 팀 구성 제안 일괄 수락용) -> 수락한 수
+    - 모두 대기(Pending) 상태여야 하고, 수락 후 인원(리더 포함)이 capacity를 넘으면 안 된다. 하나라도 어긋나면 아무것도 바꾸지 않음
+    - 프로젝트 행을 먼저 잠근(FOR UPDATE) 뒤 별도 문장으로 수락 인원/대기 지원을 읽는다.
+      READ COMMITTED에서 새 문장은 잠금을 기다리는 동안 커밋된 변경을 보므로, 같은 프로젝트 행을 잠그는
+      다른 수락(이 함수, update_application_status의 Accepted 변경)과 합쳐도 인원을 넘지 않는다.
+    """
+    applicant_ids = sorted(set(applicant_ids))
+    # 1) 프로젝트 존재/리더 확인 (프로젝트 행 잠금)
+    row = db.execute(text(
+        "SELECT leader_id FROM Projects WHERE project_id = :project_id FOR UPDATE"
+    ), {"project_id": project_id}).fetchone()
+    if not row:
+        db.rollback()
+        raise ValueError("해당 프로젝트를 찾을 수 없습니다.")
+    project_leader_id = row[0]
+    if leader_id != project_leader_id:
+        db.rollback()
+        raise PermissionError("권한이 없습니다. 프로젝트 리더만 지원 상태를 변경할 수 있습니다.")
+
+    # 2) 잠금을 얻은 뒤의 남은 자리와 대기 중인 지원 수
+    seats, pending = db.execute(text(
+        """
+        SELECT p.capacity - 1 - COALESCE(ps.accepted_members, 0) AS seats,
+            (SELECT COUNT(*) FROM Applications a
+             WHERE a.project_id = p.project_id AND a.status = 'Pending'
+               AND a.applicant_id = ANY(CAST(:applicant_ids AS varchar[]))) AS pending
+        FROM Projects p
+        LEFT JOIN Project_Stats ps ON ps.project_id = p.project_id
+        WHERE p.project_id = :project_id
+        """
+    ), {"project_id": project_id, "applicant_ids": applicant_ids}).fetchone()
+
+    # 3) 상태 검증
+    if pending != len(applicant_ids):
+        db.rollback()
+        raise ValueError("대기 중인 지원이 아닌 지원자가 포함되어 있습니다.")
+    if len(applicant_ids) > seats:
+        db.rollback()
+        raise ValueError(f"모집 인원을 초과합니다. (남은 자리 {max(seats, 0)}명)")
+
+    # 4) 같은 트랜잭션에서 리더 권한으로 한 번에 수락
+    with role_transaction(db, "leader", "리더 권한 획득 또는 업데이트 실패"):
+        update_result = db.execute(text(
+            """
+            UPDATE Applications
+            SET status = 'Accepted'
+            WHERE project_id = :project_id AND status = 'Pending'
+              AND applicant_id = ANY(CAST(:applicant_ids AS varchar[]))
+            """
+        ), {"project_id": project_id, "applicant_ids": applicant_ids})
+        if update_result.rowcount != len(applicant_ids):
+            raise ValueError("지원 상태 업데이트에 실패했습니다.")
+
+    project_cache.invalidate(project_tag(project_id))
+    return len(applicant_ids)
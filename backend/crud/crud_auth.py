@@ -18,15 +18,28 @@ def create_student(db: Session, uid: str, name: str, hashed_password: str) -> No
     db.execute(text("COMMIT"))
 
 
-def login_student(db: Session, uid: str, password: str, verify_password_func) -> tuple | None:
+# 로그인용 학생 정보 조회 (비밀번호 검증은 호출 측에서 해싱 실행기로 수행)
+def get_student_credentials(db: Session, uid: str) -> dict | None:
     row = db.execute(text(
         "SELECT hashed_password, uid, name, email, profile_text, website_link FROM Students WHERE uid = :uid"),
         {"uid": uid}
     ).first()
     if not row:
         return None
-    hashed_pw = row[0]
-    if not verify_password_func(password, hashed_pw):
-        return None
+    return {
+        "hashed_password": row[0],
+        "uid": row[1],
+        "name": row[2],
+        "email": row[3] or "",
+        "profile_text": row[4] or "",
+        "website_link": row[5] or "",
+    }
+
 
-    return (row[1], row[2], row[3] or "", row[4] or "", row[5] or "")
\ No newline at end of file
+# 비밀번호 해시 교체 (bcrypt cost 변경 시 로그인 성공 후 재해싱)
+def update_password_hash(db: Session, uid: str, hashed_password: str) -> None:
+    db.execute(text(
+        "UPDATE Students SET hashed_password = :hpw WHERE uid = :uid"),
+        {"uid": uid, "hpw": hashed_password}
+    )
+    db.commit()
@@ -1,25 +1,34 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from crud.cache import project_cache, student_tag
+from crud.crud_skills import upsert_skills, skill_dictionary
 
 # 학생 프로필 정보 조회
 def get_student_profile_with_skills(db: Session, uid: str) -> dict | None:
+    # 평판은 리뷰 이력 대신 Student_Reputation 한 행(트리거가 유지)에서 읽음
     row = db.execute(text(
-        "SELECT name, email, profile_text, website_link FROM Students WHERE uid = :uid"),
+        """
+        SELECT s.name, s.email, s.profile_text, s.website_link,
+            COALESCE(r.review_count, 0), r.score_sum,
+            ARRAY[COALESCE(r.score_1, 0), COALESCE(r.score_2, 0), COALESCE(r.score_3, 0),
+                  COALESCE(r.score_4, 0), COALESCE(r.score_5, 0)]
+        FROM Students s
+        LEFT JOIN Student_Reputation r ON r.uid = s.uid
+        WHERE s.uid = :uid
+        """),
         {"uid": uid}
     ).first()
     if not row:
         return None
     name, email, profile_text, website_link = row[0], row[1], row[2], row[3]
+    review_count, score_sum, score_histogram = row[4], row[5], row[6]
 
+    # 스킬 이름은 Skills 조인 대신 스킬 사전에서 변환
     skills_result = db.execute(text(
-        """
-        SELECT s.skill_name FROM Skills s
-        JOIN Student_Skills ss ON s.skill_id = ss.skill_id
-        WHERE ss.uid = :uid
-        """),
+        "SELECT skill_id FROM Student_Skills WHERE uid = :uid"),
         {"uid": uid}
     )
-    skills = [r[0] for r in skills_result.fetchall()]
+    skills = skill_dictionary.names(db, [r[0] for r in skills_result.fetchall()])
 
     return {
         "uid": uid,
@@ -27,7 +36,10 @@ def get_student_profile_with_skills(db: Session, uid: str) -> dict | None:
         "email": email,
         "profile_text": profile_text,
         "website_link": website_link,
-        "skills": skills
+        "skills": skills,
+        "review_count": review_count,
+        "avg_score": round(score_sum / review_count, 2) if review_count else None,
+        "score_histogram": score_histogram,
     }
 
 
@@ -36,17 +48,13 @@ def update_student_profile(db: Session, uid: str, name: str, email: str, profile
     """
     다음 작업들을 하나의 트랜잭션으로 실행
       1) Students 테이블 업데이트
-      2) Skills 테이블에 없는 스킬은 삽입(ON CONFLICT DO NOTHING)
-      3) Student_Skills를 갱신(DELETE 후 INSERT)
+      2) Skills 테이블에 없는 스킬은 한 번에 삽입(upsert_skills)
+      3) Student_Skills는 바뀐 스킬만 갱신 (빠진 스킬 DELETE, 새 스킬 INSERT)
+    스킬 개수와 관계없이 쿼리 수는 일정하다.
     """
-    # 커넥션 레벨 트랜잭션
-    engine = db.get_bind()
-    conn = engine.connect()
     try:
-        conn.execute(text("BEGIN"))
-
         # 1) 프로필 정보 업데이트
-        result = conn.execute(text(
+        result = db.execute(text(
             """
             UPDATE Students
             SET name = :name, email = :email, profile_text = :profile_text, website_link = :website_link
@@ -64,25 +72,32 @@ def update_student_profile(db: Session, uid: str, name: str, email: str, profile
         if result.rowcount == 0:
             raise Exception("해당 학생을 찾을 수 없습니다.")
 
-        # 2) Skills 테이블에 필요한 스킬 삽입 (중복 무시)
         if skills is not None:
-            for skill in skills:
-                conn.execute(text(
-                    "INSERT INTO Skills (skill_name) VALUES (:skill) ON CONFLICT (skill_name) DO NOTHING"
-                ), {"skill": skill.lower()})
+            # 2) Skills 테이블에 필요한 스킬 삽입 (중복 무시)
+            skill_map = upsert_skills(db, skills)
+            skill_ids = list(skill_map.values())
 
-            # 3) Student_Skills -> 전체 삭제 후 다시 추가
-            conn.execute(text("DELETE FROM Student_Skills WHERE uid = :uid"), {"uid": uid})
-            for skill in skills:
-                conn.execute(text(
-                    "INSERT INTO Student_Skills (uid, skill_id) SELECT :uid, skill_id FROM Skills WHERE skill_name = :skill"
-                ), {"uid": uid, "skill": skill.lower()})
+            # 3) Student_Skills -> 목록에서 빠진 스킬만 삭제, 이미 있는 스킬은 건드리지 않고 새 스킬만 추가
+            db.execute(text(
+                "DELETE FROM Student_Skills WHERE uid = :uid AND skill_id <> ALL(CAST(:skill_ids AS integer[]))"
+            ), {"uid": uid, "skill_ids": skill_ids})
+            if skill_ids:
+                db.execute(text(
+                    """
+                    INSERT INTO Student_Skills (uid, skill_id)
+                    SELECT :uid, unnest(CAST(:skill_ids AS integer[]))
+                    ON CONFLICT (uid, skill_id) DO NOTHING
+                    """
+                ), {"uid": uid, "skill_ids": skill_ids})
 
-        conn.execute(text("COMMIT"))
+        db.commit()
 
     except Exception:
-        conn.execute(text("ROLLBACK"))
+        db.rollback()
         raise
 
-    finally:
-        conn.close()
\ No newline at end of file
+    if skills is not None:
+        skill_dictionary.add(skill_map)
+
+    # 리더 이름/멤버 정보가 표시된 목록과 상세를 무효화
+    project_cache.invalidate(student_tag(uid))
\ No newline at end of file
@@ -1,6 +1,12 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from datetime import date, datetime
+from decimal import Decimal
+from crud.pagination import decode_cursor, paginate
+from crud.cache import project_cache, LIST_TAG, project_tag, detail_tag, student_tag
+from db.session import role_transaction
+from crud.crud_skills import upsert_skills, skill_dictionary
+from crud.recommender import project_recommender
 
 def create_project_with_skills(db: Session, leader_id: str, topic: str, description1: str, description2: str,
                                capacity: int, deadline: date | datetime, skills: list[str]) -> None:
@@ -11,12 +17,8 @@ def create_project_with_skills(db: Session, leader_id: str, topic: str, descript
     - 주제, 목표/설명, 모집 인원, 모집 마감일, 상태를 Projects 테이블에 INSERT
     - 프로젝트에 필요한 스킬들을 Project_Required_Skills 테이블에 INSERT
     """
-    engine = db.get_bind()
-    conn = engine.connect()
     try:
-        conn.execute(text("BEGIN"))
-
-        result = conn.execute(text(
+        result = db.execute(text(
             """
             INSERT INTO Projects (leader_id, topic, description1, description2, capacity, deadline)
             VALUES (:leader_id, :topic, :description1, :description2, :capacity, :deadline)
@@ -35,87 +37,200 @@ def create_project_with_skills(db: Session, leader_id: str, topic: str, descript
         project_id = result.scalar_one_or_none()
         if project_id is None:
             raise RuntimeError("프로젝트 생성에 실패했습니다")
-        
-        for skill in skills:
-            skill_lower = skill.lower()
-            conn.execute(text(
-                "INSERT INTO Skills (skill_name) VALUES (:skill_name) ON CONFLICT (skill_name) DO NOTHING"),
-                {"skill_name": skill_lower},
-            )
-            conn.execute(text(
-                "INSERT INTO Project_Required_Skills (project_id, skill_id) SELECT :project_id, skill_id FROM Skills WHERE skill_name=:skill_name"
+
+        # 스킬 upsert 1회 + 요구 스킬 매핑 INSERT 1회 (스킬 개수와 무관)
+        skill_ids = upsert_skills(db, skills)
+        if skill_ids:
+            db.execute(text(
+                "INSERT INTO Project_Required_Skills (project_id, skill_id) SELECT :project_id, unnest(CAST(:skill_ids AS integer[]))"
                 ),
-                {"project_id": project_id, "skill_name": skill_lower},
+                {"project_id": project_id, "skill_ids": list(skill_ids.values())},
             )
 
-        conn.execute(text("COMMIT"))
+        db.commit()
 
     except Exception:
-        conn.execute(text("ROLLBACK"))
+        db.rollback()
         raise
 
-    finally:
-        conn.close()
+    skill_dictionary.add(skill_ids)
+    project_recommender.put(project_id, deadline.date() if isinstance(deadline, datetime) else deadline, skill_ids.values())
+    # 새 프로젝트는 어느 목록 페이지에든 들어갈 수 있음
+    project_cache.invalidate(LIST_TAG)
+
+
+# groupBy 별 조회 대상 (All은 보관되지 않은 프로젝트 중 마감된 모집글만 제외하는 인라인 쿼리)
+# 마감일 조건은 다음 보관 스위퍼 실행 전까지 남아 있는 마감된 모집글용 (live 행에만 적용)
+_LIST_SOURCES = {
+    "Recruiting": "RecruitingProjectsView",
+    "In_Progress": "InProgressProjectsView",
+    "Completed": "CompletedProjectsView",
+}
 
+_ALL_PROJECTS_SOURCE = """(
+    SELECT p.project_id, p.leader_id, p.topic, p.description1, p.capacity, p.deadline, p.status, s.name as leader_name
+    FROM Projects p
+    JOIN Students s ON p.leader_id = s.uid
+    WHERE p.archived_at IS NULL
+      AND NOT (p.status = 'Recruiting' AND p.deadline < CURRENT_DATE)
+)"""
 
-def get_all_projects(db: Session, orderBy: str = "deadline", groupBy: str = "All", search: str = "") -> list[dict]:
+
+def _build_prefix_tsquery(search: str) -> str:
     """
-    전체 프로젝트 목록 조회
+    타입어헤드용 접두어 tsquery 문자열 생성 ('ai':* & '추천':* 형태)
     """
-    # 정렬 기준 결정
-    if orderBy == "capacity":
-        order_sql = "ORDER BY capacity DESC, deadline ASC"
-    else:
-        order_sql = "ORDER BY deadline ASC"
+    tokens = []
+    for raw in search.split():
+        token = "".join(ch for ch in raw if ch.isalnum() or ch in "-_.+#")
+        if token:
+            tokens.append("'" + token.lower() + "':*")
+    return " & ".join(tokens)
 
-    like_pattern = f"%{search.strip()}%" if search and search.strip() else None
 
-    # groupBy 조건별로 쿼리 실행
-    if groupBy == "Recruiting":
-        if like_pattern:
-            query = text(f"SELECT * FROM RecruitingProjectsView WHERE topic ILIKE :like OR description1 ILIKE :like {order_sql}")
-            res = db.execute(query, {"like": like_pattern})
-        else:
-            query = text(f"SELECT * FROM RecruitingProjectsView {order_sql}")
-            res = db.execute(query)
-    elif groupBy == "In_Progress":
-        if like_pattern:
-            query = text(f"SELECT * FROM InProgressProjectsView WHERE topic ILIKE :like OR description1 ILIKE :like {order_sql}")
-            res = db.execute(query, {"like": like_pattern})
-        else:
-            query = text(f"SELECT * FROM InProgressProjectsView {order_sql}")
-            res = db.execute(query)
-    elif groupBy == "Completed":
-        if like_pattern:
-            query = text(f"SELECT * FROM CompletedProjectsView WHERE topic ILIKE :like OR description1 ILIKE :like {order_sql}")
-            res = db.execute(query, {"like": like_pattern})
-        else:
-            query = text(f"SELECT * FROM CompletedProjectsView {order_sql}")
-            res = db.execute(query)
+def get_all_projects(db: Session, orderBy: str = "deadline", groupBy: str = "All", search: str = "",
+                     limit: int | None = None, after: str | None = None,
+                     searchMode: str = "contains", version=None) -> tuple[list[dict], str | None]:
+    """
+    전체 프로젝트 목록 조회
+
+    프로젝트 행, 요구 스킬 배열, 멤버 수를 하나의 쿼리로 함께 조회한다.
+    (결과 건수와 관계없이 쿼리 수는 항상 1회)
+
+    - limit/after: 키셋 페이지네이션 (정렬 키 + project_id 기준)
+    - searchMode: contains(ILIKE 부분 일치), fulltext(전문 검색), prefix(접두어 일치, 타입어헤드용)
+      fulltext/prefix는 Projects.search_vector의 GIN 인덱스를 사용하고 관련도(search_rank)를 함께 반환
+    - 반환: (프로젝트 목록, 다음 페이지 커서)
+
+    결과는 정규화된 파라미터를 키로 project_cache에 저장되며, 쓰기 경로에서 무효화된다.
+    version(ETag용으로 먼저 읽은 Entity_Versions 값)을 넘기면 저장된 버전과 비교해서,
+    다른 워커의 쓰기로 아직 무효화되지 않은 이전 결과가 새 ETag로 나가지 않게 한다.
+    (버전은 키에 넣지 않으므로 버전이 바뀌면 같은 키의 항목을 새 결과로 덮어쓴다)
+    """
+    # 같은 결과를 내는 파라미터 조합은 같은 캐시 키를 사용
+    search = search.strip() if search else ""
+    if not search:
+        searchMode = "contains"
+    if orderBy == "relevance" and searchMode == "contains":
+        orderBy = "deadline"
+    if orderBy not in ("capacity", "relevance"):
+        orderBy = "deadline"
+    if groupBy not in _LIST_SOURCES:
+        groupBy = "All"
+
+    key = ("list", orderBy, groupBy, search, searchMode, limit, after)
+    cached = project_cache.get(key, version)
+    if cached is not None:
+        return cached
+
+    generation = project_cache.generation
+    result = _fetch_all_projects(db, orderBy, groupBy, search, limit, after, searchMode)
+
+    tags = {LIST_TAG}
+    for p in result[0]:
+        tags.add(project_tag(p["project_id"]))
+        tags.add(student_tag(p["leader_id"]))
+    project_cache.set(key, result, tags, generation, version)
+    return result
+
+
+def _fetch_all_projects(db: Session, orderBy: str, groupBy: str, search: str,
+                        limit: int | None, after: str | None, searchMode: str) -> tuple[list[dict], str | None]:
+    """
+    get_all_projects의 실제 조회 (캐시 미사용)
+    """
+
+    params = {"limit": limit + 1 if limit is not None else None}
+    conditions = []
+    join_sql = ""
+    rank_sql = "NULL::numeric"
+
+    # 검색 조건
+    ts_query = None
+    if search and searchMode == "fulltext":
+        ts_query = "websearch_to_tsquery('simple', :query)"
+        params["query"] = search
+    elif search and searchMode == "prefix":
+        prefix_query = _build_prefix_tsquery(search)
+        if prefix_query:
+            ts_query = "to_tsquery('simple', :query)"
+            params["query"] = prefix_query
+    elif search:
+        conditions.append("(v.topic ILIKE :like OR v.description1 ILIKE :like)")
+        params["like"] = f"%{search}%"
+
+    if ts_query:
+        join_sql = (
+            "JOIN Projects sv ON sv.project_id = v.project_id "
+            f"CROSS JOIN {ts_query} q "
+            "CROSS JOIN LATERAL (SELECT round(ts_rank(sv.search_vector, q)::numeric, 6) AS search_rank) r"
+        )
+        rank_sql = "r.search_rank"
+        conditions.append("sv.search_vector @@ q")
+
+    # 정렬 기준 결정 (project_id로 동순위를 고정해 페이지 경계를 안정적으로 유지)
+    if orderBy == "relevance" and ts_query:
+        order_sql = "ORDER BY {r}.search_rank DESC, {t}.project_id ASC"
+        cursor_types = [Decimal, int]
+        cursor_key = lambda p: [p["search_rank"], p["project_id"]]
+        after_sql = "({r}.search_rank < :after_0 OR ({r}.search_rank = :after_0 AND {t}.project_id > :after_1))"
+    elif orderBy == "capacity":
+        order_sql = "ORDER BY {t}.capacity DESC, {t}.deadline ASC, {t}.project_id ASC"
+        cursor_types = [int, date.fromisoformat, int]
+        cursor_key = lambda p: [p["capacity"], p["deadline"], p["project_id"]]
+        after_sql = "({t}.capacity < :after_0 OR ({t}.capacity = :after_0 AND ({t}.deadline, {t}.project_id) > (:after_1, :after_2)))"
     else:
-        base_query = f"""
-            SELECT p.project_id, p.leader_id, p.topic, p.description1, p.capacity, p.deadline, p.status, s.name as leader_name
-            FROM Projects p
-            JOIN Students s ON p.leader_id = s.uid
-            WHERE NOT (p.status = 'Recruiting' AND p.deadline < CURRENT_DATE)
-            {order_sql}
+        orderBy = "deadline"
+        order_sql = "ORDER BY {t}.deadline ASC, {t}.project_id ASC"
+        cursor_types = [date.fromisoformat, int]
+        cursor_key = lambda p: [p["deadline"], p["project_id"]]
+        after_sql = "({t}.deadline, {t}.project_id) > (:after_0, :after_1)"
+
+    # 커서 이후의 행만 조회
+    if after:
+        for i, value in enumerate(decode_cursor(after, orderBy, cursor_types)):
+            params[f"after_{i}"] = value
+        conditions.append(after_sql.format(t="v", r="r"))
+
+    source = _LIST_SOURCES.get(groupBy, _ALL_PROJECTS_SOURCE)
+    where_sql = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+    # base: groupBy/검색/커서 조건에 맞는 프로젝트 한 페이지
+    # skills: base 프로젝트들의 요구 스킬 id를 프로젝트별 배열로 집계 (이름은 스킬 사전에서 변환)
+    # members_count: 트리거로 유지되는 Project_Stats.accepted_members(리더 제외) + 리더 1명
+    res = db.execute(text(
+        f"""
+        WITH base AS (
+            SELECT v.project_id, v.leader_id, v.topic, v.description1, v.capacity, v.deadline, v.status, v.leader_name,
+                {rank_sql} AS search_rank
+            FROM {source} v
+            {join_sql}
+            {where_sql}
+            {order_sql.format(t="v", r="r")}
+            LIMIT :limit
+        ),
+        skills AS (
+            SELECT prs.project_id, array_agg(prs.skill_id) AS skill_ids
+            FROM Project_Required_Skills prs
+            WHERE prs.project_id IN (SELECT project_id FROM base)
+            GROUP BY prs.project_id
+        )
+        SELECT
+            b.project_id, b.leader_id, b.topic, b.description1, b.capacity, b.deadline, b.status, b.leader_name, b.search_rank,
+            COALESCE(sk.skill_ids, ARRAY[]::integer[]) AS skill_ids,
+            COALESCE(ps.accepted_members, 0) + 1 AS members_count
+        FROM base b
+        LEFT JOIN skills sk ON sk.project_id = b.project_id
+        LEFT JOIN Project_Stats ps ON ps.project_id = b.project_id
+        {order_sql.format(t="b", r="b")}
         """
-        if like_pattern:
-            base_query = base_query.replace(
-                "WHERE NOT (p.status = 'Recruiting' AND p.deadline < CURRENT_DATE)",
-                "WHERE NOT (p.status = 'Recruiting' AND p.deadline < CURRENT_DATE) AND (p.topic ILIKE :like OR p.description1 ILIKE :like)",
-            )
-            res = db.execute(text(base_query), {"like": like_pattern})
-        else:
-            res = db.execute(text(base_query))
+    ), params)
 
     projects: list[dict] = []
-    rows = res.fetchall()
-    for row in rows:
+    for row in res.fetchall():
         mapping = row._mapping
-        project_id = mapping.get("project_id")
-        project = {
-            "project_id": project_id,
+        projects.append({
+            "project_id": mapping.get("project_id"),
             "leader_id": mapping.get("leader_id"),
             "topic": mapping.get("topic"),
             "description1": mapping.get("description1"),
@@ -123,137 +238,119 @@ def get_all_projects(db: Session, orderBy: str = "deadline", groupBy: str = "All
             "deadline": mapping.get("deadline"),
             "status": mapping.get("status"),
             "leader_name": mapping.get("leader_name"),
-        }
+            "skills": skill_dictionary.names(db, mapping.get("skill_ids")),
+            "members_count": int(mapping.get("members_count")),
+            "search_rank": mapping.get("search_rank"),
+        })
 
-        # 프로젝트별 요구 스킬 목록 조회
-        skills_res = db.execute(text(
-            "SELECT s.skill_name FROM Skills s JOIN Project_Required_Skills prs ON s.skill_id = prs.skill_id WHERE prs.project_id = :project_id"),
-            {"project_id": project_id},
-        )
-        project["skills"] = [r[0] for r in skills_res.fetchall()]
-        projects.append(project)
-
-    if projects:
-        ids = [p["project_id"] for p in projects]
-        params = {f"id{i}": ids[i] for i in range(len(ids))}
-        in_clause = ",".join(f":id{i}" for i in range(len(ids)))
-        count_query = f"""
-            SELECT m.project_id, COUNT(DISTINCT m.member_uid) AS cnt
-            FROM (
-                SELECT project_id, applicant_id AS member_uid FROM Applications WHERE project_id IN ({in_clause}) AND status = 'Accepted'
-                UNION
-                SELECT project_id, leader_id AS member_uid FROM Projects WHERE project_id IN ({in_clause})
-            ) m
-            GROUP BY m.project_id
-            """
-        count_sql = text(count_query)
-        res_counts = db.execute(count_sql, params)
-        rows_counts = res_counts.fetchall()
-        counts_map = {r[0]: int(r[1]) for r in rows_counts}
-        for p in projects:
-            p["members_count"] = counts_map.get(p["project_id"], 0)
+    return paginate(projects, limit, orderBy, cursor_key)
 
-    return projects
 
+def get_project_details(db: Session, project_id: int, applicant_id: str = None, version=None) -> dict | None:
+    """
+    프로젝트 상세 정보 조회 (보관된 프로젝트도 조회되며 archived로 표시)
 
-def get_project_details(db: Session, project_id: int, applicant_id: str = None) -> dict | None:
+    결과는 (project_id, applicant_id)를 키로 project_cache에 저장된다.
+    (version: ETag용으로 먼저 읽은 get_project_version 값, get_all_projects 참고)
     """
-    프로젝트 상세 정보 조회
+    key = ("detail", project_id, applicant_id or None)
+    cached = project_cache.get(key, version)
+    if cached is not None:
+        return cached
+
+    generation = project_cache.generation
+    project = _fetch_project_details(db, project_id, applicant_id)
+    if project is None:
+        return None
+
+    tags = {detail_tag(project_id), project_tag(project_id), student_tag(project["leader_id"])}
+    tags.update(student_tag(m["uid"]) for m in project["members"])
+    project_cache.set(key, project, tags, generation, version)
+    return project
+
+
+def _fetch_project_details(db: Session, project_id: int, applicant_id: str = None) -> dict | None:
+    """
+    get_project_details의 실제 조회 (캐시 미사용)
+
+    프로젝트/리더, 요구 스킬, 지원 가능 여부, 멤버 목록, 멤버 수를 한 번의 쿼리로 JSON 문서로 만들어 받는다.
+    스킬은 id 배열로 받아 스킬 사전에서 이름으로 변환한다.
     """
     res = db.execute(text(
         """
-        SELECT 
-            p.project_id    AS project_id,
-            p.leader_id     AS leader_id,
-            s.name          AS leader_name,
-            p.topic         AS topic,
-            p.description1  AS description1,
-            p.description2  AS description2,
-            p.capacity      AS capacity,
-            p.deadline      AS deadline,
-            p.status        AS status
+        SELECT json_build_object(
+            'project_id',    p.project_id,
+            'leader_id',     p.leader_id,
+            'leader_name',   s.name,
+            'topic',         p.topic,
+            'description1',  p.description1,
+            'description2',  p.description2,
+            'capacity',      p.capacity,
+            'deadline',      p.deadline,
+            'status',        p.status,
+            'archived',      p.archived_at IS NOT NULL,
+            'members_count', COALESCE(ps.accepted_members, 0) + 1,
+            'skill_ids', COALESCE(
+                (SELECT json_agg(prs.skill_id) FROM Project_Required_Skills prs WHERE prs.project_id = p.project_id),
+                '[]'::json
+            ),
+            -- 비로그인은 지원 가능, 리더 본인이나 이미 지원한 학생은 불가
+            'can_apply', CASE
+                WHEN CAST(:applicant_id AS varchar) IS NULL THEN true
+                WHEN CAST(:applicant_id AS varchar) = p.leader_id THEN false
+                ELSE NOT EXISTS (
+                    SELECT 1 FROM Applications a
+                    WHERE a.project_id = p.project_id AND a.applicant_id = CAST(:applicant_id AS varchar)
+                )
+            END,
+            -- 멤버: 리더 + 수락된 지원자
+            'members', COALESCE(
+                (SELECT json_agg(json_build_object('uid', m.uid, 'name', m.name, 'skill_ids', m.skill_ids) ORDER BY m.name)
+                 FROM (
+                     SELECT st.uid, st.name,
+                         COALESCE((SELECT array_agg(ss.skill_id) FROM Student_Skills ss WHERE ss.uid = st.uid), ARRAY[]::integer[]) AS skill_ids
+                     FROM Students st
+                     WHERE st.uid = p.leader_id
+                        OR st.uid IN (SELECT a.applicant_id FROM Applications a WHERE a.project_id = p.project_id AND a.status = 'Accepted')
+                 ) m),
+                '[]'::json
+            )
+        ) AS detail
         FROM Projects p
         JOIN Students s ON p.leader_id = s.uid
+        LEFT JOIN Project_Stats ps ON ps.project_id = p.project_id
         WHERE p.project_id = :project_id
         """
         ),
-        {"project_id": project_id}
+        {"project_id": project_id, "applicant_id": applicant_id or None}
     )
 
-    row_mapping = res.mappings().first()
-    if not row_mapping:
+    project = res.scalar_one_or_none()
+    if project is None:
         return None
-    
-    project = dict(row_mapping)
-    
-    # 요구 스킬 목록 조회
-    skills_res = db.execute(text(
-        "SELECT s.skill_name FROM Skills s JOIN Project_Required_Skills prs ON s.skill_id = prs.skill_id WHERE prs.project_id = :project_id"),
-        {"project_id": project_id},
-    )
-    project["skills"] = [r[0] for r in skills_res.fetchall()]
-
-    # 지원 가능 여부 검사
-    if applicant_id:
-        if applicant_id == project["leader_id"]:
-            project["can_apply"] = False
-        else:
-            app_res = db.execute(text("SELECT 1 FROM Applications WHERE project_id=:project_id AND applicant_id=:applicant_id"), {"project_id": project_id, "applicant_id": applicant_id})
-            project["can_apply"] = not bool(app_res.fetchone())
-    else:
-        project["can_apply"] = True
-
-    # 프로젝트 멤버 목록 조회
-    members_res = db.execute(text(
-        """
-        SELECT s.uid, s.name,
-            COALESCE(array_agg(sk.skill_name) FILTER (WHERE sk.skill_name IS NOT NULL), ARRAY[]::text[]) AS skills
-        FROM Students s
-        LEFT JOIN Student_Skills ss ON ss.uid = s.uid
-        LEFT JOIN Skills sk ON sk.skill_id = ss.skill_id
-        WHERE s.uid IN (
-            SELECT applicant_id FROM Applications WHERE project_id = :project_id AND status = 'Accepted'
-            UNION
-            SELECT leader_id FROM Projects WHERE project_id = :project_id
-        )
-        GROUP BY s.uid, s.name
-        ORDER BY s.name
-        """
-    ), {"project_id": project_id})
-
-    members_rows = members_res.fetchall()
-    members_list: list[dict] = []
-    for row in members_rows:
-        mapping = row._mapping
-        uid = mapping.get("uid")
-        name = mapping.get("name")
-        skills = mapping.get("skills") or []
-        members_list.append({
-            "uid": uid,
-            "name": name,
-            "skills": list(skills),
-        })
-
-    project["members"] = members_list
-
-    # 멤버 수 조회 
-    count_res = db.execute(text(
-        "SELECT COUNT(DISTINCT a.applicant_id) AS cnt FROM Applications a WHERE a.project_id = :project_id AND a.status = 'Accepted'"
-    ), {"project_id": project_id})
-    count_row = count_res.fetchone()
-    member_count = int(count_row[0]) if count_row and count_row[0] is not None else 0
-    project["members_count"] = member_count + 1
 
+    project["deadline"] = date.fromisoformat(project["deadline"])
+    project["skills"] = skill_dictionary.names(db, project.pop("skill_ids"))
+    for member in project["members"]:
+        member["skills"] = skill_dictionary.names(db, member.pop("skill_ids"))
     return project
 
-def get_my_projects(db: Session, current_user_id: str) -> list:
+def get_my_projects(db: Session, current_user_id: str, limit: int | None = None, after: str | None = None) -> tuple[list[dict], str | None]:
     """
     현재 사용자가 리더이거나 멤버(수락된 지원자)인 프로젝트 목록 조회
 
-    반환: 프로젝트 항목들의 리스트 (각 항목은 dict)
+    - 보관된(archived) 프로젝트는 제외 (상세는 id로 계속 조회 가능)
+    - limit/after: 키셋 페이지네이션 (deadline, project_id 기준)
+    반환: (프로젝트 항목(dict) 리스트, 다음 페이지 커서)
     """
+    params = {"uid": current_user_id, "limit": limit + 1 if limit is not None else None}
+    after_sql = ""
+    if after:
+        params["after_deadline"], params["after_id"] = decode_cursor(after, "deadline", [date.fromisoformat, int])
+        after_sql = "AND (p.deadline, p.project_id) > (:after_deadline, :after_id)"
+
     res = db.execute(text(
-        """
+        f"""
         SELECT
             p.project_id,
             p.leader_id,
@@ -261,22 +358,20 @@ def get_my_projects(db: Session, current_user_id: str) -> list:
             p.status,
             p.capacity,
             p.deadline,
-            (
-                SELECT COUNT(DISTINCT member_uid) FROM (
-                    SELECT applicant_id AS member_uid FROM Applications WHERE project_id = p.project_id AND status = 'Accepted'
-                    UNION
-                    SELECT leader_id AS member_uid FROM Projects WHERE project_id = p.project_id
-                ) AS members
-            ) AS members_count
+            COALESCE(ps.accepted_members, 0) + 1 AS members_count
         FROM Projects p
+        LEFT JOIN Project_Stats ps ON ps.project_id = p.project_id
            WHERE (p.leader_id = :uid
              OR p.project_id IN (
                  SELECT project_id FROM Applications WHERE applicant_id = :uid AND status = 'Accepted'
              ))
+            AND p.archived_at IS NULL
             AND NOT (p.status = 'Recruiting' AND p.deadline < CURRENT_DATE)
-        ORDER BY p.deadline ASC
+            {after_sql}
+        ORDER BY p.deadline ASC, p.project_id ASC
+        LIMIT :limit
         """
-    ), {"uid": current_user_id})
+    ), params)
     rows = res.fetchall()
 
     projects: list[dict] = []
@@ -292,7 +387,7 @@ def get_my_projects(db: Session, current_user_id: str) -> list:
             "deadline": mapping.get("deadline"),
         })
 
-    return projects
+    return paginate(projects, limit, "deadline", lambda p: [p["deadline"], p["project_id"]])
 
 
 def update_project_status(db: Session, project_id: int, leader_id: str, new_status: str) -> bool:
@@ -311,35 +406,25 @@ def update_project_status(db: Session, project_id: int, leader_id: str, new_stat
     if project_leader != leader_id:
         raise PermissionError("권한이 없습니다. 프로젝트 리더만 상태를 변경할 수 있습니다.")
 
-    # 3) 리더 권한으로 실제 쿼리를 실행
-    engine = db.get_bind()
-    conn = engine.connect()
-    try:
-        try:
-            conn.execute(text("BEGIN"))
-            conn.execute(text("SET ROLE leader"))
-            update_result = conn.execute(text(
-                """
-                UPDATE Projects
-                SET status = :new_status
-                WHERE project_id = :project_id
-                """
-            ), 
-            {
-                "new_status": new_status,
-                "project_id": project_id,
-            })
-            conn.execute(text("RESET ROLE"))
-            conn.execute(text("COMMIT"))
-        except Exception as e:
-            conn.execute(text("ROLLBACK"))
-            raise PermissionError("리더 권한 획득 또는 업데이트 실패: " + str(e))
-
+    # 3) 같은 트랜잭션에서 리더 권한으로 실제 쿼리를 실행
+    with role_transaction(db, "leader", "리더 권한 획득 또는 업데이트 실패"):
+        update_result = db.execute(text(
+            """
+            UPDATE Projects
+            SET status = :new_status
+            WHERE project_id = :project_id
+            """
+        ), 
+        {
+            "new_status": new_status,
+            "project_id": project_id,
+        })
         if update_result.rowcount == 0:
             raise ValueError("프로젝트 상태 업데이트에 실패했습니다.")
-    finally:
-        conn.close()
 
+    # 상태가 바뀌면 groupBy 목록 간에 이동하므로 목록 전체와 해당 상세를 무효화
+    project_cache.invalidate(LIST_TAG, project_tag(project_id))
+    project_recommender.invalidate(project_id)
     return True
 
 
@@ -358,33 +443,19 @@ def delete_project(db: Session, project_id: int, leader_id: str) -> bool:
     if project_leader != leader_id:
         raise PermissionError("권한이 없습니다. 프로젝트 리더만 삭제할 수 있습니다.")
 
-    # 3) 리더 권한으로 삭제 실행
-    engine = db.get_bind()
-    conn = engine.connect()
-    try:
-        try:
-            conn.execute(text("BEGIN"))
-            conn.execute(text("SET ROLE leader"))
-
-            # 트랜잭션
-            # 관련된 애플리케이션 삭제
-            conn.execute(text("DELETE FROM Applications WHERE project_id = :project_id"), {"project_id": project_id})
-            # 관련된 요구 스킬 매핑 삭제
-            conn.execute(text("DELETE FROM Project_Required_Skills WHERE project_id = :project_id"), {"project_id": project_id})
-            # 프로젝트 삭제
-            delete_result = conn.execute(text("DELETE FROM Projects WHERE project_id = :project_id"), {"project_id": project_id})
-
-            conn.execute(text("RESET ROLE"))
-            conn.execute(text("COMMIT"))
-        except Exception as e:
-            conn.execute(text("ROLLBACK"))
-            raise PermissionError("리더 권한 획득 또는 삭제 실패: " + str(e))
-
+    # 3) 같은 트랜잭션에서 리더 권한으로 삭제 실행
+    with role_transaction(db, "leader", "리더 권한 획득 또는 삭제 실패"):
+        # 관련된 애플리케이션 삭제
+        db.execute(text("DELETE FROM Applications WHERE project_id = :project_id"), {"project_id": project_id})
+        # 관련된 요구 스킬 매핑 삭제
+        db.execute(text("DELETE FROM Project_Required_Skills WHERE project_id = :project_id"), {"project_id": project_id})
+        # 프로젝트 삭제
+        delete_result = db.execute(text("DELETE FROM Projects WHERE project_id = :project_id"), {"project_id": project_id})
         if delete_result.rowcount == 0:
             raise ValueError("프로젝트 삭제에 실패했습니다.")
-    finally:
-        conn.close()
 
+    project_cache.invalidate(LIST_TAG, project_tag(project_id))
+    project_recommender.invalidate(project_id)
     return True
 
 def create_peer_review(db: Session, project_id: int, reviewer_id: str, reviewee_id: str, score: int, comment: str) -> None:
@@ -407,7 +478,7 @@ def create_peer_review(db: Session, project_id: int, reviewer_id: str, reviewee_
     if dup_res:
         raise ValueError("이미 작성하셨습니다.")
 
-    # 리뷰 추가
+    # 리뷰 추가 (트리거가 같은 트랜잭션에서 Project_Stats와 받는 학생의 Student_Reputation을 증감)
     db.execute(text(
         """
         INSERT INTO Peer_Reviews (project_id, reviewer_id, reviewee_id, score, comment)
@@ -0,0 +1,159 @@
+import os
+import threading
+import time
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from db.session import SessionLocal
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+# 다른 워커가 추가한 스킬을 확인하는 주기 (초)
+SKILL_DICT_REFRESH_INTERVAL = float(os.getenv("SKILL_DICT_REFRESH_INTERVAL", "5"))
+
+
+class SkillDictionary:
+    """
+    프로세스 전역 스킬 사전 (skill_id <-> skill_name)
+
+    - 서버 시작 시(main.lifespan) 전체를 읽어 두고, 이 워커가 새 스킬을 커밋하면 add()로 바로 반영(write-through)
+    - 다른 워커가 추가한 스킬은 refresh 주기마다 `skill_id > 마지막으로 본 id` 조회(대부분 0건)로 따라잡는다.
+    - 그래도 모르는 id가 나오면(시퀀스 순서와 커밋 순서가 다른 경우 등) 해당 id만 바로 조회한다.
+    - 스킬은 삭제/이름 변경되지 않으므로 한 번 읽은 항목은 무효화할 필요가 없다.
+    """
+
+    def __init__(self, refresh_interval: float):
+        self.refresh_interval = refresh_interval
+        self._by_id: dict[int, str] = {}
+        self._by_name: dict[str, int] = {}
+        self._max_id = 0
+        self._checked_at = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        """
+        Skills 테이블 전체 로드
+        """
+        rows = db.execute(text("SELECT skill_id, skill_name FROM Skills")).fetchall()
+        with self._lock:
+            self._by_id.clear()
+            self._by_name.clear()
+            self._put(rows)
+            self._loaded = True
+            self._checked_at = time.monotonic()
+
+    def add(self, skill_ids: dict[str, int]) -> None:
+        """
+        커밋된 스킬을 사전에 반영 (write-through). 롤백될 수 있는 트랜잭션 안에서는 호출하지 않는다.
+        """
+        with self._lock:
+            self._put([(skill_id, name) for name, skill_id in skill_ids.items()])
+
+    def names(self, db: Session, skill_ids) -> list[str]:
+        """
+        skill_id 목록을 skill_name 목록으로 변환 (Skills 조인 대신 사용)
+        """
+        skill_ids = list(skill_ids or [])
+        self._refresh(db)
+        missing = [skill_id for skill_id in skill_ids if skill_id not in self._by_id]
+        if missing:
+            rows = db.execute(text(
+                "SELECT skill_id, skill_name FROM Skills WHERE skill_id = ANY(CAST(:skill_ids AS integer[]))"
+            ), {"skill_ids": missing}).fetchall()
+            with self._lock:
+                self._put(rows)
+        return [self._by_id[skill_id] for skill_id in skill_ids if skill_id in self._by_id]
+
+    def ids(self, names: list[str]) -> dict[str, int]:
+        """
+        이미 알고 있는 스킬 이름만 {skill_name: skill_id}로 반환 (DB 조회 없음)
+        """
+        by_name = self._by_name
+        return {name: by_name[name] for name in names if name in by_name}
+
+    def _refresh(self, db: Session) -> None:
+        if not self._loaded:
+            self.load(db)
+            return
+        if time.monotonic() - self._checked_at < self.refresh_interval:
+            return
+        rows = db.execute(text(
+            "SELECT skill_id, skill_name FROM Skills WHERE skill_id > :max_id"
+        ), {"max_id": self._max_id}).fetchall()
+        with self._lock:
+            self._put(rows)
+            self._checked_at = time.monotonic()
+
+    def _put(self, rows) -> None:
+        for skill_id, name in rows:
+            self._by_id[skill_id] = name
+            self._by_name[name] = skill_id
+            self._max_id = max(self._max_id, skill_id)
+
+
+skill_dictionary = SkillDictionary(SKILL_DICT_REFRESH_INTERVAL)
+
+
+def warm_skill_dictionary() -> None:
+    """
+    서버 시작 시 스킬 사전 로드 (main.lifespan에서 호출)
+    실패해도 서버는 뜨며, 첫 조회 때 다시 로드한다.
+    """
+    try:
+        with SessionLocal() as db:
+            skill_dictionary.load(db)
+    except Exception as e:
+        print(f"[경고] 스킬 사전 로드 실패 (첫 조회 시 다시 시도): {e}")
+
+
+def normalize_skill_names(skills: list[str] | None) -> list[str]:
+    """
+    스킬 이름을 소문자로 바꾸고 중복 제거 (입력 순서 유지)
+    """
+    return list(dict.fromkeys(skill.lower() for skill in skills or []))
+
+
+def upsert_skills(db: Session, skills: list[str]) -> dict[str, int]:
+    """
+    스킬 이름 목록을 한 번의 쿼리로 Skills 테이블에 upsert 하고 {skill_name: skill_id} 반환
+    - 스킬 사전에 이미 있는 스킬은 조회하지 않으며, 모두 있으면 쿼리 없이 반환
+    - 나머지는 스킬 개수와 관계없이 쿼리 1회 (동시에 같은 스킬이 추가되는 경합이 있을 때만 1회 추가 조회)
+    - 호출자의 트랜잭션 안에서 실행되며 COMMIT 하지 않는다.
+      새로 삽입된 스킬은 호출자가 커밋한 뒤 skill_dictionary.add()로 사전에 반영해야 한다.
+    """
+    names = normalize_skill_names(skills)
+    known = skill_dictionary.ids(names)
+    names = [name for name in names if name not in known]
+    if not names:
+        return known
+
+    # 데이터 변경 CTE의 INSERT 결과는 같은 쿼리의 Skills 조회에 보이지 않으므로
+    # 새로 삽입된 스킬(inserted)과 기존 스킬(Skills)을 합쳐서 반환
+    rows = db.execute(text(
+        """
+        WITH input AS (
+            SELECT DISTINCT unnest(CAST(:names AS text[])) AS skill_name
+        ),
+        inserted AS (
+            INSERT INTO Skills (skill_name)
+            SELECT skill_name FROM input
+            ON CONFLICT (skill_name) DO NOTHING
+            RETURNING skill_id, skill_name
+        )
+        SELECT skill_id, skill_name FROM inserted
+        UNION ALL
+        SELECT s.skill_id, s.skill_name FROM Skills s JOIN input i ON s.skill_name = i.skill_name
+        """
+    ), {"names": names}).fetchall()
+    skill_ids = {row[1]: row[0] for row in rows}
+
+    # 다른 트랜잭션이 방금 커밋한 스킬은 위 쿼리의 스냅샷에 보이지 않을 수 있음
+    missing = [name for name in names if name not in skill_ids]
+    if missing:
+        rows = db.execute(text(
+            "SELECT skill_id, skill_name FROM Skills WHERE skill_name = ANY(CAST(:names AS text[]))"
+        ), {"names": missing}).fetchall()
+        skill_ids.update({row[1]: row[0] for row in rows})
+
+    return {**known, **skill_ids}
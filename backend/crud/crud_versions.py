@@ -0,0 +1,57 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+
+def get_entity_versions(db: Session, *entities: str) -> tuple[int, ...]:
+    """
+    테이블 단위 변경 카운터 조회 (Entity_Versions, 트리거가 관리)
+    목록 조회의 ETag에 사용한다. 본문보다 먼저 읽어야 한다.
+    카운터는 엔티티마다 여러 shard 행에 나뉘어 있으므로 합계를 버전으로 쓴다.
+    """
+    rows = db.execute(text(
+        "SELECT entity, SUM(version) FROM Entity_Versions WHERE entity = ANY(CAST(:entities AS text[])) GROUP BY entity"
+    ), {"entities": list(entities)}).fetchall()
+    versions = dict(rows)
+    return tuple(int(versions.get(entity, 0)) for entity in entities)
+
+
+def get_project_version(db: Session, project_id: int) -> tuple | None:
+    """
+    프로젝트 상세 조회의 버전 (프로젝트가 없으면 None)
+    - Projects.row_version: 프로젝트 행, 요구 스킬, 지원서 변경 시 증가
+    - 리더와 수락된 멤버의 Students.row_version: 이름/스킬 변경 시 증가
+    """
+    row = db.execute(text(
+        """
+        SELECT p.row_version,
+            (SELECT string_agg(s.uid || ':' || s.row_version, ',' ORDER BY s.uid)
+             FROM Students s
+             WHERE s.uid = p.leader_id
+                OR s.uid IN (SELECT applicant_id FROM Applications WHERE project_id = p.project_id AND status = 'Accepted')
+            ) AS member_versions
+        FROM Projects p
+        WHERE p.project_id = :project_id
+        """
+    ), {"project_id": project_id}).first()
+    if not row:
+        return None
+    return (row[0], row[1])
+
+
+def get_student_version(db: Session, uid: str) -> tuple | None:
+    """
+    학생 프로필의 버전 (학생이 없으면 None)
+    - Students.row_version: 프로필/보유 스킬 변경 시 증가
+    - Student_Reputation.row_version: 받은 리뷰가 바뀔 때 증가 (리뷰가 없으면 0)
+    """
+    row = db.execute(text(
+        """
+        SELECT s.row_version, COALESCE(r.row_version, 0)
+        FROM Students s
+        LEFT JOIN Student_Reputation r ON r.uid = s.uid
+        WHERE s.uid = :uid
+        """
+    ), {"uid": uid}).first()
+    if not row:
+        return None
+    return (row[0], row[1])
@@ -0,0 +1,56 @@
+"""
+키셋(커서) 기반 페이지네이션 유틸리티
+
+커서는 마지막 행의 정렬 키 값(예: deadline, project_id)을 담은 불투명 문자열이다.
+다음 페이지는 OFFSET 대신 `(정렬 키) > (커서 값)` 조건으로 조회하므로
+몇 번째 페이지든 첫 페이지와 같은 비용으로 조회된다.
+"""
+import base64
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Callable
+
+
+def _to_json(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(order: str, values: list) -> str:
+    """
+    정렬 기준(order)과 정렬 키 값 목록을 커서 문자열로 인코딩
+    """
+    payload = json.dumps({"o": order, "k": [_to_json(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order: str, types: list[Callable]) -> list:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩
+
+    - types: 각 정렬 키 값을 변환할 함수 목록 (예: [date.fromisoformat, int])
+    - 형식이 잘못되었거나 다른 정렬 기준의 커서이면 ValueError 발생
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload["o"] != order or len(payload["k"]) != len(types):
+            raise ValueError
+        return [convert(value) for convert, value in zip(types, payload["k"])]
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+def paginate(rows: list[dict], limit: int | None, order: str, key: Callable[[dict], list]) -> tuple[list[dict], str | None]:
+    """
+    limit + 1건으로 조회한 결과를 limit건으로 자르고 다음 페이지 커서를 만든다.
+    다음 페이지가 없으면 커서는 None
+    """
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(order, key(rows[-1]))
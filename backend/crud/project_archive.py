@@ -0,0 +1,134 @@
+"""
+마감/완료 프로젝트 보관 스위퍼 (hot/cold 분리)
+
+목록 조회는 매번 마감된 모집글을 조건으로 다시 걸러 왔다. 스위퍼가 다음 프로젝트를 보관(archived_at 설정)해 두면
+목록 View, 전체 목록, 내 프로젝트, 추천, 팀 구성은 보관되지 않은(live) 행과 그 부분 인덱스만 읽는다.
+    - 마감일이 지난 모집 중(Recruiting) 프로젝트
+    - 마감일이 PROJECT_ARCHIVE_COMPLETED_DAYS일 넘게 지난 완료(Completed) 프로젝트 (완료 시각 열이 없어 마감일 기준)
+프로젝트의 지원서(Applications)도 함께 보관되며, 요구 스킬은 프로젝트 id로만 읽히므로 그대로 둔다.
+행은 지우지 않으므로 상세(GET /projects/{project_id})는 계속 조회되고(archived=true),
+리더가 보관된 프로젝트의 상태를 바꾸면 트리거가 다시 live로 되돌린다.
+
+실제 보관은 SECURITY DEFINER 함수 archive_expired_projects()가 배치(PROJECT_ARCHIVE_BATCH_SIZE)마다 한 트랜잭션으로 처리한다.
+(FOR UPDATE SKIP LOCKED로 잠그므로 여러 워커가 동시에 돌아도 같은 행을 기다리지 않음)
+
+실행
+    - 서버: main.lifespan이 백그라운드 스레드로 시작 직후와 PROJECT_ARCHIVE_INTERVAL초마다 실행 (0이면 끔)
+    - CLI (backend 디렉터리에서):
+        python -m crud.project_archive             # 지금 보관
+        python -m crud.project_archive --dry-run   # 보관 대상 수만 출력
+"""
+import argparse
+import os
+import threading
+import time
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from crud.cache import project_cache, project_tag, LIST_TAG
+from db.session import SessionLocal
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+# 서버 안에서 스위퍼를 실행하는 주기 (초, 0이면 실행하지 않음)
+PROJECT_ARCHIVE_INTERVAL = float(os.getenv("PROJECT_ARCHIVE_INTERVAL", "3600"))
+# 완료 프로젝트를 보관하기까지 마감일 이후 기다리는 일수
+PROJECT_ARCHIVE_COMPLETED_DAYS = int(os.getenv("PROJECT_ARCHIVE_COMPLETED_DAYS", "180"))
+# 한 트랜잭션에서 보관하는 최대 프로젝트 수
+PROJECT_ARCHIVE_BATCH_SIZE = int(os.getenv("PROJECT_ARCHIVE_BATCH_SIZE", "1000"))
+
+_stop = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def archive_projects(db: Session, completed_days: int = PROJECT_ARCHIVE_COMPLETED_DAYS,
+                     batch_size: int = PROJECT_ARCHIVE_BATCH_SIZE) -> list[int]:
+    """
+    보관 대상이 없을 때까지 배치 단위로 보관하고 커밋 -> 보관한 project_id 목록
+    """
+    archived: list[int] = []
+    while True:
+        project_ids = db.execute(text(
+            "SELECT archive_expired_projects(:completed_days, :batch_size)"
+        ), {"completed_days": completed_days, "batch_size": batch_size}).scalar()
+        db.commit()
+        if project_ids:
+            # 목록 캐시는 버전 비교로도 걸러지지만, 버전 없이 저장된 항목까지 바로 비움
+            project_cache.invalidate(LIST_TAG, *(project_tag(project_id) for project_id in project_ids))
+            archived.extend(project_ids)
+        if len(project_ids) < batch_size:
+            return archived
+
+
+def count_archivable_projects(db: Session, completed_days: int = PROJECT_ARCHIVE_COMPLETED_DAYS) -> dict:
+    """
+    지금 보관 대상인 프로젝트 수 -> {"expired_recruiting": n, "old_completed": n, "archived": n}
+    """
+    row = db.execute(text(
+        """
+        SELECT
+            COUNT(*) FILTER (WHERE archived_at IS NULL AND status = 'Recruiting' AND deadline < CURRENT_DATE) AS expired_recruiting,
+            COUNT(*) FILTER (WHERE archived_at IS NULL AND status = 'Completed'
+                             AND deadline < CURRENT_DATE - CAST(:completed_days AS integer)) AS old_completed,
+            COUNT(*) FILTER (WHERE archived_at IS NOT NULL) AS archived
+        FROM Projects
+        """
+    ), {"completed_days": completed_days}).mappings().one()
+    return dict(row)
+
+
+def _run_archiver(interval: float) -> None:
+    while not _stop.is_set():
+        try:
+            with SessionLocal() as db:
+                started = time.perf_counter()
+                archived = archive_projects(db)
+            if archived:
+                print(f"프로젝트 {len(archived)}개 보관 ({(time.perf_counter() - started) * 1000:.0f} ms)")
+        except Exception as e:
+            print(f"[경고] 프로젝트 보관 실패 (다음 주기에 다시 시도): {e}")
+        _stop.wait(interval)
+
+
+def start_project_archiver() -> None:
+    """
+    보관 스위퍼 스레드 시작 (main.lifespan에서 호출, PROJECT_ARCHIVE_INTERVAL이 0이면 아무것도 하지 않음)
+    """
+    global _thread
+    if PROJECT_ARCHIVE_INTERVAL <= 0 or _thread is not None:
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_run_archiver, args=(PROJECT_ARCHIVE_INTERVAL,), name="project-archiver", daemon=True)
+    _thread.start()
+
+
+def stop_project_archiver() -> None:
+    global _thread
+    if _thread is None:
+        return
+    _stop.set()
+    _thread.join(timeout=10)
+    _thread = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마감/완료 프로젝트 보관")
+    parser.add_argument("--dry-run", action="store_true", help="보관하지 않고 대상 수만 출력")
+    parser.add_argument("--completed-days", type=int, default=PROJECT_ARCHIVE_COMPLETED_DAYS,
+                        help="완료 프로젝트를 보관하기까지 마감일 이후 일수")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        counts = count_archivable_projects(db, args.completed_days)
+        db.rollback()
+        print(f"보관 대상: 마감된 모집글 {counts['expired_recruiting']}개, "
+              f"{args.completed_days}일 지난 완료 프로젝트 {counts['old_completed']}개 (이미 보관됨 {counts['archived']}개)")
+        if args.dry_run:
+            return
+        started = time.perf_counter()
+        archived = archive_projects(db, args.completed_days)
+        print(f"{len(archived)}개 보관 완료 ({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+스킬 기반 프로젝트 추천 (GET /projects/recommended)
+
+모집 중인 프로젝트의 요구 스킬을 프로세스 메모리에 희소 행렬(스킬 -> 프로젝트 슬롯 목록, NumPy 배열)로 들고 있다가,
+학생의 스킬 목록으로 겹치는 스킬 수를 np.bincount 한 번으로 세고 코사인 유사도(겹친 수 / sqrt(|프로젝트 스킬| x |학생 스킬|))
+상위 k개를 np.argpartition으로 고른다. 요청마다 SQL 조인/정렬을 하지 않으므로 10만 건에서도 수 ms 이내.
+
+갱신
+- 서버 시작 시(main.lifespan) 모집 중인 프로젝트 전체를 읽어 둔다.
+- 이 워커의 쓰기는 바로 반영: 프로젝트 생성은 put()(write-through), 상태 변경/삭제는 invalidate()로 표시해 두고
+  다음 추천 요청 때 표시된 프로젝트만 한 번에 다시 읽는다.
+  바뀐 프로젝트의 예전 슬롯은 비활성으로 표시만 하고 새 슬롯을 뒤에 붙이며, 비활성 슬롯이 많아지면 메모리에서 다시 압축한다.
+- 다른 워커의 쓰기는 RECOMMENDER_REFRESH_INTERVAL(초)마다 마지막 확인 이후 바뀐 프로젝트만 읽어 반영한다.
+  추천 대상 여부나 요구 스킬이 바뀌면 트리거가 Projects.changed_xid에 트랜잭션 id를 남기고,
+  확인할 때마다 그 시점 스냅샷의 xmin을 워터마크로 저장해 다음에는 changed_xid >= 워터마크인 행만 읽는다.
+  (다른 워커가 삭제한 프로젝트는 추천 결과의 행을 읽을 때 없으면 invalidate()로 빠진다)
+- 마감일은 조회 시점의 날짜로 거르고, 화면에 내보낼 행은 DB에서 다시 읽으면서 모집 중/마감 전인지 한 번 더 확인한다.
+"""
+import os
+import threading
+import time
+from datetime import date
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from db.session import SessionLocal
+from crud.crud_skills import skill_dictionary
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+# 다른 워커의 프로젝트 변경을 확인하는 주기 (초)
+RECOMMENDER_REFRESH_INTERVAL = float(os.getenv("RECOMMENDER_REFRESH_INTERVAL", "5"))
+
+_RECRUITING_PROJECTS_SQL = """
+SELECT p.project_id, p.deadline, COALESCE(array_agg(prs.skill_id) FILTER (WHERE prs.skill_id IS NOT NULL), ARRAY[]::integer[])
+FROM Projects p
+LEFT JOIN Project_Required_Skills prs ON prs.project_id = p.project_id
+WHERE p.status = 'Recruiting' AND p.deadline >= CURRENT_DATE AND p.archived_at IS NULL {condition}
+GROUP BY p.project_id
+"""
+
+# 지금 스냅샷의 xmin: 이보다 작은 트랜잭션은 모두 끝났으므로, 이후의 변경은 changed_xid >= xmin으로 찾을 수 있다.
+_WATERMARK_SQL = "SELECT CAST(CAST(pg_snapshot_xmin(pg_current_snapshot()) AS text) AS bigint)"
+
+# 워터마크(since) 이후 바뀐 프로젝트와 새 워터마크 (바뀐 프로젝트가 없어도 워터마크 한 행은 반환)
+_CHANGED_PROJECTS_SQL = f"""
+SELECT w.watermark, c.project_id, c.deadline, c.live, c.skill_ids
+FROM ({_WATERMARK_SQL} AS watermark) w
+LEFT JOIN LATERAL (
+    SELECT p.project_id, p.deadline,
+        p.status = 'Recruiting' AND p.deadline >= CURRENT_DATE AND p.archived_at IS NULL AS live,
+        ARRAY(SELECT skill_id FROM Project_Required_Skills WHERE project_id = p.project_id) AS skill_ids
+    FROM Projects p
+    WHERE p.changed_xid >= CAST(CAST(:since AS text) AS xid8)
+) c ON true
+"""
+
+_EMPTY_SLOTS = np.empty(0, dtype=np.int64)
+
+
+class ProjectSkillIndex:
+    """
+    모집 중인 프로젝트의 요구 스킬 희소 행렬 (스킬별 프로젝트 슬롯 배열 = CSC 열)
+
+    - 슬롯 i: project_ids[i], deadlines[i](date.toordinal), skill_counts[i], active[i]
+    - 프로젝트가 바뀌면 예전 슬롯은 active=False로 두고 새 슬롯을 뒤에 추가
+    - 호출자(ProjectRecommender)가 잠금을 잡고 사용한다.
+    """
+
+    def __init__(self, rows=()):
+        rows = list(rows)
+        size = len(rows)
+        capacity = max(1024, size * 2)
+        self.project_ids = np.zeros(capacity, dtype=np.int64)
+        self.deadlines = np.zeros(capacity, dtype=np.int32)
+        self.skill_counts = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.size = size
+        self.inactive = 0
+        self.slot_of: dict[int, int] = {}
+        self.skills_of: dict[int, tuple[int, ...]] = {}
+        self.postings: dict[int, np.ndarray] = {}
+        if not rows:
+            return
+
+        for slot, (project_id, deadline, skill_ids) in enumerate(rows):
+            skill_ids = tuple(sorted(set(skill_ids)))
+            self.project_ids[slot] = project_id
+            self.deadlines[slot] = deadline.toordinal()
+            self.skill_counts[slot] = len(skill_ids)
+            self.slot_of[project_id] = slot
+            self.skills_of[project_id] = skill_ids
+        self.active[:size] = True
+
+        # (스킬, 슬롯) 쌍을 스킬 순으로 정렬해 스킬별 슬롯 배열로 나눔
+        counts = self.skill_counts[:size]
+        skills = np.fromiter((s for _, _, skill_ids in rows for s in set(skill_ids)), dtype=np.int64, count=int(counts.sum()))
+        slots = np.repeat(np.arange(size, dtype=np.int64), counts)
+        order = np.argsort(skills, kind="stable")
+        skills, slots = skills[order], slots[order]
+        unique_skills, starts = np.unique(skills, return_index=True)
+        for skill_id, chunk in zip(unique_skills.tolist(), np.split(slots, starts[1:])):
+            self.postings[skill_id] = chunk
+
+    def put(self, project_id: int, deadline: date, skill_ids) -> None:
+        self.remove(project_id)
+        if self.size == len(self.project_ids):
+            self._grow()
+        skill_ids = tuple(sorted(set(skill_ids)))
+        slot = self.size
+        self.size += 1
+        self.project_ids[slot] = project_id
+        self.deadlines[slot] = deadline.toordinal()
+        self.skill_counts[slot] = len(skill_ids)
+        self.active[slot] = True
+        self.slot_of[project_id] = slot
+        self.skills_of[project_id] = skill_ids
+        for skill_id in skill_ids:
+            self.postings[skill_id] = np.append(self.postings.get(skill_id, _EMPTY_SLOTS), slot)
+
+    def remove(self, project_id: int) -> None:
+        slot = self.slot_of.pop(project_id, None)
+        if slot is None:
+            return
+        self.skills_of.pop(project_id, None)
+        self.active[slot] = False
+        self.inactive += 1
+
+    def needs_compaction(self) -> bool:
+        return self.inactive > max(1024, self.size // 4)
+
+    def compacted(self) -> "ProjectSkillIndex":
+        """
+        비활성 슬롯을 뺀 새 인덱스 (DB 조회 없음)
+        """
+        rows = [
+            (project_id, date.fromordinal(int(self.deadlines[slot])), self.skills_of[project_id])
+            for project_id, slot in self.slot_of.items()
+        ]
+        return ProjectSkillIndex(rows)
+
+    def top_k(self, skill_ids, k: int, today: date, exclude=()) -> list[tuple[int, float, tuple[int, ...]]]:
+        """
+        학생 스킬과 코사인 유사도가 높은 프로젝트 상위 k개 [(project_id, 점수, 겹친 스킬 id)]
+        동점이면 마감이 가까운 순, 그다음 project_id 순
+        """
+        student_skills = set(skill_ids)
+        hits = [self.postings[s] for s in student_skills if s in self.postings]
+        if not hits or k <= 0:
+            return []
+
+        size = self.size
+        overlap = np.bincount(np.concatenate(hits), minlength=size)
+        mask = (overlap > 0) & self.active[:size] & (self.deadlines[:size] >= today.toordinal())
+        for project_id in exclude:
+            slot = self.slot_of.get(project_id)
+            if slot is not None:
+                mask[slot] = False
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+
+        scores = overlap[candidates] / np.sqrt(self.skill_counts[candidates] * float(len(student_skills)))
+        if candidates.size > k:
+            # 점수 상위 k개 (k번째와 같은 점수가 더 있으면 마감/ID 순서로 고르기 위해 경계 점수까지 포함)
+            threshold = np.partition(scores, candidates.size - k)[candidates.size - k]
+            keep = scores >= threshold
+            candidates, scores = candidates[keep], scores[keep]
+        order = np.lexsort((self.project_ids[candidates], self.deadlines[candidates], -scores))[:k]
+
+        results = []
+        for slot, score in zip(candidates[order].tolist(), scores[order].tolist()):
+            project_id = int(self.project_ids[slot])
+            matched = tuple(s for s in self.skills_of[project_id] if s in student_skills)
+            results.append((project_id, round(score, 4), matched))
+        return results
+
+    def _grow(self) -> None:
+        capacity = len(self.project_ids) * 2
+        for name in ("project_ids", "deadlines", "skill_counts", "active"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+
+class ProjectRecommender:
+    """
+    프로세스 전역 추천 인덱스 (ProjectSkillIndex) 관리: 로드, 이 워커의 쓰기 반영, 다른 워커 변경 따라잡기
+    """
+
+    def __init__(self, refresh_interval: float):
+        self.refresh_interval = refresh_interval
+        self._index: ProjectSkillIndex | None = None
+        self._dirty: set[int] = set()
+        self._watermark: int | None = None
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        """
+        모집 중인 프로젝트 전체로 인덱스를 새로 만듦
+        워터마크(스냅샷 xmin)를 먼저 읽으므로, 인덱스에 빠진 변경은 모두 워터마크 이후 트랜잭션의 것이다.
+        """
+        watermark = db.execute(text(_WATERMARK_SQL)).scalar()
+        index = ProjectSkillIndex(db.execute(text(_RECRUITING_PROJECTS_SQL.format(condition=""))).fetchall())
+        with self._lock:
+            self._index = index
+            self._watermark = watermark
+            self._checked_at = time.monotonic()
+
+    def put(self, project_id: int, deadline: date, skill_ids) -> None:
+        """
+        커밋된 새 모집 프로젝트를 바로 반영 (write-through). 롤백될 수 있는 트랜잭션 안에서는 호출하지 않는다.
+        """
+        with self._lock:
+            if self._index is not None:
+                self._index.put(project_id, deadline, skill_ids)
+
+    def invalidate(self, *project_ids: int) -> None:
+        """
+        상태가 바뀌거나 삭제된 프로젝트 표시 (다음 추천 요청 때 다시 읽음)
+        """
+        with self._lock:
+            self._dirty.update(project_ids)
+
+    def recommend(self, db: Session, skill_ids, k: int, exclude=()) -> list[tuple[int, float, tuple[int, ...]]]:
+        self._refresh(db)
+        with self._lock:
+            return self._index.top_k(skill_ids, k, date.today(), exclude)
+
+    def _refresh(self, db: Session) -> None:
+        if self._index is None:
+            self.load(db)
+            return
+
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if dirty:
+            rows = db.execute(text(_RECRUITING_PROJECTS_SQL.format(condition="AND p.project_id = ANY(CAST(:project_ids AS integer[]))")),
+                              {"project_ids": list(dirty)}).fetchall()
+            with self._lock:
+                for project_id in dirty:
+                    self._index.remove(project_id)
+                for project_id, deadline, skill_ids in rows:
+                    self._index.put(project_id, deadline, skill_ids)
+                self._compact()
+
+        now = time.monotonic()
+        with self._lock:
+            # 한 번에 한 요청만 확인 (늦게 읽은 이전 데이터가 새 데이터를 덮어쓰지 않도록)
+            if self._refreshing or now - self._checked_at < self.refresh_interval:
+                return
+            self._refreshing = True
+            self._checked_at = now
+            since = self._watermark
+        try:
+            # 다른 워커가 바꾼 프로젝트만 다시 읽음 (삭제된 프로젝트는 추천 결과를 만들 때 발견되면 빠짐)
+            rows = db.execute(text(_CHANGED_PROJECTS_SQL), {"since": since}).fetchall()
+            with self._lock:
+                for watermark, project_id, deadline, live, skill_ids in rows:
+                    self._watermark = watermark
+                    if project_id is None:
+                        continue
+                    self._index.remove(project_id)
+                    if live:
+                        self._index.put(project_id, deadline, skill_ids)
+                self._compact()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _compact(self) -> None:
+        if self._index.needs_compaction():
+            self._index = self._index.compacted()
+
+    def stats(self) -> dict:
+        with self._lock:
+            index = self._index
+            return {
+                "loaded": index is not None,
+                "projects": len(index.slot_of) if index else 0,
+                "slots": index.size if index else 0,
+                "skills": len(index.postings) if index else 0,
+                "pending": len(self._dirty),
+                "watermark": self._watermark,
+            }
+
+
+project_recommender = ProjectRecommender(RECOMMENDER_REFRESH_INTERVAL)
+
+
+def warm_project_recommender() -> None:
+    """
+    서버 시작 시 추천 인덱스 로드 (main.lifespan에서 호출)
+    실패해도 서버는 뜨며, 첫 추천 요청 때 다시 로드한다.
+    """
+    try:
+        with SessionLocal() as db:
+            project_recommender.load(db)
+    except Exception as e:
+        print(f"[경고] 추천 인덱스 로드 실패 (첫 요청 시 다시 시도): {e}")
+
+
+def get_recommended_projects(db: Session, current_user_id: str, limit: int = 20) -> list[dict] | None:
+    """
+    학생 스킬과 요구 스킬이 잘 맞는 모집 중인 프로젝트 상위 limit개 (학생이 없으면 None)
+    - 본인이 리더인 프로젝트와 이미 지원한 프로젝트는 제외
+    - 점수 계산은 메모리 인덱스에서, 화면에 필요한 행은 상위 limit개만 DB에서 읽음
+    """
+    student = db.execute(text(
+        """
+        SELECT
+            ARRAY(SELECT skill_id FROM Student_Skills WHERE uid = s.uid) AS skill_ids,
+            ARRAY(
+                SELECT project_id FROM Applications WHERE applicant_id = s.uid
+                UNION ALL
+                SELECT project_id FROM Projects WHERE leader_id = s.uid AND status = 'Recruiting'
+            ) AS exclude_ids
+        FROM Students s
+        WHERE s.uid = :uid
+        """
+    ), {"uid": current_user_id}).first()
+    if student is None:
+        return None
+    if not student.skill_ids:
+        return []
+
+    ranked = project_recommender.recommend(db, student.skill_ids, limit, student.exclude_ids)
+    if not ranked:
+        return []
+
+    rows = db.execute(text(
+        """
+        SELECT p.project_id, p.leader_id, p.topic, p.description1, p.capacity, p.deadline, p.status, s.name AS leader_name,
+            ARRAY(SELECT skill_id FROM Project_Required_Skills WHERE project_id = p.project_id) AS skill_ids,
+            COALESCE(ps.accepted_members, 0) + 1 AS members_count
+        FROM Projects p
+        JOIN Students s ON s.uid = p.leader_id
+        LEFT JOIN Project_Stats ps ON ps.project_id = p.project_id
+        WHERE p.project_id = ANY(CAST(:project_ids AS integer[]))
+          AND p.status = 'Recruiting' AND p.deadline >= CURRENT_DATE AND p.archived_at IS NULL
+        """
+    ), {"project_ids": [project_id for project_id, _, _ in ranked]}).mappings().all()
+    by_id = {row["project_id"]: row for row in rows}
+
+    projects = []
+    for project_id, score, matched in ranked:
+        row = by_id.get(project_id)
+        if row is None:
+            # 다른 워커에서 마감/삭제되어 아직 인덱스에 반영되지 않은 프로젝트
+            project_recommender.invalidate(project_id)
+            continue
+        project = dict(row)
+        project["skills"] = skill_dictionary.names(db, project.pop("skill_ids"))
+        project["score"] = score
+        project["matched_skills"] = skill_dictionary.names(db, matched)
+        projects.append(project)
+    return projects
@@ -0,0 +1,240 @@
+"""
+학기 초 팀 구성 제안 (대기 중인 지원 전체를 한 번에 배정)
+
+리더가 지원자를 한 명씩 수락하면 인기 있는 학생은 여러 프로젝트에 몰리고 다른 프로젝트는 비게 된다.
+대기 중(Pending)인 지원 전체와 프로젝트의 남은 자리(capacity - 리더 - 수락된 멤버)를 입력으로,
+학생은 최대 한 프로젝트, 프로젝트는 남은 자리 수까지만 배정하면서 배정 가중치의 합이 최대가 되는 배정을 구한다.
+
+- 가중치: 자리 하나를 채우는 기본 점수 1 + 요구 스킬 충족률(0~1), 1000배 한 정수로 계산
+  (스킬이 맞지 않아도 빈자리를 채우는 배정에는 가치가 있고, 충족률이 높을수록 더 큼)
+- 풀이: 용량이 있는 배정 문제를 옥션 알고리즘(Bertsekas)으로 푼다.
+  학생이 (가치 - 가격)이 가장 큰 프로젝트의 가장 싼 자리에 입찰하고, 자리 가격은 입찰할 때마다 올라가며,
+  밀려난 학생은 다시 입찰한다. 결과의 가중치 합은 최적값과 (학생 수 x TEAM_FORMATION_EPSILON / 1000) 이내로 차이 난다.
+- 결과는 제안일 뿐이며, 리더가 확인 후 POST /projects/{project_id}/applications/accept로 한 트랜잭션에 일괄 수락한다.
+- API(GET /applications/team-formation)는 호출한 리더의 프로젝트 배정만 보여 주고, 전체 배정은 이 CLI에서만 본다.
+- 보관되지 않은 모집 중(Recruiting) 프로젝트만 대상이며, 제안은 관련 테이블 버전과 함께 project_cache에 저장된다.
+
+실행 (backend 디렉터리에서):
+    python -m crud.team_formation              # 제안 요약 출력
+    python -m crud.team_formation --list       # 프로젝트별 배정 목록까지 출력
+    python -m crud.team_formation --apply      # 제안대로 프로젝트별로 일괄 수락 (개발/관리용)
+"""
+import argparse
+import heapq
+import os
+import time
+from collections import deque
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from crud.cache import project_cache
+from crud.crud_applications import accept_applications
+from crud.crud_versions import get_entity_versions
+from db.session import SessionLocal
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+# 입찰 가격 증가 최소 단위 (가중치 1000 = 자리 하나). 작을수록 최적에 가깝고 느려진다.
+# (지원 1만 건 합성 데이터: 1이면 약 3.4초, 5면 약 0.8초이고 가중치 합 차이는 0.0001% 미만)
+# 1 이상이어야 한다. 0이면 같은 가치의 입찰끼리 가격이 오르지 않고 자리를 계속 빼앗아 끝나지 않음
+TEAM_FORMATION_EPSILON = max(1, int(os.getenv("TEAM_FORMATION_EPSILON", "5")))
+
+_WEIGHT_SCALE = 1000
+
+
+def load_team_formation_input(db: Session) -> tuple[list, list]:
+    """
+    -> (대기 중인 지원 목록, 남은 자리가 있는 모집 중인 프로젝트 목록)
+    지원: (application_id, project_id, applicant_id, 충족한 요구 스킬 수)
+    프로젝트: (project_id, 남은 자리 수, 요구 스킬 수)
+    """
+    projects = db.execute(text(
+        """
+        SELECT p.project_id,
+            p.capacity - 1 - COALESCE(ps.accepted_members, 0) AS seats,
+            (SELECT COUNT(*) FROM Project_Required_Skills prs WHERE prs.project_id = p.project_id) AS required_count
+        FROM Projects p
+        LEFT JOIN Project_Stats ps ON ps.project_id = p.project_id
+        WHERE p.status = 'Recruiting' AND p.archived_at IS NULL AND p.capacity - 1 - COALESCE(ps.accepted_members, 0) > 0
+        """
+    )).fetchall()
+    applications = db.execute(text(
+        """
+        SELECT a.application_id, a.project_id, a.applicant_id,
+            (SELECT COUNT(*) FROM Project_Required_Skills prs
+             JOIN Student_Skills ss ON ss.skill_id = prs.skill_id AND ss.uid = a.applicant_id
+             WHERE prs.project_id = a.project_id) AS matched_count
+        FROM Applications a
+        JOIN Projects p ON p.project_id = a.project_id
+        WHERE a.status = 'Pending' AND a.archived_at IS NULL AND p.status = 'Recruiting' AND p.archived_at IS NULL
+        ORDER BY a.application_id
+        """
+    )).fetchall()
+    return applications, projects
+
+
+def solve_team_formation(applications, projects, epsilon: int = TEAM_FORMATION_EPSILON) -> list[tuple[int, int, str, float]]:
+    """
+    옥션 알고리즘으로 배정 -> [(application_id, project_id, applicant_id, 스킬 충족률)] (application_id 순)
+    applications/projects 형식은 load_team_formation_input과 같다.
+    epsilon이 1 이상이어야 입찰마다 가격이 올라 알고리즘이 끝나므로, 1 미만이면 ValueError
+    """
+    if epsilon < 1:
+        raise ValueError("epsilon은 1 이상이어야 합니다.")
+    seats = {project_id: seat_count for project_id, seat_count, _ in projects if seat_count > 0}
+    required = {project_id: required_count for project_id, _, required_count in projects}
+
+    # 학생별 입찰 후보 [(project_id, 가중치, application_id, 충족률)]
+    edges: dict[str, list] = {}
+    for application_id, project_id, applicant_id, matched_count in applications:
+        if project_id not in seats:
+            continue
+        coverage = matched_count / required[project_id] if required[project_id] else 0.0
+        weight = _WEIGHT_SCALE + round(_WEIGHT_SCALE * coverage)
+        edges.setdefault(applicant_id, []).append((project_id, weight, application_id, coverage))
+
+    # 프로젝트별 자리: 가격 최소 힙 [(가격, 자리 번호)], 자리 번호 -> 학생
+    slots = {project_id: [(0, i) for i in range(seat_count)] for project_id, seat_count in seats.items()}
+    owner: dict[tuple[int, int], str] = {}
+    assigned: dict[str, tuple] = {}
+
+    queue = deque(sorted(edges))
+    while queue:
+        student = queue.popleft()
+        best = None
+        best_value = second_value = 0  # 배정받지 않는 선택의 가치 = 0
+        for edge in edges[student]:
+            value = edge[1] - slots[edge[0]][0][0]
+            if best is None or value > best_value:
+                if best is not None:
+                    second_value = max(second_value, best_value)
+                best, best_value = edge, value
+            elif value > second_value:
+                second_value = value
+        if best is None or best_value <= 0:
+            continue  # 어떤 자리도 가격만큼의 가치가 없음 -> 배정하지 않음
+        heap = slots[best[0]]
+        if len(heap) > 1:
+            # 같은 프로젝트의 두 번째로 싼 자리
+            next_price = heap[1][0] if len(heap) == 2 else min(heap[1][0], heap[2][0])
+            second_value = max(second_value, best[1] - next_price)
+
+        price, slot = heapq.heappop(heap)
+        heapq.heappush(heap, (price + best_value - second_value + epsilon, slot))
+        evicted = owner.get((best[0], slot))
+        if evicted is not None:
+            del assigned[evicted]
+            queue.append(evicted)
+        owner[(best[0], slot)] = student
+        assigned[student] = best
+
+    return sorted(
+        (application_id, project_id, student, round(coverage, 4))
+        for student, (project_id, _, application_id, coverage) in assigned.items()
+    )
+
+
+def propose_team_formation(db: Session, version=None) -> dict:
+    """
+    현재 대기 중인 지원 전체에 대한 팀 구성 제안
+    -> {"assignments": [...], "summary": {...}}
+    version(관련 테이블 버전)이 같으면 project_cache에 저장된 제안을 재사용한다.
+    (키는 하나이고, 버전이 바뀌면 새 제안으로 덮어쓴다)
+    """
+    if version is None:
+        version = get_entity_versions(db, "applications", "projects", "students")
+    key = ("team_formation",)
+    cached = project_cache.get(key, version)
+    if cached is not None:
+        return cached
+
+    started = time.perf_counter()
+    applications, projects = load_team_formation_input(db)
+    solution = solve_team_formation(applications, projects)
+    seats = sum(seat_count for _, seat_count, _ in projects)
+    students = {applicant_id for _, _, applicant_id, _ in applications}
+    result = {
+        "assignments": [
+            {"application_id": application_id, "project_id": project_id, "applicant_id": applicant_id, "skill_coverage": coverage}
+            for application_id, project_id, applicant_id, coverage in solution
+        ],
+        "summary": {
+            "pending_applications": len(applications),
+            "applicants": len(students),
+            "projects": len(projects),
+            "open_seats": seats,
+            "assigned": len(solution),
+            "avg_skill_coverage": round(sum(c for *_, c in solution) / len(solution), 4) if solution else 0.0,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        },
+    }
+    # 버전이 다르면 get에서 걸러지므로 무효화 태그 없이 TTL로만 만료
+    project_cache.set(key, result, version=version)
+    return result
+
+
+def get_team_formation_for_leader(db: Session, leader_id: str, project_id: int | None = None, version=None) -> dict | None:
+    """
+    팀 구성 제안 중 leader_id가 리더인 프로젝트의 배정만 (요약은 전체 기준)
+    - project_id: 그 프로젝트의 배정만, 프로젝트가 없으면 None, 리더가 아니면 PermissionError
+    전체 배정(다른 프로젝트의 지원자)은 CLI(python -m crud.team_formation)에서만 볼 수 있다.
+    """
+    rows = db.execute(text(
+        """
+        SELECT project_id, leader_id = :leader_id AS is_leader
+        FROM Projects
+        WHERE leader_id = :leader_id OR project_id = CAST(:project_id AS integer)
+        """
+    ), {"leader_id": leader_id, "project_id": project_id}).fetchall()
+    led = {pid for pid, is_leader in rows if is_leader}
+    if project_id is not None:
+        if project_id not in {pid for pid, _ in rows}:
+            return None
+        if project_id not in led:
+            raise PermissionError("권한이 없습니다. 프로젝트 리더만 팀 구성 제안을 볼 수 있습니다.")
+        led = {project_id}
+
+    proposal = propose_team_formation(db, version)
+    return {
+        "assignments": [a for a in proposal["assignments"] if a["project_id"] in led],
+        "summary": proposal["summary"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대기 중인 지원 전체에 대한 팀 구성 제안")
+    parser.add_argument("--list", action="store_true", help="프로젝트별 배정 목록 출력")
+    parser.add_argument("--apply", action="store_true", help="제안대로 프로젝트별 일괄 수락")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        proposal = propose_team_formation(db)
+        db.rollback()
+        summary = proposal["summary"]
+        print(f"대기 중인 지원 {summary['pending_applications']}건 (학생 {summary['applicants']}명), "
+              f"모집 중인 프로젝트 {summary['projects']}개 / 남은 자리 {summary['open_seats']}개")
+        print(f"배정 {summary['assigned']}명, 평균 스킬 충족률 {summary['avg_skill_coverage']:.2f}, "
+              f"계산 {summary['elapsed_ms']:.0f} ms")
+
+        by_project: dict[int, list[str]] = {}
+        for assignment in proposal["assignments"]:
+            by_project.setdefault(assignment["project_id"], []).append(assignment["applicant_id"])
+        if args.list:
+            for project_id, applicant_ids in sorted(by_project.items()):
+                print(f"  project {project_id}: {', '.join(applicant_ids)}")
+        if args.apply:
+            leaders = dict(db.execute(text(
+                "SELECT project_id, leader_id FROM Projects WHERE project_id = ANY(CAST(:project_ids AS integer[]))"
+            ), {"project_ids": list(by_project)}).fetchall())
+            db.rollback()
+            accepted = 0
+            for project_id, applicant_ids in sorted(by_project.items()):
+                try:
+                    accepted += accept_applications(db, project_id, leaders[project_id], applicant_ids)
+                except (ValueError, PermissionError) as e:
+                    print(f"  [건너뜀] project {project_id}: {e}")
+            print(f"{accepted}명 수락 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+요청 단위 SQL 계측과 Prometheus 텍스트 형식 메트릭
+
+- METRICS_ENABLED=1 일 때만 Engine 이벤트 훅과 풀 대기 시간 리스너를 등록한다.
+  꺼져 있으면 훅이 아예 없으므로 쿼리 경로에 추가 비용이 없다.
+- 요청마다 RequestStats를 컨텍스트 변수에 두고(api/middleware.py), 그 요청에서 실행된 SQL 문 수,
+  DB 시간, 반환 행 수, 커넥션 획득 대기 시간을 모은다. 요청이 끝나면 라우트 템플릿(예: /projects/{project_id})을
+  라벨로 히스토그램/카운터에 반영한다.
+  (스레드풀/run_sync로 실행되는 CRUD도 같은 컨텍스트를 물려받으므로 같은 RequestStats에 모인다.)
+- 외부 의존성 없이 /metrics에서 Prometheus 텍스트 형식(0.0.4)으로 내보낸다.
+"""
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0") == "1"
+
+# 히스토그램 구간 (상한)
+LATENCY_BUCKETS_S = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        self.name, self.help, self.labels = name, help_text, labels
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {_format_number(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    def dec(self, *label_values, amount: float = 1.0) -> None:
+        self.inc(*label_values, amount=-amount)
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        lines[1] = f"# TYPE {self.name} gauge"
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = (), buckets: tuple = LATENCY_BUCKETS_S):
+        self.name, self.help, self.labels, self.buckets = name, help_text, labels, buckets
+        # 라벨 값 -> [구간별 개수..., +Inf 개수, 합계]
+        self._values: dict[tuple, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values) -> None:
+        with self._lock:
+            series = self._values.get(label_values)
+            if series is None:
+                series = self._values[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, upper in enumerate(self.buckets):
+                if value <= upper:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = self.labels + ("le",)
+        with self._lock:
+            for label_values, series in sorted(self._values.items()):
+                cumulative = 0
+                for upper, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                    cumulative += count
+                    le = upper if upper == "+Inf" else _format_number(upper)
+                    lines.append(f"{self.name}_bucket{_format_labels(names, label_values + (le,))} {cumulative}")
+                labels = _format_labels(self.labels, label_values)
+                lines.append(f"{self.name}_sum{labels} {_format_number(series[-1])}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route, method and status", ("route", "method", "status")))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("route", "method")))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"))
+db_statements_per_request = registry.register(Histogram(
+    "db_statements_per_request", "SQL statements executed per request", ("route",), STATEMENT_BUCKETS))
+db_statements_total = registry.register(Counter(
+    "db_statements_total", "SQL statements executed", ("route",)))
+db_time_seconds = registry.register(Histogram(
+    "db_time_seconds", "Time spent executing SQL per request", ("route",)))
+db_rows_total = registry.register(Counter(
+    "db_rows_total", "Rows returned or affected by SQL statements", ("route",)))
+db_checkout_wait_seconds = registry.register(Histogram(
+    "db_checkout_wait_seconds", "Connection pool checkout wait per request", ("route",)))
+
+
+class RequestStats:
+    """
+    한 요청 동안의 DB 사용량
+    """
+    __slots__ = ("statements", "db_time", "rows", "checkout_wait")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.checkout_wait = 0.0
+
+
+# 현재 요청의 RequestStats. None이면 요청 밖(시작 시 초기화 등)이므로 집계하지 않음
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def start_request() -> tuple[RequestStats, object]:
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request(token, stats: RequestStats, route: str, method: str, status: int, elapsed: float) -> None:
+    _request_stats.reset(token)
+    http_requests_total.inc(route, method, status)
+    http_request_duration_seconds.observe(elapsed, route, method)
+    db_statements_per_request.observe(stats.statements, route)
+    if stats.statements:
+        db_statements_total.inc(route, amount=stats.statements)
+        db_time_seconds.observe(stats.db_time, route)
+        db_rows_total.inc(route, amount=stats.rows)
+        db_checkout_wait_seconds.observe(stats.checkout_wait, route)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info.setdefault("metrics_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    started = conn.info.get("metrics_started_at")
+    if stats is None or not started:
+        return
+    stats.db_time += time.perf_counter() - started.pop()
+    stats.statements += 1
+    rowcount = getattr(cursor, "rowcount", -1)
+    if rowcount and rowcount > 0:
+        stats.rows += rowcount
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("metrics_started_at") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def _on_checkout_wait(elapsed_ms: float) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.checkout_wait += elapsed_ms / 1000
+
+
+def install_metrics_hooks(pool_metrics) -> None:
+    """
+    Engine 이벤트 훅과 풀 대기 시간 리스너 등록 (METRICS_ENABLED일 때 db.session에서 한 번 호출)
+    동기/비동기 엔진 모두 Engine 클래스 이벤트로 잡힌다.
+    """
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    pool_metrics.add_listener(_on_checkout_wait)
@@ -0,0 +1,220 @@
+"""
+버전/체크섬 기반 스키마 적용 (init_db에서 사용)
+
+- 타겟 DB의 Schema_Migrations 테이블에 SQL 파일별 체크섬(sha256)과 적용 시각을 기록하고,
+  체크섬이 바뀌었거나 아직 적용되지 않은 파일만 실행한다.
+  앞 파일이 다시 실행되면 뒤 파일도 다시 실행한다. (예: 테이블이 바뀌면 권한 스크립트도 다시 적용)
+  SQL 파일은 모두 여러 번 실행해도 되도록(IF NOT EXISTS / OR REPLACE / ON CONFLICT) 작성되어 있다.
+- 빠른 경로: 스키마가 최신이면 타겟 DB에 한 번 접속해 체크섬만 비교하고 끝낸다. (락/DDL 없음)
+- 적용이 필요하면 한 트랜잭션 안에서 advisory lock(pg_advisory_xact_lock)을 잡고 다시 확인한 뒤 적용하므로,
+  여러 워커가 동시에 시작해도 한 프로세스만 적용하고 나머지는 기다렸다가 그대로 통과한다.
+  (파일 적용과 기록이 같은 트랜잭션이라 중간에 실패하면 아무것도 남지 않음)
+- TestData.sql은 개발 환경에서만 적용
+    APP_ENV (기본 development)
+    LOAD_TEST_DATA (기본: APP_ENV가 development면 1, 아니면 0)
+
+실행 (backend 디렉터리에서):
+    python -m db.migrate            # 필요한 파일만 적용
+    python -m db.migrate --status   # 파일별 적용 상태만 출력
+"""
+import argparse
+import hashlib
+import os
+import time
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
+from db.init_db import admin_database_url
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+APP_ENV = os.getenv("APP_ENV", "development").lower()
+LOAD_TEST_DATA = os.getenv("LOAD_TEST_DATA", "1" if APP_ENV == "development" else "0") == "1"
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql")
+
+# 적용 순서대로 (파일 이름, 테스트 데이터 여부)
+MIGRATIONS = (
+    ("CreateRoles.sql", False),
+    ("CreateTable.sql", False),
+    ("TestData.sql", True),
+    ("App_roles_and_privileges.sql", False),
+)
+
+# advisory lock 키 (이 프로젝트의 스키마 적용 전용)
+MIGRATION_LOCK_KEY = 73102024
+
+CREATE_MIGRATIONS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS Schema_Migrations (
+    name TEXT PRIMARY KEY,
+    checksum TEXT NOT NULL,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    duration_ms INTEGER NOT NULL
+)
+"""
+
+
+def file_checksum(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def planned_migrations(load_test_data: bool = LOAD_TEST_DATA) -> list[tuple[str, str]]:
+    """
+    이번 환경에서 적용 대상인 (파일 이름, 체크섬) 목록
+    """
+    planned = []
+    for name, is_test_data in MIGRATIONS:
+        if is_test_data and not load_test_data:
+            continue
+        path = os.path.join(SQL_DIR, name)
+        if not os.path.exists(path):
+            print(f"[경고] 파일 없음: {path}")
+            continue
+        planned.append((name, file_checksum(path)))
+    return planned
+
+
+def applied_migrations(conn) -> dict[str, str] | None:
+    """
+    기록된 {파일 이름: 체크섬}, Schema_Migrations 테이블이 없으면 None
+    """
+    if conn.execute(text("SELECT to_regclass('schema_migrations')")).scalar() is None:
+        return None
+    rows = conn.execute(text("SELECT name, checksum FROM Schema_Migrations")).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def pending_migrations(planned: list[tuple[str, str]], applied: dict[str, str] | None) -> list[tuple[str, str]]:
+    """
+    체크섬이 다르거나 기록이 없는 첫 파일부터 그 뒤의 파일 전부
+    """
+    applied = applied or {}
+    for i, (name, checksum) in enumerate(planned):
+        if applied.get(name) != checksum:
+            return planned[i:]
+    return []
+
+
+def ensure_database(target_db_name: str) -> None:
+    """
+    타겟 DB가 없으면 생성 (관리자 DB(postgres)에서 advisory lock으로 직렬화)
+    """
+    engine = create_engine(admin_database_url("postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            try:
+                exists = conn.execute(
+                    text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": target_db_name}
+                ).fetchone()
+                if not exists:
+                    print(f"데이터베이스가 없어서 생성합니다: {target_db_name}")
+                    conn.execute(text(f'CREATE DATABASE "{target_db_name}"'))
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    finally:
+        engine.dispose()
+
+
+def migrate(load_test_data: bool = LOAD_TEST_DATA) -> list[str]:
+    """
+    필요한 SQL 파일만 적용하고 적용한 파일 이름 목록을 반환 (최신이면 빈 목록)
+    ADMIN_PASSWORD가 없으면 RuntimeError
+    """
+    target_db_name = os.getenv("POSTGRES_DB", "teamplemate_db")
+    target_db_url = admin_database_url(target_db_name)
+    if not target_db_url:
+        raise RuntimeError("ADMIN_PASSWORD가 설정되지 않았습니다.")
+
+    planned = planned_migrations(load_test_data)
+    engine = create_engine(target_db_url, poolclass=NullPool)
+    try:
+        try:
+            conn = engine.connect()
+        except OperationalError:
+            # 타겟 DB가 아직 없음 -> 생성 후 다시 접속
+            ensure_database(target_db_name)
+            conn = engine.connect()
+
+        with conn:
+            # 빠른 경로: 체크섬 비교만
+            if not pending_migrations(planned, applied_migrations(conn)):
+                conn.rollback()
+                return []
+            conn.rollback()
+
+            with conn.begin():
+                conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                conn.execute(text(CREATE_MIGRATIONS_TABLE_SQL))
+                # 락을 기다리는 동안 다른 프로세스가 적용했을 수 있으므로 다시 확인
+                pending = pending_migrations(planned, applied_migrations(conn))
+                for name, checksum in pending:
+                    print(f"   {name} 적용 중...")
+                    started = time.perf_counter()
+                    with open(os.path.join(SQL_DIR, name), "r", encoding="utf-8") as f:
+                        sql_script = f.read()
+                    if sql_script.strip():
+                        conn.execute(text(sql_script))
+                    conn.execute(text(
+                        """
+                        INSERT INTO Schema_Migrations (name, checksum, applied_at, duration_ms)
+                        VALUES (:name, :checksum, now(), :duration_ms)
+                        ON CONFLICT (name) DO UPDATE
+                        SET checksum = EXCLUDED.checksum, applied_at = EXCLUDED.applied_at, duration_ms = EXCLUDED.duration_ms
+                        """
+                    ), {"name": name, "checksum": checksum, "duration_ms": round((time.perf_counter() - started) * 1000)})
+            return [name for name, _ in pending]
+    finally:
+        engine.dispose()
+
+
+def migration_status(load_test_data: bool = LOAD_TEST_DATA) -> list[tuple[str, str]]:
+    """
+    파일별 상태 목록 [(파일 이름, applied / pending / skipped)]
+    """
+    engine = create_engine(admin_database_url(), poolclass=NullPool)
+    try:
+        with engine.connect() as conn:
+            applied = applied_migrations(conn)
+    except OperationalError:
+        # 타겟 DB가 아직 없음 -> 전부 pending
+        applied = None
+    finally:
+        engine.dispose()
+
+    planned = planned_migrations(load_test_data)
+    pending = {name for name, _ in pending_migrations(planned, applied)}
+    planned_names = {name for name, _ in planned}
+    status = []
+    for name, _ in MIGRATIONS:
+        if name not in planned_names:
+            status.append((name, "skipped"))
+        else:
+            status.append((name, "pending" if name in pending else "applied"))
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="버전/체크섬 기반 스키마 적용")
+    parser.add_argument("--status", action="store_true", help="적용하지 않고 파일별 상태만 출력")
+    args = parser.parse_args()
+
+    print(f"APP_ENV={APP_ENV}, LOAD_TEST_DATA={int(LOAD_TEST_DATA)}")
+    if args.status:
+        for name, state in migration_status():
+            print(f"{state:<9}{name}")
+        return
+
+    started = time.perf_counter()
+    applied = migrate()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if applied:
+        print(f"{len(applied)}개 파일 적용 ({elapsed_ms:.0f} ms): {', '.join(applied)}")
+    else:
+        print(f"스키마가 최신입니다. ({elapsed_ms:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
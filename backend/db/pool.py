@@ -0,0 +1,137 @@
+"""
+커넥션 풀 설정과 계측
+
+- 풀 크기/오버플로/타임아웃/재활용/pre-ping 값은 .env에서 읽는다.
+- 요청이 커넥션을 얻기까지 걸린 시간(대기 + 새 연결 생성)을 풀 클래스에서 직접 측정해
+  누적 히스토그램(le_Xms: X ms 이하로 얻은 횟수)으로 모은다. (SQLAlchemy의 checkout 이벤트는 커넥션을 얻은 뒤에 호출되어 대기 시간을 알 수 없음)
+"""
+import itertools
+import os
+import threading
+import time
+from dotenv import load_dotenv
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+# 서버 시작 시 풀 크기만큼 미리 연결해 둘지 여부
+DB_POOL_WARMUP = os.getenv("DB_POOL_WARMUP", "0") == "1"
+
+# 커넥션 획득 시간 히스토그램 구간 (ms, 상한)
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """
+    커넥션 획득 횟수/시간/타임아웃 집계
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners = []
+        self.reset()
+
+    def add_listener(self, listener) -> None:
+        """
+        커넥션 획득 시간(ms)을 받을 함수 등록 (요청 단위 메트릭 등, 타임아웃은 전달하지 않음)
+        """
+        self._listeners.append(listener)
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.buckets = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)  # 구간별 횟수 (마지막 칸은 +Inf), snapshot에서 누적
+
+    def observe(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait_ms += elapsed_ms
+            self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+            for i, upper in enumerate(CHECKOUT_BUCKETS_MS):
+                if elapsed_ms <= upper:
+                    self.buckets[i] += 1
+                    break
+            else:
+                self.buckets[-1] += 1
+        for listener in self._listeners:
+            listener(elapsed_ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"le_{upper}ms" for upper in CHECKOUT_BUCKETS_MS] + ["le_inf"]
+            # Prometheus 히스토그램처럼 누적 값 (le_Xms = X ms 이하로 획득한 횟수, le_inf = 전체)
+            cumulative = list(itertools.accumulate(self.buckets))
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": self.total_wait_ms / self.checkouts if self.checkouts else 0.0,
+                "max_wait_ms": self.max_wait_ms,
+                "checkout_histogram": dict(zip(labels, cumulative)),
+            }
+
+
+def instrumented_pool_class(base: type, metrics: PoolMetrics) -> type:
+    """
+    base 풀 클래스(QueuePool / AsyncAdaptedQueuePool)의 커넥션 획득(_do_get)을 측정하는 하위 클래스 생성
+    풀이 재생성(recreate)되어도 같은 metrics에 계속 집계되도록 클래스 속성으로 묶어 둔다.
+    """
+
+    class InstrumentedPool(base):
+        _metrics = metrics
+
+        def _do_get(self):
+            started_at = time.perf_counter()
+            try:
+                conn = super()._do_get()
+            except PoolTimeoutError:
+                self._metrics.observe((time.perf_counter() - started_at) * 1000, timed_out=True)
+                raise
+            self._metrics.observe((time.perf_counter() - started_at) * 1000)
+            return conn
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def engine_pool_options(metrics: PoolMetrics, is_async: bool = False) -> dict:
+    """
+    create_engine / create_async_engine에 넘길 풀 관련 인자
+    """
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    return {
+        "poolclass": instrumented_pool_class(base, metrics),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def pool_status(pool, metrics: PoolMetrics) -> dict:
+    """
+    현재 풀 상태 + 누적 획득 통계
+    """
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "timeout": DB_POOL_TIMEOUT,
+        "recycle": DB_POOL_RECYCLE,
+        "pre_ping": DB_POOL_PRE_PING,
+        "connections": pool.checkedin() + pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        **metrics.snapshot(),
+    }
@@ -0,0 +1,153 @@
+"""
+Project_Stats / Student_Reputation 정합성 검사/복구
+
+두 집계 테이블은 트리거가 유지하지만, 트리거를 끈 채 대량 적재했거나 수동으로 데이터를 고친 경우
+원본 테이블(Applications, Peer_Reviews)에서 다시 계산한 값(ProjectStatsComputedView,
+StudentReputationComputedView)과 어긋날 수 있다.
+집계 테이블 쓰기 권한은 관리자에게만 있으므로 관리자 계정(ADMIN_USER/ADMIN_PASSWORD)으로 접속한다.
+
+실행 (backend 디렉터리에서):
+    python -m db.project_stats            # 어긋난 행만 출력
+    python -m db.project_stats --repair   # 어긋난 행을 다시 계산한 값으로 복구
+"""
+import argparse
+import sys
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import NullPool
+from db.init_db import admin_database_url
+
+_DRIFT_SQL = """
+SELECT
+    c.project_id,
+    s.accepted_members AS stored_accepted_members, c.accepted_members,
+    s.pending_applications AS stored_pending_applications, c.pending_applications,
+    s.reviews_written AS stored_reviews_written, c.reviews_written
+FROM ProjectStatsComputedView c
+LEFT JOIN Project_Stats s ON s.project_id = c.project_id
+WHERE s.project_id IS NULL
+   OR (s.accepted_members, s.pending_applications, s.reviews_written)
+      IS DISTINCT FROM (c.accepted_members, c.pending_applications, c.reviews_written)
+ORDER BY c.project_id
+"""
+
+
+def check_project_stats(conn: Connection) -> list[dict]:
+    """
+    저장된 집계와 다시 계산한 집계가 다른 프로젝트 목록 (행이 없는 경우 stored_* 값은 None)
+    """
+    return [dict(r) for r in conn.execute(text(_DRIFT_SQL)).mappings().all()]
+
+
+def repair_project_stats(conn: Connection) -> list[dict]:
+    """
+    어긋난 프로젝트의 집계를 다시 계산한 값으로 덮어쓰고, 복구한 행 목록을 반환
+    - 호출자의 트랜잭션 안에서 실행된다.
+    - 검사와 복구 사이에 지원/리뷰가 바뀌지 않도록 두 테이블의 쓰기를 잠시 막는다.
+    """
+    conn.execute(text("LOCK TABLE Applications, Peer_Reviews IN SHARE MODE"))
+    drift = check_project_stats(conn)
+    if drift:
+        conn.execute(text(
+            """
+            INSERT INTO Project_Stats (project_id, accepted_members, pending_applications, reviews_written)
+            SELECT project_id, accepted_members, pending_applications, reviews_written
+            FROM ProjectStatsComputedView
+            WHERE project_id = ANY(CAST(:project_ids AS integer[]))
+            ON CONFLICT (project_id) DO UPDATE
+            SET accepted_members = EXCLUDED.accepted_members,
+                pending_applications = EXCLUDED.pending_applications,
+                reviews_written = EXCLUDED.reviews_written
+            """
+        ), {"project_ids": [row["project_id"] for row in drift]})
+    return drift
+
+
+_REPUTATION_COLUMNS = ("review_count", "score_sum", "score_1", "score_2", "score_3", "score_4", "score_5")
+
+_REPUTATION_DRIFT_SQL = f"""
+SELECT
+    COALESCE(c.uid, r.uid) AS uid,
+    {", ".join(f"r.{col} AS stored_{col}, COALESCE(c.{col}, 0) AS {col}" for col in _REPUTATION_COLUMNS)}
+FROM StudentReputationComputedView c
+FULL JOIN Student_Reputation r ON r.uid = c.uid
+WHERE ({", ".join(f"r.{col}" for col in _REPUTATION_COLUMNS)})
+      IS DISTINCT FROM ({", ".join(f"COALESCE(c.{col}, 0)" for col in _REPUTATION_COLUMNS)})
+ORDER BY 1
+"""
+
+
+def check_student_reputation(conn: Connection) -> list[dict]:
+    """
+    저장된 평판과 다시 계산한 평판이 다른 학생 목록 (행이 없는 경우 stored_* 값은 None)
+    """
+    return [dict(r) for r in conn.execute(text(_REPUTATION_DRIFT_SQL)).mappings().all()]
+
+
+def repair_student_reputation(conn: Connection) -> list[dict]:
+    """
+    어긋난 학생의 평판을 다시 계산한 값으로 덮어쓰고, 복구한 행 목록을 반환
+    - 호출자의 트랜잭션 안에서 실행된다. (리뷰가 모두 지워진 학생은 0으로 맞춤)
+    """
+    conn.execute(text("LOCK TABLE Peer_Reviews IN SHARE MODE"))
+    drift = check_student_reputation(conn)
+    if drift:
+        conn.execute(text(
+            f"""
+            INSERT INTO Student_Reputation (uid, {", ".join(_REPUTATION_COLUMNS)})
+            SELECT u.uid, {", ".join(f"COALESCE(c.{col}, 0)" for col in _REPUTATION_COLUMNS)}
+            FROM unnest(CAST(:uids AS text[])) AS u(uid)
+            LEFT JOIN StudentReputationComputedView c ON c.uid = u.uid
+            ON CONFLICT (uid) DO UPDATE
+            SET {", ".join(f"{col} = EXCLUDED.{col}" for col in _REPUTATION_COLUMNS)},
+                row_version = Student_Reputation.row_version + 1
+            """
+        ), {"uids": [row["uid"] for row in drift]})
+    return drift
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project_Stats / Student_Reputation 정합성 검사/복구")
+    parser.add_argument("--repair", action="store_true", help="어긋난 행을 다시 계산한 값으로 복구")
+    args = parser.parse_args()
+
+    url = admin_database_url()
+    if not url:
+        print("!!! ADMIN_PASSWORD가 설정되지 않았습니다.")
+        sys.exit(2)
+
+    engine = create_engine(url, poolclass=NullPool)
+    try:
+        with engine.begin() as conn:
+            if args.repair:
+                drift, reputation_drift = repair_project_stats(conn), repair_student_reputation(conn)
+            else:
+                drift, reputation_drift = check_project_stats(conn), check_student_reputation(conn)
+    finally:
+        engine.dispose()
+
+    for row in drift:
+        print(
+            f"project {row['project_id']}: "
+            f"accepted {row['stored_accepted_members']} -> {row['accepted_members']}, "
+            f"pending {row['stored_pending_applications']} -> {row['pending_applications']}, "
+            f"reviews {row['stored_reviews_written']} -> {row['reviews_written']}"
+        )
+    for row in reputation_drift:
+        print(
+            f"student {row['uid']}: "
+            f"reviews {row['stored_review_count']} -> {row['review_count']}, "
+            f"score sum {row['stored_score_sum']} -> {row['score_sum']}, "
+            f"histogram {[row[f'stored_score_{i}'] for i in range(1, 6)]} -> {[row[f'score_{i}'] for i in range(1, 6)]}"
+        )
+    if not drift and not reputation_drift:
+        print("Project_Stats / Student_Reputation 정합성 이상 없음")
+    elif args.repair:
+        print(f"{len(drift)}개 프로젝트 집계, {len(reputation_drift)}명 평판을 복구했습니다.")
+    else:
+        print(f"{len(drift)}개 프로젝트 집계, {len(reputation_drift)}명 평판이 어긋났습니다. --repair 로 복구할 수 있습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+벤치마크용 합성 데이터 생성/적재
+
+TestData.sql(프로젝트 7개)로는 운영 규모에서 쿼리가 어떻게 동작하는지 알 수 없으므로,
+시드 값으로 재현 가능한 대량 데이터를 만들어 COPY로 적재한다.
+
+- 학생 N명 (uid: seed_0000001 ...), 보유 스킬은 Zipf 분포의 스킬 어휘에서 선택
+- 프로젝트 (기본 N/2개): 모집 중 / 진행 중 / 완료 상태, 마감일은 오늘 전후로 분포
+- 지원서: 모집 중 프로젝트는 대기/수락/거절, 진행 중/완료 프로젝트는 수락/거절 (수락은 정원 - 1명 이내)
+- 동료 리뷰: 완료된 프로젝트의 멤버(리더 + 수락된 지원자) 사이
+- 한 트랜잭션에서 행 단위 트리거를 끄고 COPY로 적재한 뒤 다시 켜고,
+  트리거가 유지하던 값(Project_Stats, Student_Reputation, Entity_Versions)은 적재 후 한 번에 맞춘다.
+- 이미 적재된 DB(seed_ 학생이 있음)에서는 아무것도 하지 않는다.
+- 트리거를 끄려면 테이블 소유자 권한이 필요하므로 관리자 계정(ADMIN_USER/ADMIN_PASSWORD)으로 접속한다.
+
+실행 (backend 디렉터리에서):
+    python -m db.seed --students 100000            # 학생 10만 / 프로젝트 5만, 약 100만 행
+    python -m db.seed --students 1000 --seed 7
+서버 시작 시 적재: .env에 SEED_STUDENTS=<학생 수> (init_db 마지막 단계에서 실행)
+"""
+import argparse
+import io
+import itertools
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import NullPool
+from db.init_db import admin_database_url
+from db.project_stats import repair_project_stats, repair_student_reputation
+from db.utils import hash_password
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+SEED_STUDENTS = int(os.getenv("SEED_STUDENTS", "0"))
+SEED_RANDOM_SEED = int(os.getenv("SEED_RANDOM_SEED", "42"))
+
+SEED_UID_PREFIX = "seed_"
+# 합성 학생의 비밀번호 (TestData.sql과 동일)
+SEED_PASSWORD = "pw1234"
+
+# 적재 중 행 단위 트리거를 끌 테이블 (적재 순서)
+_SEED_TABLES = ("Students", "Student_Skills", "Projects", "Project_Required_Skills", "Applications", "Peer_Reviews")
+
+# 자주 쓰이는 순서대로 (앞쪽일수록 Zipf 가중치가 큼), 나머지 어휘는 lib-<n>으로 채운다.
+_COMMON_SKILLS = [
+    "python", "javascript", "react", "java", "git", "sql", "typescript", "spring boot", "nodejs", "figma",
+    "docker", "aws", "mysql", "postgresql", "django", "fastapi", "c++", "pandas", "nextjs", "kotlin",
+    "vue", "flutter", "swift", "pytorch", "tensorflow", "redis", "c", "github", "notion", "jira",
+    "go", "rust", "kubernetes", "graphql", "linux", "unity", "android", "ios", "r", "matlab",
+]
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_GIVEN = "민준서연지우도윤하은예준수아시우지호유진현우채원건우다은"
+_TOPICS = [
+    "{skill} 기반 {domain} 서비스 개발", "{domain} 공모전 팀원 모집 ({skill})", "{skill} 스터디",
+    "{domain} 캡스톤 디자인 프로젝트", "{skill}로 만드는 {domain} 플랫폼", "{domain} 해커톤 ({skill} 개발자 구함)",
+]
+_DOMAINS = ["학습 관리", "중고 거래", "동아리 관리", "헬스케어", "여행 추천", "금융 분석", "커뮤니티", "일정 관리", "음악 추천", "캠퍼스 지도"]
+_COMMENTS = [
+    "맡은 일을 끝까지 책임감 있게 해냈습니다.", "소통이 원활해서 협업하기 좋았습니다.",
+    "기술적으로 많이 배웠습니다.", "일정 관리가 조금 아쉬웠습니다.", "다음에도 같이 하고 싶은 팀원입니다.",
+]
+
+
+class _CopySource(io.TextIOBase):
+    """
+    행 생성기를 COPY FROM STDIN에 넘길 파일 객체로 감싼다 (전체를 메모리에 올리지 않음)
+    """
+
+    def __init__(self, rows):
+        self._lines = ("\t".join(_copy_value(v) for v in row) + "\n" for row in rows)
+        self._buffer = ""
+        self.rows = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            lines = list(itertools.islice(self._lines, 1000))
+            if not lines:
+                break
+            self.rows += len(lines)
+            chunk = "".join(lines)
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _copy_value(value) -> str:
+    # COPY text 형식: NULL은 \N, 구분자/줄바꿈/역슬래시는 이스케이프
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy(conn: Connection, table: str, columns: tuple[str, ...], rows) -> int:
+    # 같은 트랜잭션에서 실행되도록 SQLAlchemy 연결의 psycopg2 커서를 사용
+    source = _CopySource(rows)
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", source)
+    finally:
+        cursor.close()
+    return source.rows
+
+
+def _zipf_cum_weights(n: int, s: float = 1.1) -> list[float]:
+    return list(itertools.accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+
+
+def _pick_skills(rng: random.Random, skill_ids: list[int], cum_weights: list[float], k: int) -> list[int]:
+    # Zipf 가중치로 k번 뽑고 중복 제거 (인기 스킬은 겹쳐서 실제 개수가 k보다 적을 수 있음)
+    return list(dict.fromkeys(rng.choices(skill_ids, cum_weights=cum_weights, k=k)))
+
+
+def is_seeded(conn: Connection) -> bool:
+    return conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM Students WHERE uid LIKE :prefix)"
+    ), {"prefix": f"{SEED_UID_PREFIX}%"}).scalar()
+
+
+def seed_database(conn: Connection, students: int, projects: int | None = None, vocabulary: int = 300,
+                  seed: int = SEED_RANDOM_SEED) -> dict[str, int]:
+    """
+    합성 데이터를 적재하고 테이블별 적재 행 수를 반환 (이미 적재된 경우 빈 dict)
+    - 호출자의 트랜잭션 안에서 실행되며 COMMIT 하지 않는다. (관리자 연결이어야 함)
+    - 같은 seed와 인자로 빈 DB에 적재하면 같은 데이터가 만들어진다.
+    """
+    if students <= 1 or is_seeded(conn):
+        return {}
+    projects = students // 2 if projects is None else projects
+    rng = random.Random(seed)
+    today = date.today()
+    counts: dict[str, int] = {}
+
+    # 적재 중 다른 쓰기가 끼어들지 않도록 잠그고(트리거 비활성화도 같은 잠금이 필요), 행 단위 트리거 끄기
+    for table in _SEED_TABLES:
+        conn.execute(text(f"ALTER TABLE {table} DISABLE TRIGGER USER"))
+
+    # 스킬 어휘: 기존 스킬은 그대로 두고 없는 이름만 추가
+    names = (_COMMON_SKILLS + [f"lib-{i}" for i in range(vocabulary)])[:max(vocabulary, 1)]
+    conn.execute(text(
+        "INSERT INTO Skills (skill_name) SELECT unnest(CAST(:names AS text[])) ON CONFLICT (skill_name) DO NOTHING"
+    ), {"names": names})
+    name_to_id = dict(conn.execute(text(
+        "SELECT skill_name, skill_id FROM Skills WHERE skill_name = ANY(CAST(:names AS text[]))"
+    ), {"names": names}).fetchall())
+    skill_ids = [name_to_id[name] for name in names]
+    skill_names = {skill_id: name for name, skill_id in name_to_id.items()}
+    cum_weights = _zipf_cum_weights(len(skill_ids))
+
+    # 학생: 비밀번호 해시는 한 번만 계산해 모든 학생이 공유
+    hashed = hash_password(SEED_PASSWORD)
+    uids = [f"{SEED_UID_PREFIX}{i:07d}" for i in range(1, students + 1)]
+    student_rows = (
+        (uid, rng.choice(_SURNAMES) + rng.choice(_GIVEN) + rng.choice(_GIVEN), hashed, f"{uid}@univ.ac.kr",
+         f"{rng.choice(_DOMAINS)} 분야에 관심 있는 학생입니다.", "")
+        for uid in uids
+    )
+    counts["students"] = _copy(conn, "Students", ("uid", "name", "hashed_password", "email", "profile_text", "website_link"), student_rows)
+
+    student_skill_rows = (
+        (uid, skill_id)
+        for uid in uids
+        for skill_id in _pick_skills(rng, skill_ids, cum_weights, rng.randint(1, 7))
+    )
+    counts["student_skills"] = _copy(conn, "Student_Skills", ("uid", "skill_id"), student_skill_rows)
+
+    # 프로젝트: 참조할 id를 미리 정하기 위해 project_id를 직접 지정하고 시퀀스를 맞춘다.
+    first_id = conn.execute(text("SELECT COALESCE(MAX(project_id), 0) + 1 FROM Projects")).scalar()
+    project_meta = []  # (project_id, leader_index, capacity, deadline, status)
+    project_rows = []
+    required_rows = []
+    for project_id in range(first_id, first_id + projects):
+        roll = rng.random()
+        if roll < 0.5:
+            status, deadline = "Recruiting", today + timedelta(days=rng.randint(-14, 60))
+        elif roll < 0.8:
+            status, deadline = "In_Progress", today - timedelta(days=rng.randint(0, 90))
+        else:
+            status, deadline = "Completed", today - timedelta(days=rng.randint(30, 540))
+        leader = rng.randrange(students)
+        capacity = rng.randint(2, 8)
+        required = _pick_skills(rng, skill_ids, cum_weights, rng.randint(1, 5))
+        skill = skill_names[required[0]]
+        domain = rng.choice(_DOMAINS)
+        project_meta.append((project_id, leader, capacity, deadline, status))
+        project_rows.append((
+            project_id, uids[leader], rng.choice(_TOPICS).format(skill=skill, domain=domain),
+            f"{domain} 프로젝트를 함께할 {skill} 팀원을 찾습니다.",
+            f"필요 기술: {', '.join(skill_names[s] for s in required)}\n정원 {capacity}명, 마감 {deadline.isoformat()}",
+            capacity, deadline, status,
+        ))
+        required_rows.extend((project_id, skill_id) for skill_id in required)
+    counts["projects"] = _copy(
+        conn, "Projects", ("project_id", "leader_id", "topic", "description1", "description2", "capacity", "deadline", "status"),
+        project_rows,
+    )
+    conn.execute(text("SELECT setval('projects_project_id_seq', (SELECT MAX(project_id) FROM Projects))"))
+    counts["project_required_skills"] = _copy(conn, "Project_Required_Skills", ("project_id", "skill_id"), required_rows)
+    del project_rows, required_rows
+
+    # 지원서 + 완료된 프로젝트의 리뷰
+    application_rows = []
+    review_rows = []
+    for project_id, leader, capacity, deadline, status in project_meta:
+        applicants = [i for i in rng.sample(range(students), min(students, rng.randint(0, 10))) if i != leader]
+        accepted_slots = rng.randint(0, capacity - 1) if status == "Recruiting" else capacity - 1
+        members = [leader]
+        for applicant in applicants:
+            if len(members) - 1 < accepted_slots and rng.random() < 0.6:
+                app_status = "Accepted"
+                members.append(applicant)
+            elif status == "Recruiting" and rng.random() < 0.7:
+                app_status = "Pending"
+            else:
+                app_status = "Rejected"
+            applied_on = min(deadline, today) - timedelta(days=rng.randint(0, 30))
+            application_rows.append((project_id, uids[applicant], applied_on, "프로젝트에 기여하고 싶어 지원합니다.", app_status))
+        if status == "Completed":
+            for reviewer, reviewee in itertools.permutations(members, 2):
+                if rng.random() < 0.7:
+                    review_rows.append((
+                        project_id, uids[reviewer], uids[reviewee],
+                        rng.choices((1, 2, 3, 4, 5), weights=(1, 2, 8, 20, 25))[0], rng.choice(_COMMENTS),
+                    ))
+    counts["applications"] = _copy(
+        conn, "Applications", ("project_id", "applicant_id", "applicant_date", "motivation", "status"), application_rows,
+    )
+    counts["peer_reviews"] = _copy(
+        conn, "Peer_Reviews", ("project_id", "reviewer_id", "reviewee_id", "score", "comment"), review_rows,
+    )
+
+    # 트리거를 다시 켜고, 트리거가 유지하던 값을 한 번에 맞춘다.
+    for table in _SEED_TABLES:
+        conn.execute(text(f"ALTER TABLE {table} ENABLE TRIGGER USER"))
+    repair_project_stats(conn)
+    repair_student_reputation(conn)
+    conn.execute(text("UPDATE Entity_Versions SET version = version + 1"))
+    return counts
+
+
+def analyze_seed_tables(conn: Connection) -> None:
+    """
+    적재 후 플래너 통계 갱신
+    """
+    for table in _SEED_TABLES + ("Skills", "Project_Stats", "Student_Reputation"):
+        conn.execute(text(f"ANALYZE {table}"))
+
+
+def run_seed(students: int, projects: int | None = None, vocabulary: int = 300, seed: int = SEED_RANDOM_SEED) -> dict[str, int]:
+    """
+    관리자 계정으로 접속해 seed_database + ANALYZE 실행 (CLI, init_db에서 사용)
+    """
+    url = admin_database_url()
+    if not url:
+        raise RuntimeError("ADMIN_PASSWORD가 설정되지 않았습니다.")
+    engine = create_engine(url, poolclass=NullPool)
+    try:
+        with engine.begin() as conn:
+            counts = seed_database(conn, students, projects, vocabulary, seed)
+        if counts:
+            with engine.begin() as conn:
+                analyze_seed_tables(conn)
+    finally:
+        engine.dispose()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성/적재")
+    parser.add_argument("--students", type=int, default=SEED_STUDENTS or 100000, help="학생 수")
+    parser.add_argument("--projects", type=int, default=None, help="프로젝트 수 (기본: 학생 수 / 2)")
+    parser.add_argument("--skills", type=int, default=300, help="스킬 어휘 크기")
+    parser.add_argument("--seed", type=int, default=SEED_RANDOM_SEED, help="난수 시드")
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    try:
+        counts = run_seed(args.students, args.projects, args.skills, args.seed)
+    except RuntimeError as e:
+        print(f"!!! {e}")
+        sys.exit(2)
+    if not counts:
+        print("이미 합성 데이터가 적재되어 있습니다. (seed_ 학생 존재)")
+        return
+    for table, count in counts.items():
+        print(f"{table:<26}{count:>10,}")
+    print(f"{'total':<26}{sum(counts.values()):>10,}  ({time.perf_counter() - started_at:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
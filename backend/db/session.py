@@ -3,12 +3,28 @@ SQLAlchemy 기반 DB 세션 관리
 
 이 파일은 ORM(=SQLAlchemy)을 사용할 때 앱 전반에서 재사용할 Engine과 SessionLocal을 제공하고,
 FastAPI 의존성으로 사용할 `get_db()` 제너레이터를 노출합니다.
+
+DB_MODE=async 이면 asyncpg 기반 AsyncEngine/AsyncSessionLocal도 함께 만들고,
+요청 경로는 `get_async_db()`를 사용합니다. (기본값 sync: 기존 psycopg2 + 스레드풀 경로)
+
+커넥션 풀 설정(DB_POOL_*)과 커넥션 획득 통계는 db/pool.py 참고
+
+`role_transaction()`은 요청 세션의 커넥션에서 SET LOCAL ROLE로 권한을 바꿔 실행하는 트랜잭션,
+`record_statements()`는 블록 안에서 DB로 보낸 SQL 문(트랜잭션 제어 포함)을 기록하는 도구입니다.
+요청 단위 SQL 메트릭(METRICS_ENABLED)은 db/metrics.py 참고
 """
 import os
-from typing import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Generator, Iterator
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from db.pool import DB_POOL_SIZE, PoolMetrics, engine_pool_options, pool_status
+from db.metrics import METRICS_ENABLED, install_metrics_hooks
 
 # .env 파일에서 환경변수 로드
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
@@ -21,9 +37,16 @@ POSTGRES_HOST = os.getenv("POSTGRES_HOST")
 POSTGRES_PORT = int(os.getenv("POSTGRES_PORT"))
 
 DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
+# 요청 경로의 DB 접근 방식 (sync: psycopg2 + 스레드풀, async: asyncpg + 이벤트 루프)
+DB_MODE = os.getenv("DB_MODE", "sync").lower()
 
-engine = create_engine(DATABASE_URL, echo=False, future=True, pool_pre_ping=True)
+
+engine_pool_metrics = PoolMetrics()
+if METRICS_ENABLED:
+    install_metrics_hooks(engine_pool_metrics)
+engine = create_engine(DATABASE_URL, echo=False, future=True, **engine_pool_options(engine_pool_metrics))
 SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, future=True)
 
 def get_db() -> Generator[Session, None, None]:
@@ -38,6 +61,126 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+
+# 비동기 모드에서만 AsyncEngine 생성 (동기 모드에서는 asyncpg 드라이버가 필요 없음)
+if DB_MODE == "async":
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False, **engine_pool_options(engine_pool_metrics, is_async=True))
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+else:
+    async_engine = None
+    AsyncSessionLocal = None
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 모드용 세션 생성/반환 제너레이터.
+    - 요청 동안 하나의 AsyncSession을 사용하고, 끝나면 close()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_pool_status() -> dict:
+    """
+    요청 경로에서 사용하는 엔진의 풀 상태
+    """
+    pool = async_engine.pool if async_engine is not None else engine.pool
+    return {"db_mode": DB_MODE, **pool_status(pool, engine_pool_metrics)}
+
+
+def warm_pool() -> None:
+    """
+    풀 크기만큼 커넥션을 동시에 열었다가 반납해 풀을 채워 둔다. (DB_POOL_WARMUP=1일 때 lifespan에서 호출)
+    배포 직후 첫 요청들이 연결 생성 비용을 내지 않도록 하기 위함
+    """
+    conns = []
+    try:
+        for _ in range(DB_POOL_SIZE):
+            conn = engine.connect()
+            conns.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            conn.close()
+
+
+async def warm_async_pool() -> None:
+    """
+    warm_pool()의 비동기 모드 버전
+    """
+    conns = []
+    try:
+        for _ in range(DB_POOL_SIZE):
+            conn = await async_engine.connect()
+            conns.append(conn)
+            await conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            await conn.close()
+
+@contextmanager
+def role_transaction(db: Session, role: str, error_message: str) -> Iterator[Session]:
+    """
+    요청 세션의 현재 트랜잭션 안에서 `SET LOCAL ROLE <role>` 후 블록을 실행하고 COMMIT 한다.
+
+    - 블록 앞에서 세션으로 실행한 검증 쿼리와 같은 커넥션/트랜잭션을 사용하므로 두 번째 커넥션이 필요 없다.
+    - SET LOCAL은 COMMIT/ROLLBACK 시 자동으로 원래 역할로 돌아가므로 RESET ROLE이 필요 없고,
+      다른 역할인 채로 커넥션이 풀에 반납되지 않는다.
+    - SET ROLE 실패나 권한 오류 등 DB 오류는 ROLLBACK 후 PermissionError(error_message: 원인)로 변환
+      블록에서 직접 발생시킨 예외(ValueError 등)는 ROLLBACK 후 그대로 전달
+    """
+    try:
+        db.execute(text(f"SET LOCAL ROLE {role}"))
+        yield db
+        db.commit()
+    except DBAPIError as e:
+        db.rollback()
+        raise PermissionError(f"{error_message}: {e}")
+    except Exception:
+        db.rollback()
+        raise
+
+
+# 현재 컨텍스트(요청)에서 기록 중인 SQL 문 목록. None이면 기록하지 않음
+_recorded_statements: ContextVar[list[str] | None] = ContextVar("recorded_statements", default=None)
+
+@contextmanager
+def record_statements() -> Iterator[list[str]]:
+    """
+    블록 안에서 DB로 보낸 SQL 문을 순서대로 기록
+    BEGIN/COMMIT/ROLLBACK도 각각 한 번의 왕복이므로 함께 기록된다.
+
+        with record_statements() as statements:
+            update_project_status(db, ...)
+        print(len(statements))
+    """
+    statements: list[str] = []
+    token = _recorded_statements.set(statements)
+    try:
+        yield statements
+    finally:
+        _recorded_statements.reset(token)
+
+def _record(statement: str) -> None:
+    statements = _recorded_statements.get()
+    if statements is not None:
+        statements.append(statement)
+
+# 동기/비동기 엔진 모두 Engine 이벤트로 잡힌다. (AsyncEngine은 내부의 sync_engine에서 발생)
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record(" ".join(statement.split()))
+
+@event.listens_for(Engine, "begin")
+def _record_begin(conn):
+    _record("BEGIN")
+
+@event.listens_for(Engine, "commit")
+def _record_commit(conn):
+    _record("COMMIT")
+
+@event.listens_for(Engine, "rollback")
+def _record_rollback(conn):
+    _record("ROLLBACK")
+
 # def init_db(base_metadata) -> None:
 #     """
 #     현재는 CreateTable.sql을 사용하므로 필요시 구현할 예정
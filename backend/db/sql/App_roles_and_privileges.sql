@@ -25,6 +25,9 @@ ON public.recruitingprojectsview,
    public.completedprojectsview
 TO other, leader;
 
+-- Project_Stats, Entity_Versions, Student_Reputation: 조회만 허용 (값은 트리거가 관리)
+GRANT SELECT ON public.project_stats, public.entity_versions, public.student_reputation TO other, leader;
+
 GRANT USAGE, SELECT ON SEQUENCE
   public.skills_skill_id_seq,
   public.projects_project_id_seq,
@@ -40,3 +43,10 @@ GRANT UPDATE (status) ON public.applications TO leader;
 -- ProjectApplicantsView: 리더만 조회
 GRANT SELECT ON public.projectapplicantsview TO leader;
 
+-- 마감/완료 프로젝트 보관 함수 (SECURITY DEFINER): 앱 역할만 실행 (스위퍼가 앱 계정으로 호출)
+REVOKE ALL ON FUNCTION public.archive_expired_projects(INTEGER, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.archive_expired_projects(INTEGER, INTEGER) TO other, leader;
+
+
+-- 엔티티 버전 증가 함수 (SECURITY DEFINER): 트리거에서만 호출하므로 직접 실행은 막음
+REVOKE ALL ON FUNCTION public.increment_entity_version(TEXT) FROM PUBLIC;
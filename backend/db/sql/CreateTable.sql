@@ -78,42 +78,113 @@ CREATE TABLE IF NOT EXISTS Peer_Reviews (
     CHECK (reviewer_id != reviewee_id)
 );
 
+-- 학생별 받은 리뷰 집계 (평판). Peer_Reviews 트리거가 리뷰 작성과 같은 트랜잭션에서 증감 (아래 Student_Reputation 참고)
+CREATE TABLE IF NOT EXISTS Student_Reputation (
+    uid VARCHAR(50) PRIMARY KEY REFERENCES Students(uid) ON DELETE CASCADE,
+    review_count INTEGER NOT NULL DEFAULT 0,  -- 받은 리뷰 수
+    score_sum INTEGER NOT NULL DEFAULT 0,     -- 점수 합계 (평균 = score_sum / review_count)
+    score_1 INTEGER NOT NULL DEFAULT 0,       -- 점수별 리뷰 수 (히스토그램)
+    score_2 INTEGER NOT NULL DEFAULT 0,
+    score_3 INTEGER NOT NULL DEFAULT 0,
+    score_4 INTEGER NOT NULL DEFAULT 0,
+    score_5 INTEGER NOT NULL DEFAULT 0,
+    row_version BIGINT NOT NULL DEFAULT 1     -- 바뀔 때마다 증가 (프로필 ETag)
+);
+
 -- 리더 아이디(leader_id) 기준 프로젝트 조회를 위한 인덱스
 CREATE INDEX IF NOT EXISTS idx_projects_leader ON Projects(leader_id);
 
+-- 보관(archived) 상태: 마감된 모집글과 오래전에 완료된 프로젝트는 스위퍼(crud/project_archive.py)가
+-- archived_at을 채워 목록 경로(View, 인덱스)에서 빼낸다. 행은 그대로 남으므로 id로는 계속 조회된다.
+ALTER TABLE Projects ADD COLUMN IF NOT EXISTS archived_at TIMESTAMPTZ;
+ALTER TABLE Applications ADD COLUMN IF NOT EXISTS archived_at TIMESTAMPTZ;
+
+-- 아래 목록용 인덱스는 보관되지 않은(live) 행만 담는 부분 인덱스 (이전 전체 인덱스는 교체)
+DROP INDEX IF EXISTS idx_projects_recruiting_deadline;
+DROP INDEX IF EXISTS idx_projects_deadline_id;
+DROP INDEX IF EXISTS idx_projects_capacity_deadline_id;
+DROP INDEX IF EXISTS idx_projects_status_deadline_id;
+DROP INDEX IF EXISTS idx_projects_status_capacity_deadline_id;
+
 -- 모집 중(Recruiting) 상태인 프로젝트의 마감일 기준 부분 인덱스
-CREATE INDEX IF NOT EXISTS idx_projects_recruiting_deadline
-ON Projects(deadline) WHERE status = 'Recruiting';
+CREATE INDEX IF NOT EXISTS idx_projects_live_recruiting_deadline
+ON Projects(deadline) WHERE status = 'Recruiting' AND archived_at IS NULL;
 
 -- 승인된(Accepted) 상태의 지원 내역 조회를 위한 부분 인덱스
 CREATE INDEX IF NOT EXISTS idx_applications_project_accepted
 ON Applications(project_id) WHERE status = 'Accepted';
 
+-- 팀 구성 제안의 대기 중인 지원 조회용 부분 인덱스
+CREATE INDEX IF NOT EXISTS idx_applications_live_pending
+ON Applications(project_id) WHERE status = 'Pending' AND archived_at IS NULL;
+
+-- 프로젝트 목록 키셋 페이지네이션용 복합 인덱스 (정렬 키 + project_id)
+CREATE INDEX IF NOT EXISTS idx_projects_live_deadline_id
+ON Projects(deadline, project_id) WHERE archived_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_projects_live_capacity_deadline_id
+ON Projects(capacity DESC, deadline, project_id) WHERE archived_at IS NULL;
+
+-- 상태별 View(모집중/진행중/완료) 목록의 키셋 페이지네이션용 복합 인덱스
+CREATE INDEX IF NOT EXISTS idx_projects_live_status_deadline_id
+ON Projects(status, deadline, project_id) WHERE archived_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_projects_live_status_capacity_deadline_id
+ON Projects(status, capacity DESC, deadline, project_id) WHERE archived_at IS NULL;
+
+-- 프로젝트 검색용 tsvector 컬럼 (주제 > 요약 설명 > 상세 설명 순으로 가중치 부여, 자동 갱신)
+ALTER TABLE Projects ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(topic, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(description1, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(description2, '')), 'C')
+) STORED;
+
+-- 전문 검색/접두어 검색용 GIN 인덱스
+CREATE INDEX IF NOT EXISTS idx_projects_search_vector
+ON Projects USING GIN (search_vector);
+
+-- 내 지원 현황 키셋 페이지네이션용 복합 인덱스
+CREATE INDEX IF NOT EXISTS idx_applications_applicant_date_id
+ON Applications(applicant_id, applicant_date DESC, application_id DESC);
+
+-- 받은 리뷰 조회 (지원자 관리의 리뷰 통계/최근 리뷰 N개)를 위한 인덱스
+CREATE INDEX IF NOT EXISTS idx_peer_reviews_reviewee_id
+ON Peer_Reviews (reviewee_id, review_id DESC) INCLUDE (score);
+
 
 -- 모집 중인 프로젝트만 보여주는 View
+-- (마감일 조건은 자정 이후 다음 스위퍼 실행 전까지 남아 있는 마감된 모집글을 거르는 용도)
 CREATE OR REPLACE VIEW RecruitingProjectsView AS
 SELECT p.project_id, p.leader_id, p.topic, p.description1, p.capacity, p.deadline, p.status, s.name as leader_name
 FROM Projects p
 JOIN Students s ON p.leader_id = s.uid
 WHERE p.status = 'Recruiting' 
-  AND p.deadline >= CURRENT_DATE;
+  AND p.deadline >= CURRENT_DATE
+  AND p.archived_at IS NULL;
 
 -- 진행 중인 프로젝트만 보여주는 View
 CREATE OR REPLACE VIEW InProgressProjectsView AS
 SELECT p.project_id, p.leader_id, p.topic, p.description1, p.capacity, p.deadline, p.status, s.name as leader_name
 FROM Projects p
 JOIN Students s ON p.leader_id = s.uid
-WHERE p.status = 'In_Progress';
+WHERE p.status = 'In_Progress'
+  AND p.archived_at IS NULL;
 
 -- 완료된 프로젝트만 보여주는 View
 CREATE OR REPLACE VIEW CompletedProjectsView AS
 SELECT p.project_id, p.leader_id, p.topic, p.description1, p.capacity, p.deadline, p.status, s.name as leader_name
 FROM Projects p
 JOIN Students s ON p.leader_id = s.uid
-WHERE p.status = 'Completed';
+WHERE p.status = 'Completed'
+  AND p.archived_at IS NULL;
 
 
 -- 지원자 관리를 위한 지원자 정보 View
+-- 지원자별 스킬/리뷰는 LATERAL로 한 번씩 집계 (조회하지 않는 열의 LATERAL은 플래너가 제거)
+--   applicant_reviews: 전체 리뷰 (오래된 순)
+--   applicant_review_count / applicant_avg_score / applicant_score_histogram: Student_Reputation에서 바로 읽는 리뷰 통계
+--   최근 리뷰 N개만 필요하면 이 뷰에 Peer_Reviews를 LATERAL ... LIMIT N으로 붙여 조회 (idx_peer_reviews_reviewee_id)
 CREATE OR REPLACE VIEW ProjectApplicantsView AS
 SELECT
     p.leader_id         AS leader_id,
@@ -127,19 +198,502 @@ SELECT
     s.website_link      AS applicant_website_link,
     a.motivation        AS applicant_motivation,
     a.status            AS status,
-    COALESCE(
-        (SELECT array_agg(DISTINCT sk.skill_name)
-         FROM Student_Skills ss
-         JOIN Skills sk ON ss.skill_id = sk.skill_id
-         WHERE ss.uid = a.applicant_id),
-        ARRAY[]::text[]
-    ) AS applicant_skills,
-    COALESCE(
-        (SELECT json_agg(json_build_object('score', pr.score, 'comment', pr.comment))
-         FROM Peer_Reviews pr
-         WHERE pr.reviewee_id = a.applicant_id),
-        '[]'::json
-    ) AS applicant_reviews
+    COALESCE(skn.skill_names, ARRAY[]::text[]) AS applicant_skills,
+    COALESCE(rv.reviews, '[]'::json) AS applicant_reviews,
+    -- 스킬 id 배열 (앱에서 스킬 사전으로 이름 변환, Skills 조인 없음)
+    COALESCE(ski.skill_ids, ARRAY[]::integer[]) AS applicant_skill_ids,
+    COALESCE(rep.review_count, 0) AS applicant_review_count,
+    ROUND(rep.score_sum::numeric / NULLIF(rep.review_count, 0), 2)::float8 AS applicant_avg_score,
+    ARRAY[COALESCE(rep.score_1, 0), COALESCE(rep.score_2, 0), COALESCE(rep.score_3, 0),
+          COALESCE(rep.score_4, 0), COALESCE(rep.score_5, 0)] AS applicant_score_histogram,
+    -- 평판 점수 (0~1): 리뷰 5개 분량의 3점을 더한 베이지안 평균을 정규화 (리뷰가 없으면 0.5, 적으면 0.5 쪽으로 당겨짐)
+    ROUND(((COALESCE(rep.score_sum, 0) + 15)::numeric / (COALESCE(rep.review_count, 0) + 5) - 1) / 4, 4)::float8 AS applicant_reputation_score
 FROM Applications a
 JOIN Projects p ON a.project_id = p.project_id
-JOIN Students s ON a.applicant_id = s.uid;
+JOIN Students s ON a.applicant_id = s.uid
+LEFT JOIN Student_Reputation rep ON rep.uid = a.applicant_id
+LEFT JOIN LATERAL (
+    SELECT array_agg(DISTINCT sk.skill_name) AS skill_names
+    FROM Student_Skills ss
+    JOIN Skills sk ON ss.skill_id = sk.skill_id
+    WHERE ss.uid = a.applicant_id
+) skn ON true
+LEFT JOIN LATERAL (
+    SELECT array_agg(ss.skill_id) AS skill_ids
+    FROM Student_Skills ss
+    WHERE ss.uid = a.applicant_id
+) ski ON true
+LEFT JOIN LATERAL (
+    SELECT json_agg(json_build_object('score', pr.score, 'comment', pr.comment) ORDER BY pr.review_id) AS reviews
+    FROM Peer_Reviews pr
+    WHERE pr.reviewee_id = a.applicant_id
+) rv ON true;
+
+
+-- 프로젝트별 집계 (읽기 경로에서 COUNT 대신 사용, 아래 트리거가 정확하게 유지)
+CREATE TABLE IF NOT EXISTS Project_Stats (
+    project_id INTEGER PRIMARY KEY REFERENCES Projects(project_id) ON DELETE CASCADE,
+    accepted_members INTEGER NOT NULL DEFAULT 0,      -- 수락된 지원자 수 (리더 제외)
+    pending_applications INTEGER NOT NULL DEFAULT 0,  -- 대기 중인 지원 수
+    reviews_written INTEGER NOT NULL DEFAULT 0        -- 작성된 동료 리뷰 수
+);
+
+-- 원본 테이블에서 다시 계산한 집계 (백필 및 정합성 검사/복구용)
+CREATE OR REPLACE VIEW ProjectStatsComputedView AS
+SELECT
+    p.project_id,
+    (SELECT COUNT(*) FROM Applications a
+     WHERE a.project_id = p.project_id AND a.status = 'Accepted' AND a.applicant_id <> p.leader_id)::int AS accepted_members,
+    (SELECT COUNT(*) FROM Applications a
+     WHERE a.project_id = p.project_id AND a.status = 'Pending')::int AS pending_applications,
+    (SELECT COUNT(*) FROM Peer_Reviews r
+     WHERE r.project_id = p.project_id)::int AS reviews_written
+FROM Projects p;
+
+-- 트리거 함수는 소유자(관리자) 권한으로 실행되므로 앱 역할(other/leader)에 Project_Stats 쓰기 권한을 줄 필요가 없음
+CREATE OR REPLACE FUNCTION project_stats_on_project_insert() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    INSERT INTO Project_Stats (project_id) VALUES (NEW.project_id) ON CONFLICT (project_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION project_stats_on_application_change() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.status IS NOT DISTINCT FROM NEW.status
+       AND OLD.project_id = NEW.project_id AND OLD.applicant_id = NEW.applicant_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Project_Stats ps
+        SET accepted_members = ps.accepted_members - (OLD.status = 'Accepted' AND OLD.applicant_id <> p.leader_id)::int,
+            pending_applications = ps.pending_applications - (OLD.status = 'Pending')::int
+        FROM Projects p
+        WHERE ps.project_id = OLD.project_id AND p.project_id = OLD.project_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE Project_Stats ps
+        SET accepted_members = ps.accepted_members + (NEW.status = 'Accepted' AND NEW.applicant_id <> p.leader_id)::int,
+            pending_applications = ps.pending_applications + (NEW.status = 'Pending')::int
+        FROM Projects p
+        WHERE ps.project_id = NEW.project_id AND p.project_id = NEW.project_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION project_stats_on_review_change() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE Project_Stats SET reviews_written = reviews_written + 1 WHERE project_id = NEW.project_id;
+    ELSE
+        UPDATE Project_Stats SET reviews_written = reviews_written - 1 WHERE project_id = OLD.project_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_project_stats_project_insert ON Projects;
+CREATE TRIGGER trg_project_stats_project_insert
+AFTER INSERT ON Projects
+FOR EACH ROW EXECUTE FUNCTION project_stats_on_project_insert();
+
+DROP TRIGGER IF EXISTS trg_project_stats_application_change ON Applications;
+CREATE TRIGGER trg_project_stats_application_change
+AFTER INSERT OR UPDATE OR DELETE ON Applications
+FOR EACH ROW EXECUTE FUNCTION project_stats_on_application_change();
+
+DROP TRIGGER IF EXISTS trg_project_stats_review_change ON Peer_Reviews;
+CREATE TRIGGER trg_project_stats_review_change
+AFTER INSERT OR DELETE ON Peer_Reviews
+FOR EACH ROW EXECUTE FUNCTION project_stats_on_review_change();
+
+-- 기존 프로젝트 백필 (이미 있는 행은 그대로 둠, 어긋난 값은 `python -m db.project_stats --repair`로 복구)
+INSERT INTO Project_Stats (project_id, accepted_members, pending_applications, reviews_written)
+SELECT project_id, accepted_members, pending_applications, reviews_written FROM ProjectStatsComputedView
+ON CONFLICT (project_id) DO NOTHING;
+
+
+-- 학생별 평판 (Student_Reputation): 프로필/지원자 목록은 리뷰 이력을 훑지 않고 이 행 하나만 읽는다.
+-- 리뷰가 하나도 없는 학생은 행이 없을 수 있다. (읽을 때 0으로 취급)
+CREATE OR REPLACE VIEW StudentReputationComputedView AS
+SELECT
+    reviewee_id AS uid,
+    COUNT(*)::int AS review_count,
+    SUM(score)::int AS score_sum,
+    COUNT(*) FILTER (WHERE score = 1)::int AS score_1,
+    COUNT(*) FILTER (WHERE score = 2)::int AS score_2,
+    COUNT(*) FILTER (WHERE score = 3)::int AS score_3,
+    COUNT(*) FILTER (WHERE score = 4)::int AS score_4,
+    COUNT(*) FILTER (WHERE score = 5)::int AS score_5
+FROM Peer_Reviews
+GROUP BY reviewee_id;
+
+CREATE OR REPLACE FUNCTION student_reputation_on_review_change() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.reviewee_id = NEW.reviewee_id AND OLD.score = NEW.score THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Student_Reputation
+        SET review_count = review_count - 1,
+            score_sum = score_sum - OLD.score,
+            score_1 = score_1 - (OLD.score = 1)::int,
+            score_2 = score_2 - (OLD.score = 2)::int,
+            score_3 = score_3 - (OLD.score = 3)::int,
+            score_4 = score_4 - (OLD.score = 4)::int,
+            score_5 = score_5 - (OLD.score = 5)::int,
+            row_version = row_version + 1
+        WHERE uid = OLD.reviewee_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO Student_Reputation AS r (uid, review_count, score_sum, score_1, score_2, score_3, score_4, score_5)
+        VALUES (NEW.reviewee_id, 1, NEW.score, (NEW.score = 1)::int, (NEW.score = 2)::int, (NEW.score = 3)::int,
+                (NEW.score = 4)::int, (NEW.score = 5)::int)
+        ON CONFLICT (uid) DO UPDATE
+        SET review_count = r.review_count + 1,
+            score_sum = r.score_sum + EXCLUDED.score_sum,
+            score_1 = r.score_1 + EXCLUDED.score_1,
+            score_2 = r.score_2 + EXCLUDED.score_2,
+            score_3 = r.score_3 + EXCLUDED.score_3,
+            score_4 = r.score_4 + EXCLUDED.score_4,
+            score_5 = r.score_5 + EXCLUDED.score_5,
+            row_version = r.row_version + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_student_reputation_review_change ON Peer_Reviews;
+CREATE TRIGGER trg_student_reputation_review_change
+AFTER INSERT OR UPDATE OR DELETE ON Peer_Reviews
+FOR EACH ROW EXECUTE FUNCTION student_reputation_on_review_change();
+
+-- 기존 리뷰 백필 (이미 있는 행은 그대로 둠, 어긋난 값은 `python -m db.project_stats --repair`로 복구)
+INSERT INTO Student_Reputation (uid, review_count, score_sum, score_1, score_2, score_3, score_4, score_5)
+SELECT uid, review_count, score_sum, score_1, score_2, score_3, score_4, score_5 FROM StudentReputationComputedView
+ON CONFLICT (uid) DO NOTHING;
+
+
+-- 조건부 GET(ETag)용 버전
+-- row_version: 행이 바뀔 때마다 1씩 증가 (상세/프로필 ETag)
+--   Projects는 요구 스킬/지원서 변경 시, Students는 보유 스킬 변경 시에도 증가한다.
+-- Entity_Versions: 테이블 단위 변경 카운터 (목록 ETag). 데이터와 같은 트랜잭션에서 증가하므로
+--   버전을 먼저 읽고 본문을 만들면 본문은 항상 그 버전 이후의 데이터다.
+--   한 행을 모든 쓰기가 갱신하면 동시 쓰기가 그 행 잠금에서 줄을 서므로, 엔티티마다 shard 행(백엔드 pid % 16)에
+--   나눠 올리고 읽을 때 합계(SUM)를 버전으로 쓴다. 카운터는 줄지 않으므로 합계도 바뀔 때마다 커진다.
+ALTER TABLE Projects ADD COLUMN IF NOT EXISTS row_version BIGINT NOT NULL DEFAULT 1;
+ALTER TABLE Students ADD COLUMN IF NOT EXISTS row_version BIGINT NOT NULL DEFAULT 1;
+ALTER TABLE Applications ADD COLUMN IF NOT EXISTS row_version BIGINT NOT NULL DEFAULT 1;
+
+-- 추천 인덱스(crud/recommender.py)용 변경 표시: 추천 대상 여부(상태/마감일/보관)나 요구 스킬을 마지막으로 바꾼 트랜잭션 id
+-- 인덱스는 마지막 확인 때 스냅샷의 xmin 이상인 행만 다시 읽는다. (그때 진행 중이던 트랜잭션의 변경도 빠지지 않음)
+-- 지원서 변경에 따른 부모 갱신은 이 값을 바꾸지 않으므로 HOT 갱신이 유지된다.
+ALTER TABLE Projects ADD COLUMN IF NOT EXISTS changed_xid xid8 NOT NULL DEFAULT pg_current_xact_id();
+CREATE INDEX IF NOT EXISTS idx_projects_changed_xid ON Projects(changed_xid);
+
+CREATE TABLE IF NOT EXISTS Entity_Versions (
+    entity VARCHAR(50) NOT NULL,
+    shard SMALLINT NOT NULL DEFAULT 0,
+    version BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (entity, shard)
+);
+
+-- 기존 DB: entity 단독 기본 키를 (entity, shard)로 변경
+ALTER TABLE Entity_Versions ADD COLUMN IF NOT EXISTS shard SMALLINT NOT NULL DEFAULT 0;
+DO $$
+BEGIN
+    IF (SELECT cardinality(conkey) FROM pg_constraint
+        WHERE conrelid = 'entity_versions'::regclass AND contype = 'p') = 1 THEN
+        ALTER TABLE Entity_Versions DROP CONSTRAINT entity_versions_pkey;
+        ALTER TABLE Entity_Versions ADD PRIMARY KEY (entity, shard);
+    END IF;
+END;
+$$;
+
+INSERT INTO Entity_Versions (entity) VALUES ('projects'), ('students'), ('applications'), ('reviews')
+ON CONFLICT (entity, shard) DO NOTHING;
+
+-- 엔티티 버전 1 증가 (현재 백엔드의 shard 행, 없으면 만듦)
+CREATE OR REPLACE FUNCTION increment_entity_version(target TEXT) RETURNS void
+LANGUAGE sql SECURITY DEFINER SET search_path = public AS $$
+    INSERT INTO Entity_Versions AS v (entity, shard, version)
+    VALUES (target, pg_backend_pid() % 16, 1)
+    ON CONFLICT (entity, shard) DO UPDATE SET version = v.version + 1;
+$$;
+
+CREATE OR REPLACE FUNCTION bump_row_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.row_version := OLD.row_version + 1;
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION stamp_project_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.changed_xid := pg_current_xact_id();
+    RETURN NEW;
+END;
+$$;
+
+-- 자식 테이블 변경 시 부모 행의 row_version 증가 (TG_ARGV[0]: 부모 테이블)
+-- 문장 단위 트리거로, 한 문장이 자식 행을 여러 개 바꿔도 부모 행은 한 번씩만 갱신한다.
+-- (changed_old/changed_new: 전이 테이블, 이벤트마다 트리거를 따로 둔다)
+-- 지원서 변경으로 수락된 멤버가 바뀌면 목록의 멤버 수와 내 프로젝트가 달라지므로 'projects' 버전도 올린다.
+-- 부모 행의 row_version만 바뀌는 갱신은 'projects'/'students' 버전을 올리지 않는다 (아래 UPDATE OF 참고).
+CREATE OR REPLACE FUNCTION bump_parent_row_version() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    member_changed BOOLEAN := false;
+    -- 요구 스킬이 바뀌면 추천 인덱스가 다시 읽도록 changed_xid도 갱신
+    skills_changed BOOLEAN := TG_TABLE_NAME = 'project_required_skills';
+BEGIN
+    IF TG_ARGV[0] = 'students' THEN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE Students SET row_version = row_version + 1 WHERE uid IN (SELECT uid FROM changed_new);
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE Students SET row_version = row_version + 1 WHERE uid IN (SELECT uid FROM changed_old);
+        ELSE
+            UPDATE Students SET row_version = row_version + 1
+            WHERE uid IN (SELECT uid FROM changed_old UNION SELECT uid FROM changed_new);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        UPDATE Projects
+        SET row_version = row_version + 1,
+            changed_xid = CASE WHEN skills_changed THEN pg_current_xact_id() ELSE changed_xid END
+        WHERE project_id IN (SELECT project_id FROM changed_new);
+        IF TG_TABLE_NAME = 'applications' THEN
+            member_changed := EXISTS (SELECT 1 FROM changed_new WHERE status = 'Accepted');
+        END IF;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE Projects
+        SET row_version = row_version + 1,
+            changed_xid = CASE WHEN skills_changed THEN pg_current_xact_id() ELSE changed_xid END
+        WHERE project_id IN (SELECT project_id FROM changed_old);
+        IF TG_TABLE_NAME = 'applications' THEN
+            member_changed := EXISTS (SELECT 1 FROM changed_old WHERE status = 'Accepted');
+        END IF;
+    ELSE
+        UPDATE Projects
+        SET row_version = row_version + 1,
+            changed_xid = CASE WHEN skills_changed THEN pg_current_xact_id() ELSE changed_xid END
+        WHERE project_id IN (SELECT project_id FROM changed_old UNION SELECT project_id FROM changed_new);
+        IF TG_TABLE_NAME = 'applications' THEN
+            member_changed := EXISTS (
+                SELECT 1 FROM changed_old o
+                JOIN changed_new n ON n.application_id = o.application_id
+                WHERE (o.status = 'Accepted') <> (n.status = 'Accepted')
+                   OR (n.status = 'Accepted' AND (o.project_id <> n.project_id OR o.applicant_id <> n.applicant_id))
+            );
+        END IF;
+    END IF;
+    IF member_changed THEN
+        PERFORM increment_entity_version('projects');
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION bump_entity_version() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    PERFORM increment_entity_version(TG_ARGV[0]);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_projects_row_version ON Projects;
+CREATE TRIGGER trg_projects_row_version
+BEFORE UPDATE ON Projects
+FOR EACH ROW EXECUTE FUNCTION bump_row_version();
+
+DROP TRIGGER IF EXISTS trg_projects_changed_xid ON Projects;
+CREATE TRIGGER trg_projects_changed_xid
+BEFORE UPDATE OF status, deadline, archived_at ON Projects
+FOR EACH ROW EXECUTE FUNCTION stamp_project_change();
+
+DROP TRIGGER IF EXISTS trg_students_row_version ON Students;
+CREATE TRIGGER trg_students_row_version
+BEFORE UPDATE ON Students
+FOR EACH ROW EXECUTE FUNCTION bump_row_version();
+
+DROP TRIGGER IF EXISTS trg_applications_row_version ON Applications;
+CREATE TRIGGER trg_applications_row_version
+BEFORE UPDATE ON Applications
+FOR EACH ROW EXECUTE FUNCTION bump_row_version();
+
+-- 이전의 행 단위 부모 버전 트리거 (문장 단위 트리거로 대체)
+DROP TRIGGER IF EXISTS trg_student_skills_parent_version ON Student_Skills;
+DROP TRIGGER IF EXISTS trg_project_required_skills_parent_version ON Project_Required_Skills;
+DROP TRIGGER IF EXISTS trg_applications_parent_version ON Applications;
+
+DROP TRIGGER IF EXISTS trg_student_skills_parent_version_ins ON Student_Skills;
+CREATE TRIGGER trg_student_skills_parent_version_ins
+AFTER INSERT ON Student_Skills
+REFERENCING NEW TABLE AS changed_new
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('students');
+
+DROP TRIGGER IF EXISTS trg_student_skills_parent_version_upd ON Student_Skills;
+CREATE TRIGGER trg_student_skills_parent_version_upd
+AFTER UPDATE ON Student_Skills
+REFERENCING OLD TABLE AS changed_old NEW TABLE AS changed_new
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('students');
+
+DROP TRIGGER IF EXISTS trg_student_skills_parent_version_del ON Student_Skills;
+CREATE TRIGGER trg_student_skills_parent_version_del
+AFTER DELETE ON Student_Skills
+REFERENCING OLD TABLE AS changed_old
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('students');
+
+DROP TRIGGER IF EXISTS trg_project_required_skills_parent_version_ins ON Project_Required_Skills;
+CREATE TRIGGER trg_project_required_skills_parent_version_ins
+AFTER INSERT ON Project_Required_Skills
+REFERENCING NEW TABLE AS changed_new
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('projects');
+
+DROP TRIGGER IF EXISTS trg_project_required_skills_parent_version_upd ON Project_Required_Skills;
+CREATE TRIGGER trg_project_required_skills_parent_version_upd
+AFTER UPDATE ON Project_Required_Skills
+REFERENCING OLD TABLE AS changed_old NEW TABLE AS changed_new
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('projects');
+
+DROP TRIGGER IF EXISTS trg_project_required_skills_parent_version_del ON Project_Required_Skills;
+CREATE TRIGGER trg_project_required_skills_parent_version_del
+AFTER DELETE ON Project_Required_Skills
+REFERENCING OLD TABLE AS changed_old
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('projects');
+
+DROP TRIGGER IF EXISTS trg_applications_parent_version_ins ON Applications;
+CREATE TRIGGER trg_applications_parent_version_ins
+AFTER INSERT ON Applications
+REFERENCING NEW TABLE AS changed_new
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('projects');
+
+DROP TRIGGER IF EXISTS trg_applications_parent_version_upd ON Applications;
+CREATE TRIGGER trg_applications_parent_version_upd
+AFTER UPDATE ON Applications
+REFERENCING OLD TABLE AS changed_old NEW TABLE AS changed_new
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('projects');
+
+DROP TRIGGER IF EXISTS trg_applications_parent_version_del ON Applications;
+CREATE TRIGGER trg_applications_parent_version_del
+AFTER DELETE ON Applications
+REFERENCING OLD TABLE AS changed_old
+FOR EACH STATEMENT EXECUTE FUNCTION bump_parent_row_version('projects');
+
+-- row_version(부모 버전 갱신)이나 hashed_password(로그인 시 재해시)만 바뀌는 UPDATE는 목록 버전을 올리지 않음
+DROP TRIGGER IF EXISTS trg_entity_version_projects ON Projects;
+CREATE TRIGGER trg_entity_version_projects
+AFTER INSERT OR DELETE OR UPDATE OF leader_id, topic, description1, description2, capacity, deadline, status, archived_at
+ON Projects
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version('projects');
+
+DROP TRIGGER IF EXISTS trg_entity_version_project_required_skills ON Project_Required_Skills;
+CREATE TRIGGER trg_entity_version_project_required_skills
+AFTER INSERT OR UPDATE OR DELETE ON Project_Required_Skills
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version('projects');
+
+DROP TRIGGER IF EXISTS trg_entity_version_students ON Students;
+CREATE TRIGGER trg_entity_version_students
+AFTER INSERT OR DELETE OR UPDATE OF uid, name, email, profile_text, website_link
+ON Students
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version('students');
+
+DROP TRIGGER IF EXISTS trg_entity_version_student_skills ON Student_Skills;
+CREATE TRIGGER trg_entity_version_student_skills
+AFTER INSERT OR UPDATE OR DELETE ON Student_Skills
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version('students');
+
+DROP TRIGGER IF EXISTS trg_entity_version_applications ON Applications;
+CREATE TRIGGER trg_entity_version_applications
+AFTER INSERT OR UPDATE OR DELETE ON Applications
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version('applications');
+
+DROP TRIGGER IF EXISTS trg_entity_version_peer_reviews ON Peer_Reviews;
+CREATE TRIGGER trg_entity_version_peer_reviews
+AFTER INSERT OR UPDATE OR DELETE ON Peer_Reviews
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version('reviews');
+
+
+-- 마감/완료 프로젝트 보관 (crud/project_archive.py의 스위퍼가 주기적으로 호출)
+-- 마감일이 지난 모집글과 마감일이 completed_days일 넘게 지난 완료 프로젝트를 batch_size개씩 보관하고
+-- 그 프로젝트의 지원서도 함께 보관한다. 보관한 project_id 배열을 반환 (없으면 빈 배열)
+-- 완료 시각 열이 없으므로 "오래전에 완료"는 마감일 기준으로 판단한다.
+-- 앱 역할에는 archived_at 쓰기 권한이 없으므로 소유자(관리자) 권한으로 실행한다.
+CREATE OR REPLACE FUNCTION archive_expired_projects(completed_days INTEGER, batch_size INTEGER DEFAULT 1000)
+RETURNS INTEGER[]
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    archived_ids INTEGER[];
+BEGIN
+    WITH targets AS (
+        SELECT project_id FROM Projects
+        WHERE archived_at IS NULL
+          AND ((status = 'Recruiting' AND deadline < CURRENT_DATE)
+            OR (status = 'Completed' AND deadline < CURRENT_DATE - completed_days))
+        ORDER BY project_id
+        LIMIT batch_size
+        -- 여러 워커가 동시에 돌아도 같은 행을 기다리지 않고 나눠 처리
+        FOR UPDATE SKIP LOCKED
+    ),
+    archived AS (
+        UPDATE Projects p SET archived_at = now()
+        FROM targets t
+        WHERE p.project_id = t.project_id
+        RETURNING p.project_id
+    )
+    SELECT COALESCE(array_agg(project_id ORDER BY project_id), ARRAY[]::integer[]) INTO archived_ids FROM archived;
+
+    IF cardinality(archived_ids) > 0 THEN
+        UPDATE Applications SET archived_at = now()
+        WHERE project_id = ANY(archived_ids) AND archived_at IS NULL;
+    END IF;
+    RETURN archived_ids;
+END;
+$$;
+
+-- 보관된 프로젝트의 상태를 리더가 바꾸면(예: 마감된 모집글을 진행 중으로) 다시 목록 대상(live)으로 되돌림
+CREATE OR REPLACE FUNCTION unarchive_project_on_status_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.archived_at := NULL;
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION unarchive_project_applications() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    UPDATE Applications SET archived_at = NULL WHERE project_id = NEW.project_id AND archived_at IS NOT NULL;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_projects_unarchive ON Projects;
+CREATE TRIGGER trg_projects_unarchive
+BEFORE UPDATE ON Projects
+FOR EACH ROW
+WHEN (OLD.archived_at IS NOT NULL AND OLD.status IS DISTINCT FROM NEW.status)
+EXECUTE FUNCTION unarchive_project_on_status_change();
+
+DROP TRIGGER IF EXISTS trg_projects_unarchive_applications ON Projects;
+CREATE TRIGGER trg_projects_unarchive_applications
+AFTER UPDATE ON Projects
+FOR EACH ROW
+WHEN (OLD.archived_at IS NOT NULL AND NEW.archived_at IS NULL)
+EXECUTE FUNCTION unarchive_project_applications();
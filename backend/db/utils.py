@@ -1,17 +1,143 @@
-# 비밀번호 해싱 
+# 비밀번호 해싱
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import bcrypt
+from dotenv import load_dotenv
 
-def hash_password(password: str) -> str:
-    # bcrypt는 72자(문자)까지만 지원하므로 초과 시 잘라서 해시
-    # 문자열을 바이트로 인코딩
-    pwd_bytes = password[:72].encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(pwd_bytes, salt)
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+# bcrypt cost factor (바꾸면 기존 해시는 다음 로그인 때 새 cost로 재해싱됨)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# 해싱 전용 실행기 설정
+# - HASH_EXECUTOR: process(코어 수만큼 병렬) / thread
+# - HASH_WORKERS: 실행기 워커 수
+# - HASH_MAX_CONCURRENCY: 동시에 실행기에 넘기는 해싱 작업 수 (초과분은 대기열에서 기다림)
+HASH_EXECUTOR = os.getenv("HASH_EXECUTOR", "process").lower()
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", str(os.cpu_count() or 1)))
+HASH_MAX_CONCURRENCY = int(os.getenv("HASH_MAX_CONCURRENCY", str(HASH_WORKERS * 2)))
+
+
+def _encode(password: str) -> bytes:
+    # bcrypt는 72바이트까지만 사용하므로 초과분은 잘라서 사용
+    return password.encode('utf-8')[:72]
+
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    salt = bcrypt.gensalt(rounds=rounds)
+    hashed = bcrypt.hashpw(_encode(password), salt)
     # DB 저장을 위해 문자열로 디코딩하여 반환
     return hashed.decode('utf-8')
 
 def verify_password(plain: str, hashed: str) -> bool:
     # 검증을 위해 바이트로 변환
-    pwd_bytes = plain.encode('utf-8')
-    hashed_bytes = hashed.encode('utf-8')
-    return bcrypt.checkpw(pwd_bytes, hashed_bytes)
+    return bcrypt.checkpw(_encode(plain), hashed.encode('utf-8'))
+
+def needs_rehash(hashed: str, rounds: int = BCRYPT_ROUNDS) -> bool:
+    """
+    저장된 해시의 cost factor가 현재 설정과 다른지 확인 ($2b$12$... 형식)
+    """
+    try:
+        return int(hashed.split("$")[2]) != rounds
+    except (IndexError, ValueError):
+        return True
+
+
+# 해싱 실행기 상태
+_executor: Executor | None = None
+_semaphore: asyncio.Semaphore | None = None
+_stats = {
+    "in_flight": 0,
+    "waiting": 0,
+    "max_waiting": 0,
+    "completed": 0,
+    "total_wait_ms": 0.0,
+    "total_run_ms": 0.0,
+}
+
+
+def start_hash_executor() -> None:
+    """
+    해싱 실행기 시작 (main.lifespan에서 호출)
+    프로세스 풀은 미리 워커를 띄워 첫 로그인 요청이 프로세스 생성 비용을 내지 않도록 한다.
+    """
+    global _executor
+    if _executor is not None:
+        return
+    if HASH_EXECUTOR == "thread":
+        _executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="hash")
+    else:
+        _executor = ProcessPoolExecutor(max_workers=HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        for future in [_executor.submit(needs_rehash, "") for _ in range(HASH_WORKERS)]:
+            future.result()
+
+
+def shutdown_hash_executor() -> None:
+    global _executor, _semaphore
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+    _executor = None
+    _semaphore = None
+
+
+async def _run_in_hash_executor(fn, *args):
+    global _semaphore
+    if _executor is None:
+        start_hash_executor()
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(HASH_MAX_CONCURRENCY)
+
+    queued_at = time.perf_counter()
+    _stats["waiting"] += 1
+    _stats["max_waiting"] = max(_stats["max_waiting"], _stats["waiting"])
+    try:
+        await _semaphore.acquire()
+    finally:
+        _stats["waiting"] -= 1
+
+    started_at = time.perf_counter()
+    _stats["in_flight"] += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+    finally:
+        _semaphore.release()
+        _stats["in_flight"] -= 1
+        _stats["completed"] += 1
+        _stats["total_wait_ms"] += (started_at - queued_at) * 1000
+        _stats["total_run_ms"] += (time.perf_counter() - started_at) * 1000
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    이벤트 루프/요청 스레드를 막지 않고 해싱 실행기에서 해싱
+    """
+    return await _run_in_hash_executor(hash_password, password, BCRYPT_ROUNDS)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """
+    이벤트 루프/요청 스레드를 막지 않고 해싱 실행기에서 검증
+    """
+    return await _run_in_hash_executor(verify_password, plain, hashed)
+
+
+def hash_executor_stats() -> dict:
+    """
+    해싱 실행기 대기열/처리 현황
+    """
+    completed = _stats["completed"]
+    return {
+        "executor": HASH_EXECUTOR,
+        "workers": HASH_WORKERS,
+        "max_concurrency": HASH_MAX_CONCURRENCY,
+        "bcrypt_rounds": BCRYPT_ROUNDS,
+        "in_flight": _stats["in_flight"],
+        "queue_depth": _stats["waiting"],
+        "max_queue_depth": _stats["max_waiting"],
+        "completed": completed,
+        "avg_wait_ms": _stats["total_wait_ms"] / completed if completed else 0.0,
+        "avg_run_ms": _stats["total_run_ms"] / completed if completed else 0.0,
+    }
@@ -5,12 +5,34 @@ from api.v1.endpoints.auth import router as auth_router
 from api.v1.endpoints.profile import router as profile_router
 from api.v1.endpoints.projects import router as projects_router
 from api.v1.endpoints.applications import router as applications_router
+from api.v1.endpoints.system import router as system_router
+from api.v1.endpoints.metrics import router as metrics_router
+from api.middleware import MetricsMiddleware
+from api.query_budget import QUERY_BUDGET_MODE, QueryBudgetMiddleware
 from db.init_db import init_db
+from db.utils import start_hash_executor, shutdown_hash_executor
+from db.pool import DB_POOL_WARMUP
+from db.metrics import METRICS_ENABLED
+from db.session import async_engine, warm_pool, warm_async_pool
+from crud.crud_skills import warm_skill_dictionary
+from crud.recommender import warm_project_recommender
+from crud.project_archive import start_project_archiver, stop_project_archiver
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    warm_skill_dictionary()
+    warm_project_recommender()
+    start_hash_executor()
+    if DB_POOL_WARMUP:
+        if async_engine is not None:
+            await warm_async_pool()
+        else:
+            warm_pool()
+    start_project_archiver()
     yield
+    stop_project_archiver()
+    shutdown_hash_executor()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -27,3 +49,13 @@ app.include_router(auth_router)
 app.include_router(profile_router)
 app.include_router(projects_router)
 app.include_router(applications_router)
+app.include_router(system_router)
+
+# 요청 단위 SQL 계측과 /metrics (METRICS_ENABLED=1 일 때만, 꺼져 있으면 오버헤드 없음)
+if METRICS_ENABLED:
+	app.add_middleware(MetricsMiddleware)
+	app.include_router(metrics_router)
+
+# 엔드포인트별 SQL 문 수 예산 검사 (QUERY_BUDGET_MODE=warn/strict 일 때만, api/query_budget.py)
+if QUERY_BUDGET_MODE != "off":
+	app.add_middleware(QueryBudgetMiddleware)
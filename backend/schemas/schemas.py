@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from enum import Enum
 from datetime import date
 
@@ -29,6 +29,9 @@ class ProfileInfoResponse(BaseModel):
     profile_text: str = ""
     website_link: str = ""
     skills: list[str] = []
+    review_count: int = 0
+    avg_score: float | None = None
+    score_histogram: list[int] = [0, 0, 0, 0, 0]  # 점수 1~5별 받은 리뷰 수
 
 class ProfileUpdateRequest(BaseModel):
     uid: str
@@ -50,6 +53,12 @@ class ProjectCreateRequest(BaseModel):
 class OrderBy(str, Enum):
     deadline = "deadline"
     capacity = "capacity"
+    relevance = "relevance"
+
+class SearchMode(str, Enum):
+    contains = "contains"
+    fulltext = "fulltext"
+    prefix = "prefix"
 
 class GroupBy(str, Enum):
     All = "All"
@@ -61,6 +70,9 @@ class ProjectListRequest(BaseModel):
     orderBy: OrderBy = OrderBy.deadline
     groupBy: GroupBy = GroupBy.All
     search: str = ""
+    searchMode: SearchMode = SearchMode.contains
+    limit: int | None = Field(default=None, ge=1, le=100)
+    after: str | None = None
 
 class ProjectListItem(BaseModel):
     project_id: int
@@ -73,9 +85,18 @@ class ProjectListItem(BaseModel):
     status: str
     leader_name: str
     skills: list[str] = []
+    search_rank: float | None = None
 
 class ProjectListResponse(BaseModel):
     projects: list[ProjectListItem]
+    next_cursor: str | None = None
+
+class RecommendedProjectItem(ProjectListItem):
+    score: float
+    matched_skills: list[str] = []
+
+class RecommendedProjectsResponse(BaseModel):
+    projects: list[RecommendedProjectItem]
 
 class ProjectDetailsResponse(BaseModel):
     project_id: int
@@ -87,6 +108,7 @@ class ProjectDetailsResponse(BaseModel):
     capacity: int
     deadline: date
     status: str
+    archived: bool = False  # 보관된(목록에서 빠진) 프로젝트
     skills: list[str] = []
     can_apply: bool
     members: list[dict] = []
@@ -110,6 +132,7 @@ class MyApplicationsItem(BaseModel):
 
 class MyApplicationsResponse(BaseModel):
     applications: list[MyApplicationsItem]
+    next_cursor: str | None = None
 
 class ApplicationsManagementItem(BaseModel):
     leader_id: str
@@ -125,6 +148,22 @@ class ApplicationsManagementItem(BaseModel):
     status: str
     applicant_skills: list[str] = []
     applicant_reviews: list[dict] = []
+    applicant_review_count: int = 0
+    applicant_avg_score: float | None = None
+    applicant_score_histogram: list[int] = [0, 0, 0, 0, 0]
+    applicant_reputation_score: float = 0.5
+    # order=score일 때만 채워짐
+    applicant_rank_score: float | None = None
+    applicant_skill_coverage: float | None = None
+
+class ReviewsMode(str, Enum):
+    all = "all"
+    stats = "stats"
+    recent = "recent"
+
+class ApplicantOrder(str, Enum):
+    date = "date"
+    score = "score"
 
 class ApplicationsManagementResponse(BaseModel):
     applications: list[ApplicationsManagementItem]
@@ -138,6 +177,29 @@ class ApplicationStatusUpdateRequest(BaseModel):
     new_status: newStatus = newStatus.Pending
     leader_id: str
 
+class ApplicationsAcceptRequest(BaseModel):
+    leader_id: str
+    applicant_ids: list[str] = Field(min_length=1, max_length=500)
+
+class TeamFormationAssignment(BaseModel):
+    application_id: int
+    project_id: int
+    applicant_id: str
+    skill_coverage: float
+
+class TeamFormationSummary(BaseModel):
+    pending_applications: int
+    applicants: int
+    projects: int
+    open_seats: int
+    assigned: int
+    avg_skill_coverage: float
+    elapsed_ms: float
+
+class TeamFormationResponse(BaseModel):
+    assignments: list[TeamFormationAssignment]
+    summary: TeamFormationSummary
+
 class MyProjectListItem(BaseModel):
     project_id: int
     leader_id: str
@@ -149,6 +211,7 @@ class MyProjectListItem(BaseModel):
 
 class MyProjectListResponse(BaseModel):
     projects: list[MyProjectListItem]
+    next_cursor: str | None = None
 
 class newProjectStatus(str, Enum):
     Recruiting = "Recruiting"
@@ -181,4 +244,45 @@ class ReviewStatusResponse(BaseModel):
     members: list[ReviewStatusMember] = []
     completed: list[str] = []
     remaining: list[str] = []
-    can_review: bool = False
\ No newline at end of file
+    can_review: bool = False
+
+
+class CacheStatsResponse(BaseModel):
+    enabled: bool
+    size: int
+    maxsize: int
+    ttl: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    invalidations: int
+
+class HashingStatsResponse(BaseModel):
+    executor: str
+    workers: int
+    max_concurrency: int
+    bcrypt_rounds: int
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    completed: int
+    avg_wait_ms: float
+    avg_run_ms: float
+
+class PoolStatsResponse(BaseModel):
+    db_mode: str
+    pool_size: int
+    max_overflow: int
+    timeout: float
+    recycle: int
+    pre_ping: bool
+    connections: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    checkout_histogram: dict[str, int]